@@ -20,6 +20,8 @@ class ChData(sys_data.SysData):
     The ChData class stores a specific channel telemetry reading.
     """
 
+    __slots__ = ("val_obj", "pkt", "_display_text")
+
     def __init__(self, ch_val_obj, ch_time, ch_temp):
         """
         Constructor.
@@ -40,7 +42,6 @@ class ChData(sys_data.SysData):
         self.time = ch_time
         self.template = ch_temp
         self.pkt = None
-        self.display_text = self._compute_display_text(ch_val_obj, ch_temp)
 
     @staticmethod
     def get_empty_obj(ch_temp):
@@ -55,10 +56,21 @@ class ChData(sys_data.SysData):
         """
         return ChData(None, time_type.TimeType(), ch_temp)
 
+    @property
+    def display_text(self):
+        """
+        Display text of the channel, computed on first access as most readings are never displayed
+        """
+        try:
+            return self._display_text
+        except AttributeError:
+            self._display_text = self._compute_display_text(self.val_obj, self.template)
+            return self._display_text
+
     def _compute_display_text(self, val_obj, template):
         """
-        Returns the display_text for the channel by computing it. This function is defined so as not to clutter __init__()
-        but should not be called elsewhere. Use get_display_text() instead.
+        Returns the display_text for the channel by computing it. This function is defined so as not to clutter the
+        display_text property but should not be called elsewhere. Use get_display_text() instead.
         Does not depend on self state so as not to be dependent on the order of initialization.
         """
         # This can happen when constructing empty objects (e.g. when listing channels)
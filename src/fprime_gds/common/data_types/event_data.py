@@ -18,6 +18,8 @@ class EventData(sys_data.SysData):
     The EventData class stores a specific event message.
     """
 
+    __slots__ = ("args", "_display_text")
+
     def __init__(self, event_args, event_time, event_temp):
         """
         Constructor.
@@ -40,20 +42,36 @@ class EventData(sys_data.SysData):
         self.args = event_args
         self.time = event_time
         self.template = event_temp
-        if event_args is None:
-            self.display_text = event_temp.description
-        elif event_temp.format_str == "":
+
+    @property
+    def display_text(self):
+        """
+        Display text of the event, computed on first access as most events are never displayed
+        """
+        try:
+            return self._display_text
+        except AttributeError:
+            self._display_text = self._compute_display_text()
+            return self._display_text
+
+    def _compute_display_text(self):
+        """
+        Returns the display_text for the event by computing it: the event's format string filled with its arguments.
+        Use get_display_text() instead.
+        """
+        if self.args is None:
+            return self.template.description
+        if self.template.format_str == "":
             args_template = self.template.get_args()
-            self.display_text = str(
+            return str(
                 [
                     {args_template[index][0]: arg.val}
-                    for index, arg in enumerate(event_args)
+                    for index, arg in enumerate(self.args)
                 ]
             )
-        else:
-            self.display_text = format_string_template(
-                event_temp.format_str, tuple([arg.val for arg in event_args])
-            )
+        return format_string_template(
+            self.template.format_str, tuple([arg.val for arg in self.args])
+        )
 
     def get_args(self):
         return self.args
@@ -22,6 +22,8 @@ class SysData:
     for specific data readings/events
     """
 
+    __slots__ = ("id", "template", "time")
+
     def __init__(self):
         """
         Constructor.
@@ -77,4 +79,4 @@ class SysData:
         # Compare by time first
         time_comp = time_type.TimeType.compare(x.time, y.time)
 
-        return time_comp if time_comp != 0 else time_type.TimeType.compare(x.id, y.id)
+        return time_comp if time_comp != 0 else (x.id > y.id) - (x.id < y.id)
@@ -17,6 +17,9 @@ Example data that would be sent to a decoder that parses channels:
 @bug No known bugs
 """
 
+import struct
+
+from fprime_gds.common.models.serialize.numerical_types import NumericalType
 from fprime_gds.common.models.serialize.time_type import TimeType
 
 from fprime_gds.common.data_types.ch_data import ChData
@@ -42,6 +45,44 @@ class ChDecoder(Decoder):
 
         self.__dict = ch_dict
         self.id_obj = ConfigManager().get_type("FwChanIdType")()
+        self.__id_struct = struct.Struct(self.id_obj.get_serialize_format())
+        self.__time_size = TimeType.getMaxSize()
+        # Precompiled decoders for fixed-size channels, keyed by channel ID
+        self.__compiled = {}
+        for ch_id, ch_temp in ch_dict.items():
+            compiled = self.compile_ch_decoder(ch_temp)
+            if compiled is not None:
+                self.__compiled[ch_id] = compiled
+
+    @staticmethod
+    def compile_ch_decoder(template):
+        """
+        Compiles a single struct covering the ID, time tag and value of the given channel
+
+        Only channels of fixed-size numeric types can be compiled. Strings, arrays, serializables, etc. must be
+        decoded through the generic path of decode_ch_val.
+
+        Args:
+            template: Channel Template object for the channel
+
+        Returns:
+            struct.Struct unpacking (id, time base, time context, seconds, useconds, value) or None if the channel
+            cannot be compiled
+        """
+        type_class = template.get_type_obj()
+        if not issubclass(type_class, NumericalType):
+            return None
+        return struct.Struct(
+            ">"
+            + "".join(
+                field_format.lstrip(">")
+                for field_format in (
+                    ConfigManager().get_type("FwChanIdType").get_serialize_format(),
+                    TimeType.get_serialize_format(),
+                    type_class.get_serialize_format(),
+                )
+            )
+        )
 
     def decode_api(self, data):
         """
@@ -65,14 +106,40 @@ class ChDecoder(Decoder):
         while ptr < len(data):
 
             # Decode Ch ID here...
-            self.id_obj.deserialize(data, ptr)
-            ptr += self.id_obj.getSize()
-            ch_id = self.id_obj.val
+            try:
+                ch_id = self.__id_struct.unpack_from(data, ptr)[0]
+            except struct.error as exc:
+                msg = f"Channel id failed to decode: {exc}"
+                raise DecodingException(msg)
+
+            # Fast path: fixed-size channels decode ID, time and value in one call
+            compiled = self.__compiled.get(ch_id, None)
+            if compiled is not None:
+                ch_temp = self.__dict[ch_id]
+                try:
+                    _, base, context, seconds, useconds, val = compiled.unpack_from(
+                        data, ptr
+                    )
+                except struct.error as exc:
+                    msg = f"Channel {ch_temp.name} failed to decode: {exc}"
+                    raise DecodingException(msg)
+                # Decoded values are in range by construction, skip the validating setter
+                val_obj = ch_temp.ch_type_obj()
+                val_obj._val = val
+                ch_list.append(
+                    ChData(
+                        val_obj,
+                        TimeType.from_fields(base, context, seconds, useconds),
+                        ch_temp,
+                    )
+                )
+                ptr += compiled.size
+                continue
+            ptr += self.__id_struct.size
 
             # Decode time...
-            ch_time = TimeType()
-            ch_time.deserialize(data, ptr)
-            ptr += ch_time.getSize()
+            ch_time = TimeType.from_buffer(data, ptr)
+            ptr += self.__time_size
 
             if ch_id not in self.__dict:
                 msg = f"Channel {ch_id} not found in dictionary"
@@ -86,7 +153,8 @@ class ChDecoder(Decoder):
                 msg = f"Channel {ch_temp.name} failed to decode: {exc}"
                 raise DecodingException(msg)
             ch_list.append(ChData(val_obj, ch_time, ch_temp))
-            ptr += val_obj.getSize()
+            size = ch_temp.get_type_obj().FIXED_SIZE
+            ptr += val_obj.getSize() if size is None else size
         return ch_list
 
     @staticmethod
@@ -4,7 +4,10 @@
 Decoders are responsible for taking in serialized data and parsing it into
 objects. Decoders receive serialized data (that had a specific descriptor) from
 a distributer that it has been registered to. The distributer will send the
-binary data after removing any length and descriptor headers.
+binary data after removing any length and descriptor headers. The data may be
+any bytes-like object and is typically a memoryview into the distributor's
+receive buffer, so decoders must not modify it and should copy out only the
+bytes that need owned storage.
 
 Example data that would be sent to a decoder that parses events or channels:
     +-------------------+---------------------+------------ - - -
@@ -72,6 +75,6 @@ class Decoder(
         This function allows for non-registered code to call the same decoding
         code as is used to parse data passed to the data_callback function.
 
-        :param data: binary data to decode
+        :param data: binary data to decode (bytes, bytearray, or memoryview)
         :return: decoded data object
         """
@@ -47,6 +47,8 @@ class EventDecoder(decoder.Decoder):
         self.__dict = event_dict
         FwEventIdType = ConfigManager().get_type("FwEventIdType")
         self.id_obj = FwEventIdType()
+        self.__id_size = FwEventIdType.FIXED_SIZE
+        self.__time_size = time_type.TimeType.getMaxSize()
 
     def decode_api(self, data):
         """
@@ -69,18 +71,17 @@ class EventDecoder(decoder.Decoder):
         while ptr < len(data):
 
             # Decode event ID here...
-            if ptr + self.id_obj.getSize() <= len(data):
+            if ptr + self.__id_size <= len(data):
                 self.id_obj.deserialize(data, ptr)
             else:
                 LOGGER.warning("Insufficient data for event ID")
                 break
-            ptr += self.id_obj.getSize()
+            ptr += self.__id_size
             event_id = self.id_obj.val
 
             # Decode time...
-            event_time = time_type.TimeType()
-            event_time.deserialize(data, ptr)
-            ptr += event_time.getSize()
+            event_time = time_type.TimeType.from_buffer(data, ptr)
+            ptr += self.__time_size
 
             if event_id not in self.__dict:
                 msg = f"Event {event_id} not found in dictionary"
@@ -131,6 +132,6 @@ class EventDecoder(decoder.Decoder):
                 msg = f"Event argument decoding failed {e.getMsg()}"
                 raise DecodingException(msg)
 
-            offset = offset + arg_obj.getSize()
+            offset += arg_obj.getSize() if arg_type.FIXED_SIZE is None else arg_type.FIXED_SIZE
 
         return [offset, tuple(arg_results)]
@@ -46,15 +46,16 @@ class FileDecoder(decoder.Decoder):
         # Packet Type determines the variables following the seqID
         if packetType == "START":  # Packet Type is START
             fileSize, sourcePathSize = struct.unpack_from(">IB", data, 5)
-            sourcePath = data[10 : sourcePathSize + 10]
+            sourcePath = bytes(data[10 : sourcePathSize + 10])
             (destPathSize,) = struct.unpack_from(">B", data, sourcePathSize + 10)
-            destPath = data[sourcePathSize + 11 : sourcePathSize + destPathSize + 11]
+            destPath = bytes(data[sourcePathSize + 11 : sourcePathSize + destPathSize + 11])
             return [
                 file_data.StartPacketData(seqID, fileSize, sourcePath, destPath),
             ]
         if packetType == "DATA":  # Packet Type is DATA
             offset, length = struct.unpack_from(">IH", data, 5)
-            dataVar = data[11 : 11 + length]
+            # File data is copied out of the message, such that retained packets do not pin the receive buffer
+            dataVar = bytes(data[11 : 11 + length])
             return [
                 file_data.DataPacketData(seqID, offset, dataVar),
             ]
@@ -17,10 +17,16 @@ Example data that would be sent to a decoder that parses events or channels:
 @bug No known bugs
 """
 
+import struct
+from collections.abc import Sequence
+
+from fprime_gds.common.models.serialize.numerical_types import NumericalType
 from fprime_gds.common.models.serialize.time_type import TimeType
+from fprime_gds.common.models.serialize.type_exceptions import TypeException
 
 from fprime_gds.common.data_types.ch_data import ChData
 from fprime_gds.common.decoders.ch_decoder import ChDecoder
+from fprime_gds.common.decoders.decoder import DecodingException
 from fprime_gds.common.utils.config_manager import ConfigManager
 
 
@@ -44,6 +50,52 @@ class PktDecoder(ChDecoder):
 
         self.__dict = pkt_name_dict
         self.id_obj = ConfigManager().get_type("FwTlmPacketizeIdType")()
+        self.__id_struct = struct.Struct(self.id_obj.get_serialize_format())
+        # Precompiled layouts, keyed by packet ID
+        self.__layouts = {
+            pkt_id: self.compile_pkt_layout(pkt_temp)
+            for pkt_id, pkt_temp in pkt_name_dict.items()
+        }
+
+    @staticmethod
+    def compile_pkt_layout(pkt_temp):
+        """
+        Compiles the fixed layout of the given packet definition
+
+        Each channel in a packet occupies its maximum serialized size, so the offset of every channel is fixed for a
+        given packet ID. The packet ID, time tag and all numeric channels are gathered into a single struct where other
+        channels are skipped as padding. Those other channels are decoded through the generic path at their offset.
+
+        Args:
+            pkt_temp: Packet Template object for the packet
+
+        Returns:
+            tuple of struct.Struct unpacking (id, time base, time context, seconds, useconds, numeric values...) and a
+            list of (channel template, index in unpacked values or None, offset in packet) in packet order
+        """
+        fields = [
+            ConfigManager().get_type("FwTlmPacketizeIdType").get_serialize_format(),
+            TimeType.get_serialize_format(),
+        ]
+        offset = struct.calcsize(">" + "".join(field.lstrip(">") for field in fields))
+        index = 5  # Values follow the id and 4 time fields
+        channels = []
+        for ch_temp in pkt_temp.get_ch_list():
+            type_class = ch_temp.get_type_obj()
+            # Variable-size channels still occupy their maximum size within a packet
+            size = type_class.getMaxSize() if type_class.FIXED_SIZE is None else type_class.FIXED_SIZE
+            if issubclass(type_class, NumericalType):
+                fields.append(type_class.get_serialize_format())
+                channels.append((ch_temp, index, offset))
+                index += 1
+            else:
+                fields.append(f"{size}x")
+                channels.append((ch_temp, None, offset))
+            offset += size
+        return (
+            struct.Struct(">" + "".join(field.lstrip(">") for field in fields)),
+            channels,
+        )
 
     def decode_api(self, data):
         """
@@ -56,42 +108,93 @@ class PktDecoder(ChDecoder):
             data: (bytearray) Binary packetized telemetry data to decode
 
         Returns:
-            Parsed version of the input data in the form of a PktData object
-            or None if the data is not decodable
+            Sequence of the ChData objects of the packet channels, built on access, or None if the packet id is not in
+            the dictionary
         """
-        ptr = 0
-
         # Decode Pkt ID here...
-        self.id_obj.deserialize(data, ptr)
-        ptr += self.id_obj.getSize()
-        pkt_id = self.id_obj.val
-
-        # Decode time...
-        pkt_time = TimeType()
-        pkt_time.deserialize(data, ptr)
-        ptr += pkt_time.getSize()
+        try:
+            pkt_id = self.__id_struct.unpack_from(data, 0)[0]
+        except struct.error as exc:
+            msg = f"Packet id failed to decode: {exc}"
+            raise DecodingException(msg)
 
         if pkt_id not in self.__dict:
             # Don't crash if can't find pkt. Just notify and keep going
+            pkt_time = TimeType.from_buffer(data, self.__id_struct.size)
             print(
                 "Packet decode error: id %d not in dictionary. Time=%s"
                 % (pkt_id, pkt_time.to_readable())
             )
             print("Full pkt = \n")
             for i in data:
-                print("0x%02x" % ord(i))
+                print("0x%02x" % i)
 
             return None
 
         # Retrieve the template instance for this channel
         pkt_temp = self.__dict[pkt_id]
+        layout, channels = self.__layouts[pkt_id]
+
+        # Decode id, time and all numeric channel values at once
+        try:
+            values = layout.unpack_from(data, 0)
+        except struct.error as exc:
+            msg = f"Packet {pkt_temp.name} failed to decode: {exc}"
+            raise DecodingException(msg)
+        pkt_time = TimeType.from_fields(*values[1:5])
+
+        # Other channels are decoded now such that their decoding errors fail the packet as a whole
+        try:
+            decoded = {
+                position: self.decode_ch_val(data, offset, ch_temp)
+                for position, (ch_temp, index, offset) in enumerate(channels)
+                if index is None
+            }
+        except TypeException as exc:
+            msg = f"Packet {pkt_temp.name} failed to decode: {exc}"
+            raise DecodingException(msg)
+        return PktChannels(channels, values, pkt_time, decoded)
+
+
+class PktChannels(Sequence):
+    """
+    Channels of a decoded packet. Numeric channels are kept as their unpacked values, and their ChData objects are
+    built on first access (e.g. as the decoder sends each channel to its consumers).
+    """
+
+    __slots__ = ("__channels", "__values", "__time", "__decoded", "__items")
+
+    def __init__(self, channels, values, pkt_time, decoded):
+        """
+        Constructor
 
-        ch_temps = pkt_temp.get_ch_list()
-
-        ch_data_objs = []
-        for ch_temp in ch_temps:
-            val_obj = self.decode_ch_val(data, ptr, ch_temp)
-            ptr += val_obj.getMaxSize()
-            ch_data_objs.append(ChData(val_obj, pkt_time, ch_temp))
-
-        return ch_data_objs
+        Args:
+            channels: list of (channel template, index in values or None, offset in packet) as compiled by PktDecoder
+            values: values unpacked by the packet layout
+            pkt_time: time of the packet
+            decoded: dictionary of channel position to value object of the channels not in values
+        """
+        self.__channels = channels
+        self.__values = values
+        self.__time = pkt_time
+        self.__decoded = decoded
+        self.__items = [None] * len(channels)
+
+    def __len__(self):
+        return len(self.__channels)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[index] for index in range(*position.indices(len(self)))]
+        position = range(len(self))[position]
+        item = self.__items[position]
+        if item is None:
+            ch_temp, index, _ = self.__channels[position]
+            if index is None:
+                val_obj = self.__decoded[position]
+            else:
+                # Decoded values are in range by construction, skip the validating setter
+                val_obj = ch_temp.ch_type_obj()
+                val_obj._val = self.__values[index]
+            item = self.__items[position] = ChData(val_obj, self.__time, ch_temp)
+        return item
@@ -82,40 +82,66 @@ class Distributor(DataHandler):
             Where leftover_data is a bytearray of anything at the end of data
             that could not be parsed (due to insufficient length).
         """
-        data_left = data
-
-        raw_msgs = []
-        # Keep parsing and then break when you can't parse no more
-        while True:
-            # Search data looking for key-frame
-            if self.key_frame is not None:
-                while True:
-                    # Check if we have enough data to parse a key
-                    # if not, bail on the function
-                    if len(data_left) < self.key_obj.getSize():
-                        return data_left, raw_msgs
-                    # Check leading key size bytes to see if it is the key
-                    self.key_obj.deserialize(data_left, 0)
-                    if self.key_obj.val != self.key_frame:
-                        del data_left[0]
-                        continue
-                    # Key found break
-                    del data_left[: self.key_obj.getSize()]
-                    break
+        offset, raw_msgs = self.parse_raw_msgs_from(data)
+        return data[offset:], [bytearray(raw_msg) for raw_msg in raw_msgs]
 
-            # Check if we have enough data to parse a length
-            if len(data_left) < self.len_obj.getSize():
-                break
-            self.len_obj.deserialize(data_left, 0)
-            expected_len = self.len_obj.val + self.len_obj.getSize()
+    def parse_raw_msgs_from(self, data, offset=0):
+        """
+        Parse the given data into raw messages by walking it with an offset cursor.
 
-            # Check if we have enough data to parse
-            if len(data_left) < expected_len:
-                break
+        The data is never modified. Each raw message is returned as a memoryview slice of data such that a buffer
+        holding many messages can be parsed in a single linear pass. Callers are expected to drop the consumed bytes
+        (everything before the returned offset) once they are done with the returned messages. Data cannot be resized
+        while any of the returned messages is held.
 
-            raw_msgs.append(data_left[:expected_len])
-            del data_left[:expected_len]
-        return data_left, raw_msgs
+        Args:
+            data (bytearray): Binary data to parse
+            offset (int): Position in data to start parsing from
+
+        Returns:
+            (offset, [raw_msg1, raw_msg2, ..., raw_msgN])
+            Where offset is the position of the first byte that could not be parsed (due to insufficient length)
+        """
+        # The view of data is released on return, such that data may be resized once the messages are dropped
+        with memoryview(data) as view:
+            data_len = len(view)
+            key_type = type(self.key_obj)
+            len_type = type(self.len_obj)
+            key_size = key_type.getSize()
+            len_size = len_type.getSize()
+
+            raw_msgs = []
+            # Keep parsing and then break when you can't parse no more
+            while True:
+                # Search data looking for key-frame
+                if self.key_frame is not None:
+                    while True:
+                        # Check if we have enough data to parse a key
+                        # if not, bail on the function
+                        if data_len - offset < key_size:
+                            return offset, raw_msgs
+                        # Check leading key size bytes to see if it is the key
+                        key, _ = key_type.deserialize_from(view, offset)
+                        if key != self.key_frame:
+                            offset += 1
+                            continue
+                        # Key found break
+                        offset += key_size
+                        break
+
+                # Check if we have enough data to parse a length
+                if data_len - offset < len_size:
+                    break
+                length, _ = len_type.deserialize_from(view, offset)
+                expected_len = length + len_size
+
+                # Check if we have enough data to parse
+                if data_len - offset < expected_len:
+                    break
+
+                raw_msgs.append(view[offset : offset + expected_len])
+                offset += expected_len
+            return offset, raw_msgs
 
     def parse_raw_msg_api(self, raw_msg):
         """
@@ -126,7 +152,7 @@ class Distributor(DataHandler):
 
         Returns:
             Tuple: (length, descriptor, msg). length is type int. Descriptor is
-            type int. Msg is a bytearray.
+            type int. Msg is a memoryview of raw_msg, no data is copied.
         """
         # Data Entry Structure
         #
@@ -153,7 +179,7 @@ class Distributor(DataHandler):
         desc = self.desc_obj.val
 
         # Retrieve message section
-        msg = raw_msg[offset:]
+        msg = memoryview(raw_msg)[offset:]
 
         return length, desc, msg
 
@@ -182,13 +208,15 @@ class Distributor(DataHandler):
         #       messages through the TCP Server.
 
         # Add new data to end of buffer
-
         self.__buf.extend(data)
 
-        (leftover_data, raw_msgs) = self.parse_into_raw_msgs_api(self.__buf)
-        assert (
-            leftover_data == self.__buf
-        ), "Leftover data is not equivalent to the remaining data in buffer"
+        offset, raw_msgs = self.parse_raw_msgs_from(self.__buf)
+        # Compact the buffer exactly once per receive. A new bytearray is built rather than resizing in-place as the
+        # parsed messages are still views into the old buffer. That old buffer is never written again, so the views
+        # handed to decoders stay valid without copying the messages out. Decoders keeping a view (rather than the
+        # decoded items) keep the whole old buffer alive, and should copy the message with bytes() instead.
+        if offset:
+            self.__buf = self.__buf[offset:]
 
         for raw_msg in raw_msgs:
             try:
@@ -89,7 +89,7 @@ class FileEncoder(encoder.Encoder):
             raise Exception(msg)
         descriptor_obj = ConfigManager().get_type("ComCfg.Apid")("FW_PACKET_FILE")
         length_obj = ConfigManager().get_config("msg_len")()
-        length_obj.val = descriptor_obj.getSize() + len(out_data)
+        length_obj.val = descriptor_obj.FIXED_SIZE + len(out_data)
         header = (
             U32Type(0x5A5A5A5A).serialize()
             + length_obj.serialize()
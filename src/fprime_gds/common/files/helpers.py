@@ -88,18 +88,12 @@ class CFDPChecksum:
         self.__value = 0
 
     def update(self, data, offset):
-        """Update the checksum"""
-        while data:
-            padding_len = offset % 4
-            calc_bytes = (
-                bytes([0] * padding_len) + data[: 4 - padding_len] + bytes([0, 0, 0, 0])
-            )
-            self.__value = (
-                self.__value + struct.unpack_from(">I", calc_bytes, 0)[0]
-            ) & 0xFFFFFFFF
-            # Update pointers
-            data = data[4 - padding_len :]
-            offset = offset + (4 - padding_len)
+        """Update the checksum with data found at the given offset of the file"""
+        # Words are aligned to the file, thus data is padded with zeros to the preceding and following word boundaries
+        padding_len = offset % 4
+        padded = bytes(padding_len) + bytes(data) + bytes(-(padding_len + len(data)) % 4)
+        words = struct.unpack(f">{len(padded) // 4}I", padded)
+        self.__value = (self.__value + sum(words)) & 0xFFFFFFFF
 
     @property
     def value(self):
@@ -7,6 +7,8 @@ retrieval operations. This history will re-order itself based on FSW time.
 :author: koran
 """
 
+from collections import Counter
+
 from fprime_gds.common.models.serialize.time_type import TimeType
 
 from fprime_gds.common.history.history import History
@@ -17,21 +19,26 @@ class ChronologicalHistory(History):
     """
     A chronological history to support the GDS test api. This history adds support for specifying
     start with predicates and python's bracket notation.
+
+    The history may keep an id index: the chronologically ordered items of each id. This serves
+    retrieve_by_id and latest without scanning the whole history.
     """
 
     ###########################################################################
     #   History Functions
     ###########################################################################
-    def __init__(self, filter_pred=None):
+    def __init__(self, filter_pred=None, id_index=False):
         """
         Constructor used to set-up history. If the history is given a filter, it will ignore (drop)
         objects that don't satisfy the filter predicate.
 
         Args:
             filter_pred: an optional predicate to filter incoming data_objects
+            id_index: True to keep an index of the objects of each id
         """
         self.objects = []
         self.new_objects = []
+        self.id_index = {} if id_index else None
 
         self.filter = predicates.always_true()
         if filter_pred is not None:
@@ -55,6 +62,8 @@ class ChronologicalHistory(History):
             self.__insert_chrono(data, self.new_objects)
             index = self.__insert_chrono(data, self.objects)
             self.retrieved_cursor = min(index, self.retrieved_cursor)
+            if self.id_index is not None:
+                self.__insert_chrono(data, self.id_index.setdefault(getattr(data, "id", None), []))
 
     def retrieve(self, start=None):
         """
@@ -73,6 +82,41 @@ class ChronologicalHistory(History):
         self.new_objects.clear()
         return self.objects[index:]
 
+    def retrieve_by_id(self, ids, start=None, limit=None):
+        """
+        Retrieve objects of the given ids from this history. With an id index, a single id retrieved from the beginning
+        or from a TimeType start is served from the index. Other retrievals filter the output of retrieve.
+
+        Args:
+            ids: collection of ids of the objects to retrieve
+            start: optional first object to retrieve. can either be an index (int), a predicate, or a TimeType.
+            limit: optional maximum count of objects to retrieve
+        Returns:
+            a list of objects in chronological order
+        """
+        if self.id_index is None or len(ids) != 1 or not (start is None or isinstance(start, TimeType)):
+            return super().retrieve_by_id(ids, start)[:limit]
+        (item_id,) = ids
+        ordered = self.id_index.get(item_id, [])
+        index = 0 if start is None else self.__get_index(start, ordered)
+        self.retrieved_cursor = self.size()
+        self.new_objects.clear()
+        return ordered[index:] if limit is None else ordered[index : index + limit]
+
+    def latest(self, item_id):
+        """
+        Accessor for the chronologically latest object of the given id
+
+        Args:
+            item_id: id of the object
+        Returns:
+            the latest object or None when the history holds no object of that id
+        """
+        if self.id_index is not None:
+            ordered = self.id_index.get(item_id)
+            return ordered[-1] if ordered else None
+        return next((item for item in reversed(self.objects) if getattr(item, "id", None) == item_id), None)
+
     def retrieve_new(self, repeats=False):
         """
         Retrieves a chronological order of objects that haven't been accessed through retrieve or
@@ -104,7 +148,14 @@ class ChronologicalHistory(History):
             start: start: an optional indicator for the first item to remove. Can be a predicate, a
                 TimeType or an index in the ordering
         """
-        index = self.__clear_list(start, self.objects)
+        index = len(self.objects) if start is None else self.__get_index(start, self.objects)
+        if self.id_index is not None:
+            # The cleared objects of each id are the earliest objects of that id
+            for item_id, count in Counter(getattr(item, "id", None) for item in self.objects[:index]).items():
+                del self.id_index[item_id][:count]
+                if not self.id_index[item_id]:
+                    del self.id_index[item_id]
+        del self.objects[:index]
 
         if len(self.objects) > 0:
             start = self.objects[0].get_time()
@@ -152,23 +203,44 @@ class ChronologicalHistory(History):
     @staticmethod
     def __insert_chrono(data_object, ordered):
         """
-        traverses the existing order (back to front) and inserts the data object in the correct
-        position chronologically.
+        inserts the data object in the correct position chronologically. Items arriving in order are appended, others
+        are placed by a binary search on the cached sort key of their time.
         Args:
             data_object: an item to insert in the history. Must have a get_time() method.
             ordered: a list to insert the item into.
         Returns:
-            the index that the item was inserted at (int)
-        """
-        for i, item in reversed(list(enumerate(ordered))):
-            # Note: for events with the exact same time, this should default to the order received from downlink
-            #       and as such the data item should be treated as newer because it was received later.
-            if item.get_time() <= data_object.get_time():
-                ordered.insert(i + 1, data_object)
-                return i
-        # If the data object is the earliest in the list or the list was empty
-        ordered.insert(0, data_object)
-        return 0
+            the index of the item preceding the inserted item, 0 when inserted first (int)
+        """
+        key = data_object.get_time().sort_key
+        # Note: for events with the exact same time, this should default to the order received from downlink
+        #       and as such the data item should be treated as newer because it was received later.
+        if not ordered or ordered[-1].get_time().sort_key <= key:
+            ordered.append(data_object)
+            return max(len(ordered) - 2, 0)
+        position = ChronologicalHistory.__bisect(ordered, key, after_equal=True)
+        ordered.insert(position, data_object)
+        return max(position - 1, 0)
+
+    @staticmethod
+    def __bisect(ordered, key, after_equal):
+        """
+        binary search of the position of a sort key within the ordered list
+        Args:
+            ordered: a chronologically ordered list
+            key: the TimeType sort key to search for
+            after_equal: True to return the position after items of an equal key, False for the position before
+        Returns:
+            the index at which an item of the given key would be inserted
+        """
+        low, high = 0, len(ordered)
+        while low < high:
+            middle = (low + high) // 2
+            middle_key = ordered[middle].get_time().sort_key
+            if middle_key < key or (after_equal and middle_key == key):
+                low = middle + 1
+            else:
+                high = middle
+        return low
 
     def __clear_list(self, start, ordered):
         """
@@ -201,8 +273,5 @@ class ChronologicalHistory(History):
                 index += 1
             return index
         if isinstance(start, TimeType):
-            index = 0
-            while index < len(ordered) and ordered[index].get_time() < start:
-                index += 1
-            return index
+            return ChronologicalHistory.__bisect(ordered, start.sort_key, after_equal=False)
         return start
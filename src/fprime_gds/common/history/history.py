@@ -67,3 +67,18 @@ class History(fprime_gds.common.handlers.DataHandler):
             the number of objects (int)
         """
         raise NotImplementedError("This history didn't override the size method.")
+
+    def retrieve_by_id(self, ids, start=None, limit=None):
+        """
+        Retrieve objects from this history whose id is one of the given ids. This behaves as retrieve filtered down to
+        the given ids. Histories keeping an id index override this to avoid scanning the whole history.
+
+        Args:
+            ids: collection of ids of the objects to retrieve
+            start: a position in the history's order, as for retrieve
+            limit: limit (count) of objects scanned, for histories whose retrieve supports a limit
+        Returns:
+            an ordered list of objects
+        """
+        items = self.retrieve(start) if limit is None else self.retrieve(start, limit)
+        return [item for item in items if getattr(item, "id", None) in ids]
@@ -9,25 +9,83 @@ Note: this RAM history treats "start times" as session tokens to remember where
 
 :author: lestarch
 """
+import heapq
+import sys
 import threading
 import time
+from collections import deque
 
 from fprime_gds.common.history.history import History
 
 
+def estimate_size(item):
+    """
+    Approximates the memory held by a history item: the item itself and the values it references directly. Templates
+    are shared by all items of the same id and are not counted.
+
+    :param item: history item to measure
+    :return: approximate size in bytes
+    """
+    size = sys.getsizeof(item)
+    for cls in type(item).__mro__:
+        slots = getattr(cls, "__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if slot != "template" and hasattr(item, slot):
+                size += sys.getsizeof(getattr(item, slot))
+    for key, value in getattr(item, "__dict__", {}).items():
+        if key != "template":
+            size += sys.getsizeof(value)
+    return size
+
+
 class RamHistory(History):
     """
     Chronological variant of history.  This is intended to be registered with the decoders in order
     to handle incoming objects, and store them for retrieval.
+
+    The history may be capped by a count of items and/or by an approximate byte size. Exceeding a cap evicts the oldest
+    items. A per-id quota additionally evicts the oldest item of an id (e.g. a channel) exceeding its quota, such that
+    high-rate ids cannot push out low-rate ones. Sessions that had not retrieved evicted items have these counted as
+    dropped (see pop_dropped_count). Items are stored in a buffer addressed by absolute position, evicted items are
+    released immediately and their slots reclaimed in bulk. The positions of each id are indexed such that sessions
+    retrieving a selection of ids (see retrieve_by_id) do not scan the items of other ids.
+
+    The latest item of each id is tracked separately from the buffer and survives eviction and clearing, serving views
+    of the current value of each channel. Listeners (threading.Event) are set whenever an item is stored such that
+    consumers may wait for new items instead of polling.
     """
 
-    def __init__(self):
+    # Default caps used when not supplied to the constructor. None leaves the history unbounded.
+    MAX_ITEMS = None
+    MAX_BYTES = None
+    ID_QUOTA = None
+
+    def __init__(self, max_items=None, max_bytes=None, id_quota=None, sizer=estimate_size):
         """
         Constructor used to set-up in-memory store for history
+
+        :param max_items: maximum count of items held, None for the class default
+        :param max_bytes: maximum approximate size of the items held, None for the class default
+        :param id_quota: maximum count of items held per id, None for the class default
+        :param sizer: function approximating the size of an item, used with max_bytes
         """
         self.lock = threading.RLock()
         self.objects = []
         self.retrieved_cursors = {}
+        self.dropped_counts = {}
+        self.max_items = self.MAX_ITEMS if max_items is None else max_items
+        self.max_bytes = self.MAX_BYTES if max_bytes is None else max_bytes
+        self.id_quota = self.ID_QUOTA if id_quota is None else id_quota
+        self.sizer = sizer
+        # self.objects[0] sits at absolute position base, the oldest held item at head. Evicted slots hold None.
+        self._base = 0
+        self._head = 0
+        self._live = 0
+        self._bytes = 0
+        self._sizes = []
+        self._id_positions = {}
+        self._latest = {}
+        self._listeners = set()
 
     def data_callback(self, data, sender=None):
         """
@@ -37,6 +95,43 @@ class RamHistory(History):
         """
         with self.lock:
             self.objects.append(data)
+            self._latest[getattr(data, "id", None)] = data
+            if self.max_bytes is not None:
+                size = self.sizer(data)
+                self._sizes.append(size)
+                self._bytes += size
+            self._live += 1
+            positions = self._id_positions.setdefault(getattr(data, "id", None), deque())
+            positions.append(self._base + len(self.objects) - 1)
+            if self.id_quota is not None and len(positions) > self.id_quota:
+                self._evict(positions.popleft(), dropped=True)
+            while self._live > 0 and (
+                (self.max_items is not None and self._live > self.max_items)
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                self._evict(self._head, dropped=True)
+            self._compact()
+            for listener in self._listeners:
+                if not listener.is_set():
+                    listener.set()
+
+    def register_listener(self, listener):
+        """
+        Register a listener set when new items are stored
+
+        :param listener: threading.Event to set
+        """
+        with self.lock:
+            self._listeners.add(listener)
+
+    def remove_listener(self, listener):
+        """
+        Remove a listener previously registered
+
+        :param listener: threading.Event to remove
+        """
+        with self.lock:
+            self._listeners.discard(listener)
 
     def retrieve(self, start=None, limit=None):
         """
@@ -48,16 +143,48 @@ class RamHistory(History):
         :param limit: limit (count) of returned results
         :return: a list of objects
         """
-        index = 0
         with self.lock:
-            size = self.size()
+            end = self._base + len(self.objects)
+            index = self._head
             if start is not None:
-                index = self.retrieved_cursors.get(start, size)
-            end_slice = min(size, index + (limit if limit is not None else size))
-            objs = self.objects[index:end_slice]
+                index = max(self.retrieved_cursors.get(start, end), self._head)
+            end_slice = min(end, index + (limit if limit is not None else end))
+            objs = self._slice(index, end_slice)
             self.retrieved_cursors[start] = end_slice
         return objs
 
+    def retrieve_by_id(self, ids, start=None, limit=None):
+        """
+        Retrieve objects of the given ids from this history. Only the indexed positions of these ids are visited. The
+        session advances as for retrieve, such that the next call returns the objects received since.
+
+        :param ids: collection of ids of the objects to retrieve
+        :param start: return objects newer than given start session key
+        :param limit: limit (count) of returned results
+        :return: a list of objects in receive order
+        """
+        with self.lock:
+            end = self._base + len(self.objects)
+            index = self._head
+            if start is not None:
+                index = max(self.retrieved_cursors.get(start, end), self._head)
+            selections = []
+            for item_id in ids:
+                # New positions of an id are at the end of its positions
+                new = []
+                for position in reversed(self._id_positions.get(item_id, ())):
+                    if position < index:
+                        break
+                    new.append(position)
+                new.reverse()
+                selections.append(new)
+            positions = list(heapq.merge(*selections))
+            if limit is not None and len(positions) > limit:
+                positions = positions[:limit]
+                end = positions[-1] + 1
+            self.retrieved_cursors[start] = end
+            return [self.objects[position - self._base] for position in positions]
+
     def retrieve_new(self):
         """
         Retrieves a chronological order of objects that haven't been accessed through retrieve or
@@ -66,11 +193,11 @@ class RamHistory(History):
         Returns:
             a list of objects in chronological order
         """
-        index = 0
         with self.lock:
+            index = self._head
             if len(self.retrieved_cursors.values()) > 0:
-                index = max(self.retrieved_cursors.values())
-            return self.objects[index:]
+                index = max(max(self.retrieved_cursors.values()), self._head)
+            return self._slice(index, self._base + len(self.objects))
 
     def clear(self, start=None):
         """
@@ -81,17 +208,43 @@ class RamHistory(History):
             start: a position in the history's order (int).
         """
         with self.lock:
-            try:
-                if start is not None:
-                    del self.retrieved_cursors[start]
-            except KeyError:
-                pass
-            earliest = 0
+            if start is not None:
+                self.retrieved_cursors.pop(start, None)
+                self.dropped_counts.pop(start, None)
             if len(self.retrieved_cursors.values()) > 0:
                 earliest = min(self.retrieved_cursors.values())
-            del self.objects[:earliest]
-            for key in self.retrieved_cursors:
-                self.retrieved_cursors[key] -= earliest
+                while self._head < earliest:
+                    self._evict(self._head, dropped=False)
+                self._compact()
+
+    def latest(self, item_id):
+        """
+        Accessor for the last received item of the given id
+
+        :param item_id: id of the item
+        :return: the latest item or None when no item of that id was received
+        """
+        with self.lock:
+            return self._latest.get(item_id)
+
+    def latest_items(self):
+        """
+        Accessor for the last received item of every id
+
+        :return: a list of items, one per id
+        """
+        with self.lock:
+            return list(self._latest.values())
+
+    def pop_dropped_count(self, start=None):
+        """
+        Get and reset the count of items evicted by the caps before the given session retrieved them
+
+        :param start: session key
+        :return: count of dropped items since the last call
+        """
+        with self.lock:
+            return self.dropped_counts.pop(start, 0)
 
     def sessions(self):
         """
@@ -109,7 +262,48 @@ class RamHistory(History):
             the number of objects (int)
         """
         with self.lock:
-            return len(self.objects)
+            return self._live
+
+    def _slice(self, start, end):
+        """Held items between the absolute positions start and end"""
+        return [item for item in self.objects[start - self._base : end - self._base] if item is not None]
+
+    def _evict(self, position, dropped):
+        """
+        Evict the item at the given absolute position, counting it as dropped for sessions that had not retrieved it
+
+        :param position: absolute position of the item
+        :param dropped: True when evicted by a cap, False when cleared
+        """
+        slot = position - self._base
+        item = self.objects[slot]
+        self.objects[slot] = None
+        self._live -= 1
+        if self.max_bytes is not None:
+            self._bytes -= self._sizes[slot]
+        item_id = getattr(item, "id", None)
+        positions = self._id_positions[item_id]
+        # Quota evictions already removed their position
+        if positions and positions[0] == position:
+            positions.popleft()
+        if not positions:
+            del self._id_positions[item_id]
+        if dropped:
+            for session, cursor in self.retrieved_cursors.items():
+                if cursor <= position:
+                    self.dropped_counts[session] = self.dropped_counts.get(session, 0) + 1
+        # Move the head past the evicted item and any items evicted by quota behind it
+        end = self._base + len(self.objects)
+        while self._head < end and self.objects[self._head - self._base] is None:
+            self._head += 1
+
+    def _compact(self):
+        """Reclaim the slots of evicted items once they make up most of the buffer"""
+        reclaimable = self._head - self._base
+        if reclaimable > 0 and reclaimable >= len(self.objects) // 2:
+            del self.objects[:reclaimable]
+            del self._sizes[: reclaimable if self.max_bytes is not None else 0]
+            self._base = self._head
 
 
 class SelfCleaningRamHistory(RamHistory):
@@ -141,6 +335,21 @@ class SelfCleaningRamHistory(RamHistory):
                 self.last_request[start] = time.time()
         return super().retrieve(start, limit)
 
+    def retrieve_by_id(self, ids, start=None, limit=None):
+        """
+        Retrieve objects of the given ids from this history, as retrieve does for all objects. This refreshes the last
+        polled time preventing self clearing for another time
+
+        :param ids: collection of ids of the objects to retrieve
+        :param start: return objects newer than given start session key
+        :param limit: limit (count) of returned results
+        :return: a list of objects
+        """
+        if start is not None:
+            with self.lock:
+                self.last_request[start] = time.time()
+        return super().retrieve_by_id(ids, start, limit)
+
     def clear(self, start=None):
         """
         Clears objects from RamHistory. It clears upto the earliest session. If session is supplied, the session id will
@@ -158,7 +367,7 @@ class SelfCleaningRamHistory(RamHistory):
                 if self.clear_time > 0 and (last + self.clear_time) < current
             ]
             for delete in deletes:
-                for container in [self.retrieved_cursors, self.last_request]:
+                for container in [self.retrieved_cursors, self.last_request, self.dropped_counts]:
                     try:
                         del container[delete]
                     except KeyError:
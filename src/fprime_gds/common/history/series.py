@@ -0,0 +1,192 @@
+"""
+series.py:
+
+A store of the numeric samples of each channel indexed by time. Samples are kept as packed arrays of times and values,
+which holds hours of high-rate telemetry at a fraction of the memory of the channel objects. The store serves
+decimated views of a time range (see decimate) such that plotting a long window does not transfer every sample.
+
+Times are the float seconds of the channel times (see TimeType.get_float), as plotted by the UI.
+"""
+import bisect
+import threading
+from array import array
+
+from fprime_gds.common.handlers import DataHandler
+
+
+class ChannelSeries:
+    """
+    Time ordered samples of a single channel. Late samples are inserted in place when they fall within the latest
+    REORDER_WINDOW samples, bounding the cost of an insertion. Later samples are dropped.
+    """
+
+    __slots__ = ["times", "values"]
+
+    # Count of the latest samples among which late samples are inserted
+    REORDER_WINDOW = 1024
+
+    def __init__(self):
+        """Constructor of an empty series"""
+        self.times = array("d")
+        self.values = array("d")
+
+    def append(self, time, value):
+        """
+        Add a sample to the series. Samples are expected in time order, late samples are inserted in place unless older
+        than the REORDER_WINDOW latest samples.
+
+        :param time: time of the sample in seconds
+        :param value: value of the sample
+        :return: True when the sample was added, False when dropped
+        """
+        if not self.times or self.times[-1] <= time:
+            self.times.append(time)
+            self.values.append(value)
+            return True
+        low = max(0, len(self.times) - self.REORDER_WINDOW)
+        if low > 0 and time < self.times[low]:
+            return False
+        index = bisect.bisect_right(self.times, time, low)
+        self.times.insert(index, time)
+        self.values.insert(index, value)
+        return True
+
+    def trim(self, count):
+        """
+        Remove the oldest samples of the series
+
+        :param count: number of samples to remove
+        """
+        del self.times[:count]
+        del self.values[:count]
+
+    def bounds(self, start=None, end=None):
+        """
+        Indices of the samples within a time range
+
+        :param start: earliest time of the range, None for no lower bound
+        :param end: time after which samples are excluded (exclusive), None for no upper bound
+        :return: tuple of the first index and the index past the last sample
+        """
+        low = 0 if start is None else bisect.bisect_left(self.times, start)
+        high = len(self.times) if end is None else bisect.bisect_left(self.times, end)
+        return low, max(low, high)
+
+
+class SeriesStore(DataHandler):
+    """
+    Data handler storing the numeric channel values received by id. Non-numeric values (strings, enums, serializables
+    and arrays) are not stored. Each series is capped to MAX_SAMPLES, beyond which the oldest samples are trimmed in
+    bulk. All series together are capped to MAX_TOTAL_SAMPLES, beyond which the oldest samples of the longest series
+    are trimmed.
+    """
+
+    # Samples of each channel held, over an hour of 50Hz telemetry
+    MAX_SAMPLES = 262144
+    # Samples of all channels held, 64MiB of times and values
+    MAX_TOTAL_SAMPLES = 4194304
+
+    def __init__(self, max_samples=None, max_total=None):
+        """
+        Constructor
+
+        :param max_samples: maximum count of samples held per channel, None for the class default
+        :param max_total: maximum count of samples held across all channels, None for the class default
+        """
+        self.lock = threading.Lock()
+        self.series = {}
+        self.total = 0
+        self.max_samples = self.MAX_SAMPLES if max_samples is None else max_samples
+        self.max_total = self.MAX_TOTAL_SAMPLES if max_total is None else max_total
+
+    def data_callback(self, data, sender=None):
+        """
+        Data callback storing the sample of numeric channel values
+
+        :param data: channel object
+        """
+        value = data.val_obj.val
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return
+        with self.lock:
+            series = self.series.get(data.id)
+            if series is None:
+                series = self.series[data.id] = ChannelSeries()
+            if not series.append(data.time.get_float(), value):
+                return
+            self.total += 1
+            # Trim an eighth of the series at once, such that arrays are not shifted for every new sample
+            if len(series.times) > self.max_samples:
+                count = len(series.times) - self.max_samples + self.max_samples // 8
+                series.trim(count)
+                self.total -= count
+            if self.total > self.max_total:
+                self.evict()
+
+    def evict(self):
+        """
+        Trim the oldest samples of the longest series, an eighth of a series at once, until all series fit the total
+        cap. Lock must be held.
+        """
+        while self.total > self.max_total:
+            item_id, series = max(self.series.items(), key=lambda entry: len(entry[1].times))
+            length = len(series.times)
+            count = min(length, max(length // 8, self.total - self.max_total))
+            series.trim(count)
+            self.total -= count
+            if count == length:
+                del self.series[item_id]
+
+    def ids(self):
+        """
+        Accessor for the ids of the stored channels
+
+        :return: list of channel ids
+        """
+        with self.lock:
+            return list(self.series.keys())
+
+    def decimate(self, item_id, start=None, end=None, width=1000):
+        """
+        Decimate the samples of a channel within a time range into (at most) width buckets of equal duration. Each
+        bucket holds the minimum, maximum, and average of its samples. This min-max decimation keeps the peaks of the
+        signal visible when plotted at one bucket per pixel. Empty buckets are omitted, and ranges holding no more than
+        width samples are returned as is (one bucket per sample).
+
+        :param item_id: id of the channel
+        :param start: earliest time of the range in seconds, None for the earliest sample
+        :param end: time after which samples are excluded (exclusive) in seconds, None to include the latest sample
+        :param width: maximum count of buckets, usually the width in pixels of the plot
+        :return: dictionary of lists "times" (start time of each bucket), "min", "max", "avg", and "count"
+        """
+        buckets = {"times": [], "min": [], "max": [], "avg": [], "count": []}
+        with self.lock:
+            series = self.series.get(item_id)
+            if series is None:
+                return buckets
+            low, high = series.bounds(start, end)
+            times = series.times[low:high]
+            values = series.values[low:high]
+        if len(times) <= width:
+            values = values.tolist()
+            buckets.update(
+                {"times": times.tolist(), "min": values, "max": values, "avg": values, "count": [1] * len(values)}
+            )
+            return buckets
+        first = times[0] if start is None else start
+        duration = ((times[-1] if end is None else end) - first) / width
+        index = 0
+        for bucket in range(width):
+            # The last bucket holds all remaining samples, as the range end is inclusive without an end time
+            following = (
+                len(times) if bucket == width - 1 else bisect.bisect_left(times, first + duration * (bucket + 1), index)
+            )
+            if following > index:
+                samples = values[index:following]
+                buckets["times"].append(first + duration * bucket)
+                buckets["min"].append(min(samples))
+                buckets["max"].append(max(samples))
+                buckets["avg"].append(sum(samples) / len(samples))
+                buckets["count"].append(len(samples))
+            index = following
+        return buckets
@@ -0,0 +1,494 @@
+"""
+sqlite.py:
+
+A history persisting items on disk in a SQLite database. Items survive a restart of the GDS such that the full history
+of a pass may be kept without RAM limits and served again after a restart. Items are indexed by time and by id, which
+serves range queries and per-id lookups without scanning the history. Items are stored as versioned records of their
+serialized values (see ItemRecord), decoded through the dictionaries when read.
+
+Note: as the RAM history, this history treats "start times" as session tokens to remember where it was last fetched
+from. Sessions are not persisted, except by the SharedSqliteHistory that keeps them in the database such that several
+processes may serve the same sessions.
+"""
+import logging
+import os
+import sqlite3
+import struct
+import threading
+import time
+
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.data_types.cmd_data import CmdData
+from fprime_gds.common.data_types.event_data import EventData
+from fprime_gds.common.decoders.decoder import DecodingException
+from fprime_gds.common.decoders.event_decoder import EventDecoder
+from fprime_gds.common.history.history import History
+from fprime_gds.common.models.serialize.time_type import TimeType
+from fprime_gds.common.models.serialize.type_exceptions import TypeException
+
+LOGGER = logging.getLogger("sqlite_history")
+
+# Width of the stored time sort keys. Keys are stored big-endian as blobs, which SQLite orders as the keys themselves.
+TIME_KEY_BYTES = 24
+
+
+class ItemRecord:
+    """
+    Records of history items as stored in the database. An item is stored as its id and time (columns of the history)
+    and a record of the format version, the kind of item, and the serialized value (channels) or arguments (events and
+    commands). Records are decoded through the templates of the dictionaries, such that they neither depend on the
+    classes of the items nor run code when loaded. Packet references of channels and command descriptors are not
+    stored.
+    """
+
+    VERSION = 1
+    HEADER = struct.Struct(">BB")
+    KINDS = ((ChData, 1), (EventData, 2), (CmdData, 3))
+
+    def __init__(self, dictionaries):
+        """Construct the records of items of the given dictionaries"""
+        self.templates = {1: dictionaries.channel_id, 2: dictionaries.event_id, 3: dictionaries.command_id}
+
+    def encode(self, item):
+        """
+        Record of an item
+
+        :param item: ChData, EventData or CmdData
+        :return: record bytes
+        """
+        for item_type, kind in self.KINDS:
+            if isinstance(item, item_type):
+                break
+        else:
+            raise TypeError(f"Cannot store {type(item).__name__} items")
+        if kind == 1:
+            values = () if item.val_obj is None else (item.val_obj,)
+        else:
+            values = item.args or ()
+        return self.HEADER.pack(self.VERSION, kind) + b"".join(value.serialize() for value in values)
+
+    def decode(self, item_id, time_key, record):
+        """
+        Item of a record
+
+        :param item_id: id of the item
+        :param time_key: stored time sort key of the item
+        :param record: record bytes
+        :return: ChData, EventData or CmdData
+        :raises ValueError: when the record is not of this version
+        :raises KeyError: when the id is not in the dictionaries
+        """
+        version, kind = self.HEADER.unpack_from(record)
+        if version != self.VERSION:
+            raise ValueError(f"Record version {version} is not supported")
+        template = self.templates[kind][item_id]
+        item_time = TimeType()
+        if time_key is not None:
+            key = int.from_bytes(time_key, "big")
+            item_time = TimeType.from_fields(
+                key >> 128, key & 0xFFFFFFFFFFFFFFFF, (key >> 96) & 0xFFFFFFFF, (key >> 64) & 0xFFFFFFFF
+            )
+        if kind == 1:
+            value = None
+            if len(record) > self.HEADER.size:
+                value = template.get_type_obj()()
+                value.deserialize(record, self.HEADER.size)
+            return ChData(value, item_time, template)
+        _, args = EventDecoder.decode_args(record, self.HEADER.size, template)
+        if kind == 2:
+            return EventData(args, item_time, template)
+        item = CmdData((), template, cmd_time=item_time)
+        item.args = list(args)
+        return item
+
+
+class SqliteHistory(History):
+    """
+    History persisted in a SQLite database. Each history is a table of the database, holding item records (see
+    ItemRecord) in receive order along with their id and time. Positions in the receive order are stable across
+    restarts. The count of items is kept by triggers in a table of its own, such that any process reads it without
+    counting. The database is used in WAL mode such that reading a history does not block the decoders storing items.
+
+    Beyond the session-based retrieve of the RAM history, this history offers range queries by time and id and the
+    latest item of each id.
+    """
+
+    # File name of the database created in the storage directory of a pipeline
+    DATABASE = "fprime-gds-history.sqlite3"
+
+    def __init__(self, database=":memory:", name="history", dictionaries=None):
+        """
+        Constructor opening (or creating) the history in the database
+
+        :param database: path to the database file, ":memory:" for a database that is not persisted
+        :param name: name of the history, used as table name. Only letters, digits and underscores are permitted.
+        :param dictionaries: dictionaries whose templates decode the stored items
+        """
+        if not name.replace("_", "").isalnum():
+            raise ValueError(f"Invalid history name: {name}")
+        if dictionaries is None:
+            raise ValueError("Dictionaries are required to decode the stored items")
+        self.lock = threading.RLock()
+        self.name = name
+        self.dictionaries = dictionaries
+        self.records = ItemRecord(dictionaries)
+        self.retrieved_cursors = {}
+        self.connection = sqlite3.connect(database, check_same_thread=False, timeout=30)
+        with self.lock:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            with self.connection:
+                # Created at once by the first of the processes opening the history
+                self.connection.execute("BEGIN IMMEDIATE")
+                self.connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {name} "
+                    "(position INTEGER PRIMARY KEY AUTOINCREMENT, id INTEGER, time BLOB, item BLOB)"
+                )
+                self.connection.execute(f"CREATE INDEX IF NOT EXISTS {name}_time ON {name} (time, position)")
+                self.connection.execute(f"CREATE INDEX IF NOT EXISTS {name}_id ON {name} (id, position)")
+                self.connection.execute(f"CREATE TABLE IF NOT EXISTS {name}_count (size INTEGER)")
+                self.connection.execute(
+                    f"INSERT INTO {name}_count SELECT COUNT(*) FROM {name} "
+                    f"WHERE NOT EXISTS (SELECT 1 FROM {name}_count)"
+                )
+                self.connection.execute(
+                    f"CREATE TRIGGER IF NOT EXISTS {name}_inserted AFTER INSERT ON {name} "
+                    f"BEGIN UPDATE {name}_count SET size = size + 1; END"
+                )
+                self.connection.execute(
+                    f"CREATE TRIGGER IF NOT EXISTS {name}_deleted AFTER DELETE ON {name} "
+                    f"BEGIN UPDATE {name}_count SET size = size - 1; END"
+                )
+            self._size, self._end = self.connection.execute(
+                f"SELECT size, (SELECT COALESCE(MAX(position), 0) FROM {name}) FROM {name}_count"
+            ).fetchone()
+
+    @classmethod
+    def for_pipeline(cls, name, dictionaries, storage):
+        """
+        Construct a history of a pipeline. The histories of a pipeline share the database in the storage directory.
+
+        :param name: name of the history (e.g. channels)
+        :param dictionaries: dictionaries of the pipeline
+        :param storage: storage directory of the pipeline, None for a database that is not persisted
+        :return: history
+        """
+        database = ":memory:" if storage is None else os.path.join(storage, cls.DATABASE)
+        return cls(database, name, dictionaries)
+
+    def data_callback(self, data, sender=None):
+        """
+        Data callback to store
+
+        :param data: object to store
+        """
+        record = self.records.encode(data)
+        time = getattr(data, "time", None)
+        key = None if time is None else time.sort_key.to_bytes(TIME_KEY_BYTES, "big")
+        with self.lock, self.connection:
+            self._end = self.connection.execute(
+                f"INSERT INTO {self.name} (id, time, item) VALUES (?, ?, ?)",
+                (getattr(data, "id", None), key, record),
+            ).lastrowid
+            self._size += 1
+
+    def retrieve(self, start=None, limit=None):
+        """
+        Retrieve objects from this history. 'start' is the session token for retrieving new elements. If session is not
+        specified, all elements are retrieved. If session is specified, then unseen elements are returned. If the
+        session itself is new, it is recorded and set to the newest data.
+
+        :param start: return all objects newer than given start session key
+        :param limit: limit (count) of returned results
+        :return: a list of objects
+        """
+        with self.lock:
+            cursor = 0 if start is None else self._get_cursor(start, self._last_position())
+            rows = self.connection.execute(
+                f"SELECT position, id, time, item FROM {self.name} WHERE position > ? ORDER BY position LIMIT ?",
+                (cursor, -1 if limit is None else limit),
+            ).fetchall()
+            self._set_cursor(start, rows[-1][0] if rows else cursor)
+        return self._load(row[1:] for row in rows)
+
+    def retrieve_new(self):
+        """
+        Retrieves objects that haven't been retrieved without a session before
+
+        :return: a list of objects
+        """
+        with self.lock:
+            cursor = self._get_cursor(None, 0)
+            rows = self.connection.execute(
+                f"SELECT position, id, time, item FROM {self.name} WHERE position > ? ORDER BY position", (cursor,)
+            ).fetchall()
+            self._set_cursor(None, rows[-1][0] if rows else cursor)
+        return self._load(row[1:] for row in rows)
+
+    def retrieve_by_id(self, ids, start=None, limit=None):
+        """
+        Retrieve objects of the given ids from this history. The objects are looked up in the id index.
+
+        :param ids: collection of ids of the objects to retrieve
+        :param start: session key, as for retrieve
+        :param limit: limit (count) of returned results
+        :return: a list of objects in receive order
+        """
+        ids = list(ids)
+        with self.lock:
+            end = self._last_position()
+            cursor = 0 if start is None else self._get_cursor(start, end)
+            rows = self.connection.execute(
+                f"SELECT position, id, time, item FROM {self.name} WHERE id IN ({', '.join('?' * len(ids))}) "
+                "AND position > ? AND position <= ? ORDER BY position LIMIT ?",
+                (*ids, cursor, end, -1 if limit is None else limit),
+            ).fetchall()
+            full = limit is not None and len(rows) >= limit
+            self._set_cursor(start, rows[-1][0] if full else end)
+        return self._load(row[1:] for row in rows)
+
+    def range(self, start_time=None, end_time=None, ids=None, limit=None):
+        """
+        Query the objects within a time range in chronological order. Objects of equal time are in receive order.
+
+        :param start_time: TimeType of the earliest object, None for no lower bound
+        :param end_time: TimeType after which objects are excluded (exclusive), None for no upper bound
+        :param ids: optional collection of ids of the objects to query
+        :param limit: limit (count) of returned results
+        :return: a list of objects
+        """
+        clauses = ["time IS NOT NULL"]
+        parameters = []
+        if start_time is not None:
+            clauses.append("time >= ?")
+            parameters.append(start_time.sort_key.to_bytes(TIME_KEY_BYTES, "big"))
+        if end_time is not None:
+            clauses.append("time < ?")
+            parameters.append(end_time.sort_key.to_bytes(TIME_KEY_BYTES, "big"))
+        if ids is not None:
+            ids = list(ids)
+            clauses.append(f"id IN ({', '.join('?' * len(ids))})")
+            parameters.extend(ids)
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT id, time, item FROM {self.name} WHERE {' AND '.join(clauses)} ORDER BY time, position LIMIT ?",
+                (*parameters, -1 if limit is None else limit),
+            ).fetchall()
+        return self._load(rows)
+
+    def latest(self, item_id):
+        """
+        Accessor for the last received item of the given id
+
+        :param item_id: id of the item
+        :return: the latest item or None when no item of that id was received
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT id, time, item FROM {self.name} WHERE id = ? ORDER BY position DESC LIMIT 1", (item_id,)
+            ).fetchall()
+        items = self._load(rows)
+        return items[0] if items else None
+
+    def latest_items(self):
+        """
+        Accessor for the last received item of every id
+
+        :return: a list of items, one per id
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT id, time, item FROM {self.name} WHERE position IN "
+                f"(SELECT MAX(position) FROM {self.name} GROUP BY id) ORDER BY position"
+            ).fetchall()
+        return self._load(rows)
+
+    def clear(self, start=None):
+        """
+        Forgets the given session. Persisted items are kept, unlike the RAM history, as keeping the full history is the
+        purpose of this history. Use purge to remove items.
+
+        :param start: session key
+        """
+        with self.lock:
+            if start is not None:
+                self.retrieved_cursors.pop(start, None)
+
+    def purge(self, end_time=None):
+        """
+        Removes items persisted in the history
+
+        :param end_time: TimeType before which items are removed, None to remove all items
+        """
+        with self.lock, self.connection:
+            if end_time is None:
+                self.connection.execute(f"DELETE FROM {self.name}")
+            else:
+                self.connection.execute(
+                    f"DELETE FROM {self.name} WHERE time < ?", (end_time.sort_key.to_bytes(TIME_KEY_BYTES, "big"),)
+                )
+            self._size = self.connection.execute(f"SELECT size FROM {self.name}_count").fetchone()[0]
+
+    def size(self):
+        """
+        Accessor for the number of objects in the history
+
+        :return: the number of objects (int)
+        """
+        with self.lock:
+            return self._size
+
+    def close(self):
+        """Close the database"""
+        with self.lock:
+            self.connection.close()
+
+    def _get_cursor(self, start, default):
+        """Position of the last item retrieved by a session, default for unknown sessions"""
+        return self.retrieved_cursors.get(start, default)
+
+    def _set_cursor(self, start, position):
+        """Record the position of the last item retrieved by a session"""
+        self.retrieved_cursors[start] = position
+
+    def _last_position(self):
+        """Position of the last stored item"""
+        return self._end
+
+    def _load(self, rows):
+        """
+        Load items from their stored rows of id, time and record. Records that no longer decode (e.g. of an unsupported
+        version, or of items no longer in the dictionaries) are skipped.
+
+        :param rows: iterable of stored rows
+        :return: a list of items
+        """
+        items = []
+        for item_id, time_key, record in rows:
+            try:
+                items.append(self.records.decode(item_id, time_key, record))
+            except (KeyError, ValueError, struct.error, TypeException, DecodingException) as exc:
+                LOGGER.warning("Skipping stored item %s of history %s: %s", item_id, self.name, exc)
+        return items
+
+
+class SharedSqliteHistory(SqliteHistory):
+    """
+    History shared by the processes opening the same database. Typically one process (the standalone pipeline) stores
+    the items while any number of processes (web workers) read them. Sessions are kept in the database such that any
+    process may serve any session, and sessions idle for longer than the clear time (see set_clear_time) are removed.
+
+    Items stored by other processes do not pass through this process. Listeners are thus set by a thread watching the
+    database for new items while listeners are registered.
+    """
+
+    # Seconds between checks of the database for new items while listeners are registered
+    WATCH_INTERVAL = 0.1
+
+    def __init__(self, database=":memory:", name="history", dictionaries=None):
+        """
+        Constructor opening (or creating) the history and its sessions in the database
+
+        :param database: path to the database file, ":memory:" for a database that is not persisted
+        :param name: name of the history, used as table name. Only letters, digits and underscores are permitted.
+        :param dictionaries: dictionaries whose templates decode the stored items
+        """
+        super().__init__(database, name, dictionaries)
+        self.clear_time = -1
+        self._listeners = set()
+        self._watcher = None
+        with self.lock, self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {name}_sessions (session TEXT PRIMARY KEY, position INTEGER, updated REAL)"
+            )
+
+    def set_clear_time(self, clear_time):
+        """
+        Update the time after which idle sessions are removed
+
+        :param clear_time: seconds of inactivity, negative to keep sessions
+        """
+        self.clear_time = clear_time
+
+    def clear(self, start=None):
+        """
+        Forgets the given session and the sessions idle for longer than the clear time. Persisted items are kept.
+
+        :param start: session key
+        """
+        with self.lock, self.connection:
+            if start is not None:
+                self.connection.execute(f"DELETE FROM {self.name}_sessions WHERE session = ?", (str(start),))
+            if self.clear_time > 0:
+                self.connection.execute(
+                    f"DELETE FROM {self.name}_sessions WHERE updated < ?", (time.time() - self.clear_time,)
+                )
+
+    def size(self):
+        """
+        Accessor for the number of objects in the history, including those stored by other processes
+
+        :return: the number of objects (int)
+        """
+        with self.lock:
+            return self.connection.execute(f"SELECT size FROM {self.name}_count").fetchone()[0]
+
+    def register_listener(self, listener):
+        """
+        Register a listener set when new items are stored by any process
+
+        :param listener: threading.Event to set
+        """
+        with self.lock:
+            self._listeners.add(listener)
+            if self._watcher is None:
+                self._watcher = threading.Thread(
+                    target=self._watch, args=(self._last_position(),), name=f"{self.name}-watcher", daemon=True
+                )
+                self._watcher.start()
+
+    def remove_listener(self, listener):
+        """
+        Remove a listener previously registered. The watching thread stops with the last listener.
+
+        :param listener: threading.Event to remove
+        """
+        with self.lock:
+            self._listeners.discard(listener)
+
+    def _watch(self, last):
+        """
+        Set the listeners whenever the last stored position moves, until no listeners remain
+
+        :param last: last stored position when the listeners were registered
+        """
+        while True:
+            time.sleep(self.WATCH_INTERVAL)
+            with self.lock:
+                if not self._listeners:
+                    self._watcher = None
+                    return
+                position = self._last_position()
+                if position != last:
+                    last = position
+                    for listener in self._listeners:
+                        listener.set()
+
+    def _get_cursor(self, start, default):
+        """Position of the last item retrieved by a session, default for unknown sessions"""
+        row = self.connection.execute(
+            f"SELECT position FROM {self.name}_sessions WHERE session = ?", ("" if start is None else str(start),)
+        ).fetchone()
+        return default if row is None else row[0]
+
+    def _set_cursor(self, start, position):
+        """Record the position of the last item retrieved by a session"""
+        with self.connection:
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO {self.name}_sessions (session, position, updated) VALUES (?, ?, ?)",
+                ("" if start is None else str(start), position, time.time()),
+            )
+
+    def _last_position(self):
+        """Position of the last item stored by any process"""
+        return self.connection.execute(f"SELECT COALESCE(MAX(position), 0) FROM {self.name}").fetchone()[0]
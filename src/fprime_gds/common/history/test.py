@@ -6,6 +6,10 @@ retrieval operations
 
 :author: koran
 """
+import bisect
+import heapq
+import itertools
+
 from fprime_gds.common.history.history import History
 from fprime_gds.common.testing_fw import predicates
 
@@ -14,6 +18,9 @@ class TestHistory(History):
     """
     A receive-ordered history to support the GDS test api. This history adds support for specifying
     start with predicates and python's bracket notation.
+
+    The history may keep an id index: the absolute receive positions of the items of each id. This
+    serves retrieve_by_id and latest without scanning the whole history.
     """
 
     __test__ = False
@@ -21,15 +28,19 @@ class TestHistory(History):
     #   History Functions
     ###########################################################################
 
-    def __init__(self, filter_pred=None):
+    def __init__(self, filter_pred=None, id_index=False):
         """
         Constructor used to set-up history. If the history is given a filter, it will ignore (drop)
         objects that don't satisfy the filter predicate.
 
         Args:
             filter_pred: an optional predicate to filter incoming data_objects
+            id_index: True to keep an index of the objects of each id
         """
         self.objects = []
+        self.id_index = {} if id_index else None
+        # Absolute receive position of self.objects[0]
+        self.__base = 0
 
         self.filter = predicates.always_true()
         if filter_pred is not None:
@@ -49,6 +60,10 @@ class TestHistory(History):
             data: object to store
         """
         if self.filter(data):
+            if self.id_index is not None:
+                self.id_index.setdefault(getattr(data, "id", None), []).append(
+                    self.__base + len(self.objects)
+                )
             self.objects.append(data)
 
     def retrieve(self, start=None):
@@ -67,6 +82,40 @@ class TestHistory(History):
         self.retrieved_cursor = self.size()
         return self.objects[index:]
 
+    def retrieve_by_id(self, ids, start=None, limit=None):
+        """
+        Retrieve objects of the given ids from this history. With an id index, retrievals from the beginning or from an
+        index are served from the index. Other retrievals filter the output of retrieve.
+
+        Args:
+            ids: collection of ids of the objects to retrieve
+            start: optional first object to retrieve. can either be an index (int) or a predicate.
+            limit: optional maximum count of objects to retrieve
+        Returns:
+            a list of objects in receive order
+        """
+        if self.id_index is None or predicates.is_predicate(start) or (start is not None and start < 0):
+            return super().retrieve_by_id(ids, start)[:limit]
+        first = self.__base + (start or 0)
+        positions = heapq.merge(*(self.id_index.get(item_id, []) for item_id in ids))
+        self.retrieved_cursor = self.size()
+        items = (self.objects[position - self.__base] for position in positions if position >= first)
+        return list(itertools.islice(items, limit))
+
+    def latest(self, item_id):
+        """
+        Accessor for the last received object of the given id
+
+        Args:
+            item_id: id of the object
+        Returns:
+            the latest object or None when the history holds no object of that id
+        """
+        if self.id_index is not None:
+            positions = self.id_index.get(item_id)
+            return self.objects[positions[-1] - self.__base] if positions else None
+        return next((item for item in reversed(self.objects) if getattr(item, "id", None) == item_id), None)
+
     def retrieve_new(self):
         """
         Retrieves a chronological order of objects that haven't been accessed through retrieve or
@@ -96,7 +145,15 @@ class TestHistory(History):
         self.retrieved_cursor -= index
         self.retrieved_cursor = max(self.retrieved_cursor, 0)
 
+        size = self.size()
         del self.objects[:index]
+        self.__base += size - self.size()
+        if self.id_index is not None:
+            for item_id in list(self.id_index):
+                positions = self.id_index[item_id]
+                del positions[: bisect.bisect_left(positions, self.__base)]
+                if not positions:
+                    del self.id_index[item_id]
 
     def size(self):
         """
@@ -4,6 +4,10 @@ Created on May 29, 2020
 @author: jishii
 """
 
+import array
+import sys
+
+from .numerical_types import NumericalType
 from .type_base import DictionaryType
 from .type_exceptions import (
     ArrayLengthException,
@@ -17,8 +21,16 @@ class ArrayType(DictionaryType):
     """Generic fixed-size array type representation.
 
     Represents a custom named type of a fixed number of like members, each of which are other types in the system.
+
+    Arrays of numerical members are deserialized in bulk into a compact array.array of python values. Member objects
+    are only created when the members themselves are accessed (e.g. by iteration or through _val).
     """
 
+    __slots__ = ("_values", "_items")
+
+    # array.array typecode used to decode numerical members in bulk, None for other member types
+    _BULK_TYPECODE = None
+
     @classmethod
     def construct_type(cls, name, member_type, length, format):
         """Constructs a sub-array type
@@ -32,9 +44,55 @@ class ArrayType(DictionaryType):
             length: length of the array subtype
             format: format string for members of the array subtype
         """
-        return DictionaryType.construct_type(
-            cls, name, MEMBER_TYPE=member_type, LENGTH=length, FORMAT=format
+        construct = DictionaryType.construct_type(
+            cls,
+            name,
+            MEMBER_TYPE=member_type,
+            LENGTH=length,
+            FORMAT=format,
+            FIXED_SIZE=(
+                None if member_type.FIXED_SIZE is None else member_type.FIXED_SIZE * length
+            ),
         )
+        if issubclass(member_type, NumericalType):
+            typecode = member_type.get_serialize_format().lstrip(">")
+            # Bulk decoding is only possible when the platform's array item matches the serialized size
+            if array.array(typecode).itemsize == member_type.getSize():
+                construct._BULK_TYPECODE = typecode
+        return construct
+
+    def __init__(self, val=None):
+        """Defines the compact storage of the array values"""
+        self._values = None
+        self._items = None
+        super().__init__(val)
+
+    def _wrap(self, values):
+        """Wrap compactly stored values into member objects"""
+        members = []
+        for value in values:
+            member = self.MEMBER_TYPE()
+            # Decoded values are in range by construction, skip the validating setter
+            member._val = value
+            members.append(member)
+        return members
+
+    @property
+    def _val(self):
+        """
+        Member objects of the array, wrapping compactly stored values on first access. Once wrapped, the members are
+        the only storage of the array such that modifications of the members are reflected in the array.
+        """
+        if self._values is not None:
+            self._items = self._wrap(self._values)
+            self._values = None
+        return self._items
+
+    @_val.setter
+    def _val(self, members):
+        """Set the member objects of the array, replacing any compactly stored values"""
+        self._items = members
+        self._values = None
 
     @classmethod
     def validate(cls, val):
@@ -54,6 +112,8 @@ class ArrayType(DictionaryType):
 
         :return dictionary of member names to python values of member keys
         """
+        if self._values is not None:
+            return self._values.tolist()
         return None if self._val is None else [item.val for item in self._val]
 
     @property
@@ -64,6 +124,8 @@ class ArrayType(DictionaryType):
         Note 2: If a member is a serializable will call serializable formatted_val
         :return a formatted array
         """
+        if self._values is not None:
+            return [self.FORMAT.format(value) for value in self._values]
         result = []
         for item in self._val:
             if hasattr(item, "formatted_val"):
@@ -82,39 +144,52 @@ class ArrayType(DictionaryType):
         :param val: dictionary containing python types to key names. This
         """
         self.validate(val)
-        items = [self.MEMBER_TYPE(item) for item in val]
-        self._val = items
+        self._val = [self.MEMBER_TYPE(item) for item in val]
+
+    def __eq__(self, other):
+        """Check equality between arrays regardless of how their values are stored"""
+        return False if type(other) != type(self) else self.val == other.val
 
     def to_jsonable(self):
         """
         JSONable array object format
         """
+        # Compactly stored values are wrapped for the occasion, keeping the compact storage
+        members = self._val if self._values is None else self._wrap(self._values)
         return {
             "name": self.__class__.__name__,
             "type": self.__class__.__name__,
             "size": self.LENGTH,
             "format": self.FORMAT,
             "values": (
-                None
-                if self._val is None
-                else [member.to_jsonable() for member in self._val]
+                None if members is None else [member.to_jsonable() for member in members]
             ),
         }
 
     def serialize(self):
         """Serialize the array by serializing the elements one by one"""
+        if self._values is not None:
+            values = array.array(self._BULK_TYPECODE, self._values)
+            if sys.byteorder == "little":
+                values.byteswap()
+            return values.tobytes()
         if self.val is None:
             raise NotInitializedException(type(self))
         return b"".join([item.serialize() for item in self._val])
 
     def deserialize(self, data, offset):
         """Deserialize the members of the array"""
+        if self._BULK_TYPECODE is not None:
+            self._deserialize_bulk(data, offset)
+            return
         values = []
         for field_index in range(self.LENGTH):
             try:
                 item = self.MEMBER_TYPE()
                 item.deserialize(data, offset)
-                offset += item.getSize()
+                offset += (
+                    item.getSize() if self.MEMBER_TYPE.FIXED_SIZE is None else self.MEMBER_TYPE.FIXED_SIZE
+                )
                 values.append(item)
             except Exception as exc:
                 raise DeserializeException(
@@ -122,8 +197,26 @@ class ArrayType(DictionaryType):
                 )
         self._val = values
 
+    def _deserialize_bulk(self, data, offset):
+        """Deserialize all numerical members of the array at once into compact storage"""
+        size = self.FIXED_SIZE
+        available = len(data) - offset
+        if offset < 0 or available < size:
+            raise DeserializeException(
+                f"Array needs {size} bytes to deserialize, found {max(available, 0)}"
+            )
+        values = array.array(self._BULK_TYPECODE)
+        values.frombytes(memoryview(data)[offset : offset + size])
+        # Serialized data is big-endian, array.array uses the native order
+        if sys.byteorder == "little":
+            values.byteswap()
+        self._items = None
+        self._values = values
+
     def getSize(self):
         """Return the size in bytes of the array"""
+        if self.FIXED_SIZE is not None:
+            return self.FIXED_SIZE
         return sum(item.getSize() for item in self._val)
 
     @classmethod
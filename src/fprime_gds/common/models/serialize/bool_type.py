@@ -21,6 +21,10 @@ class BoolType(ValueType):
     is stored as a U8 of 0x00.
     """
 
+    __slots__ = ()
+
+    FIXED_SIZE = struct.calcsize("B")
+
     @classmethod
     def validate(cls, val):
         """Validate the given class"""
@@ -54,7 +58,7 @@ class BoolType(ValueType):
 
     @classmethod
     def getSize(cls):
-        return struct.calcsize("B")
+        return cls.FIXED_SIZE
 
     @classmethod
     def getMaxSize(cls):
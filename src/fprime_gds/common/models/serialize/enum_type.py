@@ -31,6 +31,8 @@ class EnumType(DictionaryType):
     containing code based on C enum rules
     """
 
+    __slots__ = ()
+
     @classmethod
     def construct_type(cls, name, enum_dict, rep_type="I32"):
         """Construct the custom enum type
@@ -63,7 +65,11 @@ class EnumType(DictionaryType):
                 )
 
         return DictionaryType.construct_type(
-            cls, name, ENUM_DICT=enum_dict, REP_TYPE=rep_type
+            cls,
+            name,
+            ENUM_DICT=enum_dict,
+            REP_TYPE=rep_type,
+            FIXED_SIZE=REPRESENTATION_TYPE_MAP[rep_type].FIXED_SIZE,
         )
 
     @classmethod
@@ -88,6 +94,11 @@ class EnumType(DictionaryType):
         """
         return list(cls.ENUM_DICT.values())
 
+    @classmethod
+    def get_serialize_format(cls):
+        """Gets the format serialization string of the representation type such that the enum can be read via struct"""
+        return REPRESENTATION_TYPE_MAP[cls.REP_TYPE].get_serialize_format()
+
     def serialize(self):
         """
         Serialize the enumeration type using an int type
@@ -98,9 +109,8 @@ class EnumType(DictionaryType):
             self._val == "UNDEFINED" and "UNDEFINED" not in self.ENUM_DICT
         ):
             raise NotInitializedException(type(self))
-        return struct.pack(
-            REPRESENTATION_TYPE_MAP[self.REP_TYPE].get_serialize_format(),
-            self.ENUM_DICT[self._val],
+        return REPRESENTATION_TYPE_MAP[self.REP_TYPE].STRUCT.pack(
+            self.ENUM_DICT[self._val]
         )
 
     def deserialize(self, data, offset):
@@ -108,14 +118,12 @@ class EnumType(DictionaryType):
         Deserialize the enumeration using an int type
         """
         try:
-            int_val = struct.unpack_from(
-                REPRESENTATION_TYPE_MAP[self.REP_TYPE].get_serialize_format(),
-                data,
-                offset,
+            int_val = REPRESENTATION_TYPE_MAP[self.REP_TYPE].STRUCT.unpack_from(
+                data, offset
             )[0]
 
         except struct.error:
-            msg = f"Could not deserialize enum value. Needed: {self.getSize()} bytes Found: {len(data[offset:])}"
+            msg = f"Could not deserialize enum value. Needed: {self.getSize()} bytes Found: {max(len(data) - offset, 0)}"
             raise DeserializeException(msg)
         for key, val in self.ENUM_DICT.items():
             if int_val == val:
@@ -127,16 +135,12 @@ class EnumType(DictionaryType):
 
     def getSize(self):
         """Calculates the size based on the size of an integer used to store it"""
-        return struct.calcsize(
-            REPRESENTATION_TYPE_MAP[self.REP_TYPE].get_serialize_format()
-        )
+        return self.FIXED_SIZE
 
     @classmethod
     def getMaxSize(cls):
         """Maximum size of type"""
-        return struct.calcsize(
-            REPRESENTATION_TYPE_MAP[cls.REP_TYPE].get_serialize_format()
-        )
+        return cls.FIXED_SIZE
 
     @classmethod
     def from_int(cls, val: int) -> "EnumType":
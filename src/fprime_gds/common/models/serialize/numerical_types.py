@@ -22,6 +22,20 @@ from .type_exceptions import (
 class NumericalType(ValueType, abc.ABC):
     """Numerical types that can be serialized using struct and are of some power of 2 byte width"""
 
+    __slots__ = ()
+
+    # Precompiled struct codec of the concrete type, None for abstract types
+    STRUCT = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Precompiles the struct codec of each concrete numerical type once at class definition"""
+        super().__init_subclass__(**kwargs)
+        try:
+            cls.STRUCT = struct.Struct(cls.get_serialize_format())
+            cls.FIXED_SIZE = cls.STRUCT.size
+        except NotImplementedError:
+            cls.STRUCT = None
+
     @classmethod
     def get_canonical_name(cls):
         """Returns the fprime C++ name for the type"""
@@ -34,8 +48,8 @@ class NumericalType(ValueType, abc.ABC):
 
     @classmethod
     def getSize(cls):
-        """Gets the size of the integer based on the size specified in the class name"""
-        return int(cls.get_bits() >> 3)  # Divide by 8 quickly
+        """Gets the size of the type from its struct codec"""
+        return cls.STRUCT.size
 
     @classmethod
     def getMaxSize(cls):
@@ -52,19 +66,38 @@ class NumericalType(ValueType, abc.ABC):
         """Serializes this type using struct and the val property"""
         if self._val is None:
             raise NotInitializedException(type(self))
-        return struct.pack(self.get_serialize_format(), self._val)
+        return self.STRUCT.pack(self._val)
 
     def deserialize(self, data, offset):
         """Serializes this type using struct and the val property"""
         try:
-            self._val = struct.unpack_from(self.get_serialize_format(), data, offset)[0]
+            self._val = self.STRUCT.unpack_from(data, offset)[0]
         except struct.error as err:
             raise DeserializeException(str(err))
 
+    @classmethod
+    def deserialize_from(cls, data, offset):
+        """Deserializes a python value of this type from data at offset without constructing a type object
+
+        This is the fast path used by decoders and encoders. Callers are expected to have checked that enough data is
+        available: a short buffer raises struct.error rather than DeserializeException.
+
+        Args:
+            data: binary data containing the value
+            offset: index in data where the value starts
+
+        Returns:
+            tuple of the python value and the offset just past the value
+        """
+        codec = cls.STRUCT
+        return codec.unpack_from(data, offset)[0], offset + codec.size
+
 
 class IntegerType(NumericalType, abc.ABC):
     """Base class that represents all integer common functions"""
 
+    __slots__ = ()
+
     @classmethod
     @abc.abstractmethod
     def range(cls):
@@ -83,6 +116,8 @@ class IntegerType(NumericalType, abc.ABC):
 class FloatType(NumericalType, abc.ABC):
     """Base class that represents all float common functions"""
 
+    __slots__ = ()
+
     @classmethod
     def validate(cls, val):
         """Validates the given integer."""
@@ -93,6 +128,8 @@ class FloatType(NumericalType, abc.ABC):
 class I8Type(IntegerType):
     """Single byte integer type. Represents C chars"""
 
+    __slots__ = ()
+
     @classmethod
     def range(cls):
         """Gets signed/unsigned of this type"""
@@ -112,6 +149,8 @@ class I8Type(IntegerType):
 class I16Type(IntegerType):
     """Double byte integer type. Represents C shorts"""
 
+    __slots__ = ()
+
     @classmethod
     def range(cls):
         """Gets signed/unsigned of this type"""
@@ -131,6 +170,8 @@ class I16Type(IntegerType):
 class I32Type(IntegerType):
     """Four byte integer type. Represents C int32_t,"""
 
+    __slots__ = ()
+
     @classmethod
     def range(cls):
         """Gets signed/unsigned of this type"""
@@ -150,6 +191,8 @@ class I32Type(IntegerType):
 class I64Type(IntegerType):
     """Eight byte integer type. Represents C int64_t,"""
 
+    __slots__ = ()
+
     @classmethod
     def range(cls):
         """Gets signed/unsigned of this type"""
@@ -169,6 +212,8 @@ class I64Type(IntegerType):
 class U8Type(IntegerType):
     """Single byte integer type. Represents C chars"""
 
+    __slots__ = ()
+
     @classmethod
     def range(cls):
         """Gets signed/unsigned of this type"""
@@ -188,6 +233,8 @@ class U8Type(IntegerType):
 class U16Type(IntegerType):
     """Double byte integer type. Represents C shorts"""
 
+    __slots__ = ()
+
     @classmethod
     def range(cls):
         """Gets signed/unsigned of this type"""
@@ -207,6 +254,8 @@ class U16Type(IntegerType):
 class U32Type(IntegerType):
     """Four byte integer type. Represents C unt32_t,"""
 
+    __slots__ = ()
+
     @classmethod
     def range(cls):
         """Gets signed/unsigned of this type"""
@@ -226,6 +275,8 @@ class U32Type(IntegerType):
 class U64Type(IntegerType):
     """Eight byte integer type. Represents C unt64_t,"""
 
+    __slots__ = ()
+
     @classmethod
     def range(cls):
         """Gets signed/unsigned of this type"""
@@ -245,6 +296,8 @@ class U64Type(IntegerType):
 class F32Type(FloatType):
     """Eight byte integer type. Represents C unt64_t,"""
 
+    __slots__ = ()
+
     @classmethod
     def get_bits(cls):
         """Get the bit count of this type"""
@@ -259,6 +312,8 @@ class F32Type(FloatType):
 class F64Type(FloatType):
     """Eight byte integer type. Represents C unt64_t,"""
 
+    __slots__ = ()
+
     @classmethod
     def get_bits(cls):
         """Get the bit count of this type"""
@@ -5,6 +5,10 @@ Created on Dec 18, 2014
 
 """
 
+import struct
+
+from .enum_type import EnumType, REPRESENTATION_TYPE_MAP
+from .numerical_types import NumericalType
 from .type_base import BaseType, DictionaryType
 from .type_exceptions import (
     IncorrectMembersException,
@@ -29,6 +33,8 @@ class SerializableType(DictionaryType):
     The member descriptions can be None
     """
 
+    __slots__ = ()
+
     @classmethod
     def construct_type(cls, name, member_list):
         """Construct a new serializable sub-type
@@ -55,7 +61,18 @@ class SerializableType(DictionaryType):
                 raise TypeMismatchException(str, type(format_string))
             if description is not None and not isinstance(description, str):
                 raise TypeMismatchException(str, type(description))
-        return DictionaryType.construct_type(cls, name, MEMBER_LIST=member_list)
+        member_sizes = [member_type.FIXED_SIZE for _, member_type, _, _ in member_list]
+        construct = DictionaryType.construct_type(
+            cls,
+            name,
+            MEMBER_LIST=member_list,
+            FIXED_SIZE=None if None in member_sizes else sum(member_sizes),
+        )
+        # Redefinitions hand back the originally constructed type, which already carries its generated codec
+        if "deserialize" not in construct.__dict__:
+            for method_name, method in _generate_codec(construct.MEMBER_LIST).items():
+                setattr(construct, method_name, method)
+        return construct
 
     @classmethod
     def validate(cls, val):
@@ -148,6 +165,8 @@ class SerializableType(DictionaryType):
 
     def getSize(self):
         """The size of a struct is the size of all the members"""
+        if self.FIXED_SIZE is not None:
+            return self.FIXED_SIZE
         return sum(self._val.get(name).getSize() for name, _, _, _ in self.MEMBER_LIST)
 
     @classmethod
@@ -179,3 +198,125 @@ class SerializableType(DictionaryType):
                 yield member_name, self._val.get(member_name)
 
         return items_generator()
+
+
+# Generated codecs keyed by member layout, shared by every type (and every dictionary load) with that layout
+_GENERATED_CODECS = {}
+
+
+def _fixed_member_codec(member_type):
+    """Returns (struct format, value-to-raw map, raw-to-value map) of a member packable in a shared struct or None
+
+    Numerical members pack their value directly. Enumerations pack through their representation type and map between
+    member names and values. Other members (strings, booleans, arrays, nested serializables) use their own codec.
+    """
+    if issubclass(member_type, NumericalType) and member_type.STRUCT is not None:
+        return member_type.STRUCT.format, None, None
+    if issubclass(member_type, EnumType):
+        # Reversed such that the first name wins for duplicated values, as in EnumType.deserialize
+        by_value = {value: name for name, value in reversed(member_type.ENUM_DICT.items())}
+        return REPRESENTATION_TYPE_MAP[member_type.REP_TYPE].STRUCT.format, member_type.ENUM_DICT, by_value
+    return None
+
+
+def _generate_codec(member_list):
+    """Generate specialized serialize, deserialize, and getSize methods for a serializable member layout
+
+    Consecutive constant-size members are packed into a single struct.Struct read at a fixed offset relative to the
+    preceding variable-size member. Variable-size members delegate to their own serialize/deserialize. Whenever the fast
+    path fails the generic SerializableType implementation is run instead, from the offset the call started at, such
+    that error reporting is unchanged.
+
+    Args:
+        member_list: normalized MEMBER_LIST of (name, type, format, description) tuples
+    Returns:
+        dictionary of method name to generated function
+    """
+    layout = tuple((member_name, member_type) for member_name, member_type, _, _ in member_list)
+    codec = _GENERATED_CODECS.get(layout)
+    if codec is not None:
+        return codec
+
+    namespace = {
+        "_new": object.__new__,
+        "_generic_serialize": SerializableType.serialize,
+        "_generic_deserialize": SerializableType.deserialize,
+        "_generic_get_size": SerializableType.getSize,
+    }
+    # Group members into runs of fixed-size members (as structs) separated by variable-size members
+    runs = []
+    for index, (member_name, member_type) in enumerate(layout):
+        namespace[f"T{index}"] = member_type
+        fixed = _fixed_member_codec(member_type)
+        if fixed is None:
+            runs.append((None, [(index, member_name, member_type)]))
+            continue
+        fmt, to_raw, from_raw = fixed
+        if to_raw is not None:
+            namespace[f"R{index}"], namespace[f"V{index}"] = to_raw, from_raw
+        if not runs or runs[-1][0] is None:
+            runs.append(("", []))
+        runs[-1] = (runs[-1][0] + fmt.lstrip("<>!=@"), runs[-1][1] + [(index, member_name, member_type)])
+
+    deserialize_lines = []
+    serialize_parts = []
+    fixed_size = 0
+    variable_sizes = []
+    for run_index, (fmt, members) in enumerate(runs):
+        if fmt is None:
+            index, member_name, member_type = members[0]
+            deserialize_lines += [
+                f"m{index} = T{index}()",
+                f"m{index}.deserialize(data, offset)",
+            ]
+            serialize_parts.append(f"val[{member_name!r}].serialize()")
+            if member_type.FIXED_SIZE is None:
+                deserialize_lines.append(f"offset += m{index}.getSize()")
+                variable_sizes.append(f"val[{member_name!r}].getSize()")
+            else:
+                deserialize_lines.append(f"offset += {member_type.FIXED_SIZE}")
+                fixed_size += member_type.FIXED_SIZE
+            continue
+        codec_struct = struct.Struct(">" + fmt)
+        namespace[f"S{run_index}"] = codec_struct
+        raw_names = ", ".join(f"v{index}" for index, _, _ in members)
+        deserialize_lines.append(f"{raw_names}, = S{run_index}.unpack_from(data, offset)")
+        packed = []
+        for index, member_name, _ in members:
+            mapped = f"V{index}[v{index}]" if f"V{index}" in namespace else f"v{index}"
+            deserialize_lines += [f"m{index} = _new(T{index})", f"m{index}._val = {mapped}"]
+            raw = f"val[{member_name!r}]._val"
+            packed.append(f"R{index}[{raw}]" if f"R{index}" in namespace else raw)
+        deserialize_lines.append(f"offset += {codec_struct.size}")
+        serialize_parts.append(f"S{run_index}.pack({', '.join(packed)})")
+        fixed_size += codec_struct.size
+
+    members_dict = ", ".join(f"{member_name!r}: m{index}" for index, (member_name, _) in enumerate(layout))
+    body = "\n".join(f"        {line}" for line in deserialize_lines or ["pass"])
+    source = f"""
+def deserialize(self, data, offset):
+    start = offset
+    try:
+{body}
+    except Exception:
+        return _generic_deserialize(self, data, start)
+    self._val = {{{members_dict}}}
+
+def serialize(self):
+    val = self._val
+    try:
+        return b"".join(({"".join(f"{part}, " for part in serialize_parts)}))
+    except Exception:
+        return _generic_serialize(self)
+
+def getSize(self):
+    val = self._val
+    try:
+        return {" + ".join([str(fixed_size)] + variable_sizes)}
+    except Exception:
+        return _generic_get_size(self)
+"""
+    exec(compile(source, f"<serializable codec {'/'.join(name for name, _ in layout)}>", "exec"), namespace)
+    codec = {name: namespace[name] for name in ("serialize", "deserialize", "getSize")}
+    _GENERATED_CODECS[layout] = codec
+    return codec
@@ -29,6 +29,8 @@ class StringType(type_base.DictionaryType):
     All string types follow this implementation, but have some specific type-based properties: MAX_LENGTH.
     """
 
+    __slots__ = ()
+
     MAX_LENGTH: int  # for type hinting
 
     @classmethod
@@ -55,33 +57,29 @@ class StringType(type_base.DictionaryType):
         if self.MAX_LENGTH is not None and len(self.val) > self.MAX_LENGTH:
             raise StringSizeException(len(self.val), self.MAX_LENGTH)
         # Pack the string size first then return the encoded data buffer
-        return struct.pack(
-            ConfigManager().get_type("FwSizeStoreType").get_serialize_format(),
-            len(self.val.encode(DATA_ENCODING)),
-        ) + self.val.encode(DATA_ENCODING)
+        encoded = self.val.encode(DATA_ENCODING)
+        return ConfigManager().get_type("FwSizeStoreType").STRUCT.pack(
+            len(encoded)
+        ) + encoded
 
     def deserialize(self, data, offset):
         """
-        Deserializes a string from the given data buffer.
+        Deserializes a string from the given data buffer. The buffer may be any bytes-like object (e.g. a memoryview),
+        only the decoded string is copied out of it.
         """
         FwSizeStoreType: type[IntegerType] = ConfigManager().get_type("FwSizeStoreType")  # type: ignore
         try:
-            val_size, = struct.unpack_from(
-                FwSizeStoreType.get_serialize_format(), data, offset
-            )
+            val_size, = FwSizeStoreType.STRUCT.unpack_from(data, offset)
+            start = offset + FwSizeStoreType.getSize()
             # Deal with not enough data left in the buffer
-            if len(data[offset + FwSizeStoreType.getSize() :]) < val_size:
-                msg = f"Not enough data to deserialize string data. Needed: {val_size} Left: {len(data[offset + FwSizeStoreType.getSize():])}"
+            available = max(len(data) - start, 0)
+            if available < val_size:
+                msg = f"Not enough data to deserialize string data. Needed: {val_size} Left: {available}"
                 raise DeserializeException(msg)
             # Deal with a string that is larger than max string
             if self.MAX_LENGTH is not None and val_size > self.MAX_LENGTH:
                 raise StringSizeException(val_size, self.MAX_LENGTH)
-            self.val = data[
-                offset
-                + FwSizeStoreType.getSize() : offset
-                + FwSizeStoreType.getSize()
-                + val_size
-            ].decode(DATA_ENCODING)
+            self.val = str(memoryview(data)[start : start + val_size], DATA_ENCODING)
         except struct.error:
             raise DeserializeException("Not enough bytes to deserialize string length.")
 
@@ -89,16 +87,9 @@ class StringType(type_base.DictionaryType):
         """
         Get the size of this object
         """
-        return struct.calcsize(
-            ConfigManager().get_type("FwSizeStoreType").get_serialize_format()
-        ) + len(self.val)
+        return ConfigManager().get_type("FwSizeStoreType").getSize() + len(self.val)
 
     @classmethod
     def getMaxSize(cls):
         """Get maximum size of the type"""
-        return (
-            struct.calcsize(
-                ConfigManager().get_type("FwSizeStoreType").get_serialize_format()
-            )
-            + cls.MAX_LENGTH
-        )
+        return ConfigManager().get_type("FwSizeStoreType").getSize() + cls.MAX_LENGTH
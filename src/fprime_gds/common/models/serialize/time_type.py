@@ -19,6 +19,7 @@ time tags sent with serialized data in the fprime architecture.
 
 import datetime
 import math
+import struct
 
 from fprime_gds.common.utils.config_manager import ConfigManager
 from fprime_gds.common.models.serialize import type_base
@@ -27,7 +28,10 @@ from fprime_gds.common.models.serialize import type_base
 from fprime_gds.common.models.serialize.numerical_types import U8Type, U32Type
 
 from fprime_gds.common.models.serialize.enum_type import EnumType
-from fprime_gds.common.models.serialize.type_exceptions import TypeRangeException
+from fprime_gds.common.models.serialize.type_exceptions import (
+    DeserializeException,
+    TypeRangeException,
+)
 
 from typing import Optional, Union
 
@@ -38,11 +42,19 @@ class TimeType(type_base.BaseType):
     Used to parse, store, and create human readable versions of the time tags
     included in serialized output from fprime_gds systems
 
+    Time fields are stored as plain integers alongside a precomputed integer sort key. Sub-objects (e.g. the time base
+    enumeration) are built on demand when accessed through the properties.
+
     Note: comparisons support comparing to numbers or other instances of TimeType. If comparing to
     another TimeType, these comparisons use the provided compare method. See TimeType.compare for
     a description of this behavior.  See comparison functions at the end.
     """
 
+    __slots__ = ("_base", "_context", "_seconds", "_useconds", "_key")
+
+    # Serialization structs keyed by the configured (time base, time context) types
+    _STRUCTS = {}
+
     @staticmethod
     def TimeBase(enum_constant: str) -> EnumType:
         """Constructs a TimeBase instance (EnumType) from a string constant, as defined in the
@@ -93,11 +105,74 @@ class TimeType(type_base.BaseType):
 
         self._check_time_base(enum_time_base)
         self._check_useconds(useconds)
+        ConfigManager().get_type("FwTimeContextStoreType").validate(time_context)
+        U32Type.validate(seconds)
+        U32Type.validate(useconds)
+
+        self._set_fields(enum_time_base.numeric_value, time_context, seconds, useconds)
+
+    @classmethod
+    def from_fields(cls, time_base: int, time_context: int, seconds: int, useconds: int) -> "TimeType":
+        """
+        Constructs a time type directly from its numeric fields (e.g. as decoded by a struct)
+
+        Only the time base is checked, as all other fields are in range by construction when decoded. This is the
+        constructor used by the decoders.
+
+        Args:
+            time_base (int): numeric value of the time base
+            time_context (int): time context
+            seconds (int): seconds elapsed since the time base
+            useconds (int): microseconds since start of current second
+
+        Returns:
+            A new TimeType object
+        """
+        if time_base not in ConfigManager().get_type("TimeBase").ENUM_DICT.values():
+            raise TypeRangeException(time_base)
+        time = cls.__new__(cls)
+        time._set_fields(time_base, time_context, seconds, useconds)
+        return time
+
+    @classmethod
+    def from_buffer(cls, data, offset) -> "TimeType":
+        """
+        Constructs a time type deserialized from data starting at offset
+
+        Args:
+            data: binary data containing the time tag
+            offset: Index in data where time tag starts
+
+        Returns:
+            A new TimeType object
+        """
+        time = cls.__new__(cls)
+        time.deserialize(data, offset)
+        return time
+
+    def _set_fields(self, time_base: int, time_context: int, seconds: int, useconds: int):
+        """
+        Sets all fields and the sort key of this time
 
-        self.__timeBase = enum_time_base
-        self.__timeContext = ConfigManager().get_type("FwTimeContextStoreType")(time_context)
-        self.__secs = U32Type(seconds)
-        self.__usecs = U32Type(useconds)
+        The sort key orders times by time base, seconds, useconds and then time context. Each field is shifted over the
+        width of the fields of lesser significance (32 bits for seconds and useconds, 64 bits for the context) such that
+        integer comparison of keys is a field-wise comparison.
+        """
+        self._base = time_base
+        self._context = time_context
+        self._seconds = seconds
+        self._useconds = useconds
+        self._key = (((((time_base << 32) + seconds) << 32) + useconds) << 64) + time_context
+
+    @property
+    def sort_key(self) -> int:
+        """Integer key ordering times by time base, seconds, useconds and then time context"""
+        return self._key
+
+    @property
+    def fields(self) -> tuple:
+        """Numeric fields of the time (time base, time context, seconds, useconds) as supplied to from_fields"""
+        return self._base, self._context, self._seconds, self._useconds
 
     @staticmethod
     def _check_useconds(useconds):
@@ -134,45 +209,60 @@ class TimeType(type_base.BaseType):
         """
         return {
             "type": self.__repr__(),
-            "base": self.__timeBase.numeric_value,
-            "context": self.__timeContext,
-            "seconds": self.seconds,
-            "microseconds": self.useconds,
+            "base": self._base,
+            "context": self._context,
+            "seconds": self._seconds,
+            "microseconds": self._useconds,
         }
 
     @property
     def timeBase(self) -> EnumType:
-        return self.__timeBase
+        return ConfigManager().get_type("TimeBase").from_int(self._base)
 
     @timeBase.setter
     def timeBase(self, val: EnumType):
         self._check_time_base(val)
-        self.__timeBase = val
+        self._set_fields(val.numeric_value, self._context, self._seconds, self._useconds)
 
     @property
     def timeContext(self):
-        return self.__timeContext.val
+        return self._context
 
     @timeContext.setter
     def timeContext(self, val):
-        self.__timeContext = U8Type(val)
+        U8Type.validate(val)
+        self._set_fields(self._base, val, self._seconds, self._useconds)
 
     @property
     def seconds(self):
-        return self.__secs.val
+        return self._seconds
 
     @seconds.setter
     def seconds(self, val):
-        self.__secs = U32Type(val)
+        U32Type.validate(val)
+        self._set_fields(self._base, self._context, val, self._useconds)
 
     @property
     def useconds(self):
-        return self.__usecs.val
+        return self._useconds
 
     @useconds.setter
     def useconds(self, val):
         self._check_useconds(val)
-        self.__usecs = U32Type(val)
+        U32Type.validate(val)
+        self._set_fields(self._base, self._context, self._seconds, val)
+
+    @classmethod
+    def _get_struct(cls):
+        """
+        Returns the struct used to serialize time types with the currently configured time base and context types
+        """
+        config = ConfigManager()
+        types = (config.get_type("TimeBase"), config.get_type("FwTimeContextStoreType"))
+        time_struct = cls._STRUCTS.get(types, None)
+        if time_struct is None:
+            time_struct = cls._STRUCTS[types] = struct.Struct(cls.get_serialize_format())
+        return time_struct
 
     def serialize(self):
         """
@@ -181,12 +271,9 @@ class TimeType(type_base.BaseType):
         Returns:
             Byte array containing serialized time type
         """
-        buf = b""
-        buf += self.__timeBase.serialize()
-        buf += self.__timeContext.serialize()
-        buf += self.__secs.serialize()
-        buf += self.__usecs.serialize()
-        return buf
+        return self._get_struct().pack(
+            self._base, self._context, self._seconds, self._useconds
+        )
 
     def deserialize(self, data, offset):
         """
@@ -198,22 +285,15 @@ class TimeType(type_base.BaseType):
             data: binary data containing the time tag (type = bytearray)
             offset: Index in data where time tag starts
         """
-
-        # Decode Time Base
-        self.__timeBase.deserialize(data, offset)
-        offset += self.__timeBase.getSize()
-
-        # Decode Time Context
-        self.__timeContext.deserialize(data, offset)
-        offset += self.__timeContext.getSize()
-
-        # Decode Seconds
-        self.__secs.deserialize(data, offset)
-        offset += self.__secs.getSize()
-
-        # Decode Microseconds
-        self.__usecs.deserialize(data, offset)
-        offset += self.__usecs.getSize()
+        try:
+            time_base, time_context, seconds, useconds = self._get_struct().unpack_from(
+                data, offset
+            )
+        except struct.error as err:
+            raise DeserializeException(str(err))
+        if time_base not in ConfigManager().get_type("TimeBase").ENUM_DICT.values():
+            raise TypeRangeException(time_base)
+        self._set_fields(time_base, time_context, seconds, useconds)
 
     @classmethod
     def getSize(cls):
@@ -223,11 +303,27 @@ class TimeType(type_base.BaseType):
         Returns:
             The size of the time type object when serialized
         """
-        return (
-            ConfigManager().get_type("TimeBase").getMaxSize()
-            + ConfigManager().get_type("FwTimeContextStoreType")().getSize()   # time context
-            + U32Type.getSize()  # seconds
-            + U32Type.getSize()  # microseconds
+        return cls._get_struct().size
+
+    @classmethod
+    def get_serialize_format(cls):
+        """
+        Return the struct format string of the serialized time type
+
+        Fields are ordered as serialized: time base (numeric), time context, seconds and microseconds. The format uses
+        big-endian standard sizes such that it may be concatenated with other (prefix stripped) formats.
+
+        Returns:
+            struct format string for the time type
+        """
+        return ">" + "".join(
+            field_format.lstrip(">")
+            for field_format in (
+                ConfigManager().get_type("TimeBase").get_serialize_format(),
+                ConfigManager().get_type("FwTimeContextStoreType").get_serialize_format(),
+                U32Type.get_serialize_format(),  # seconds
+                U32Type.get_serialize_format(),  # microseconds
+            )
         )
 
     @classmethod
@@ -252,23 +348,9 @@ class TimeType(type_base.BaseType):
         Returns:
             Negative, 0, or positive for t1<t2, t1==t2, t1>t2 respectively
         """
-
-        def cmp(x, y):
-            return (x > y) - (x < y)  # added to support Python 2/3
-
-        # Compare Base
-        base_cmp = cmp(t1.timeBase.numeric_value, t2.timeBase.numeric_value)
-        if base_cmp != 0:
-            return base_cmp
-
-        # Compare seconds
-        sec_cmp = cmp(t1.seconds, t2.seconds)
-        if sec_cmp != 0:
-            return sec_cmp
-
-        # Compare usecs
-        usec_cmp = cmp(t1.useconds, t2.useconds)
-        return usec_cmp if usec_cmp != 0 else cmp(t1.timeContext, t2.timeContext)
+        key1 = t1._key
+        key2 = t2._key
+        return (key1 > key2) - (key1 < key2)
 
     def __str__(self):
         """
@@ -278,10 +360,10 @@ class TimeType(type_base.BaseType):
             A string representing the time type object
         """
         return "(%d(%d)-%d:%d)" % (
-            self.__timeBase.numeric_value,
-            self.__timeContext.val,
-            self.__secs.val,
-            self.__usecs.val,
+            self._base,
+            self._context,
+            self._seconds,
+            self._useconds,
         )
 
     def to_readable(self, time_zone=None):
@@ -306,10 +388,10 @@ class TimeType(type_base.BaseType):
             # This line can be changed for other precisions or needs.
             return dt.isoformat(timespec="microseconds")
         return "%s: %d.%06ds, context=%d" % (
-            self.__timeBase.val,
-            self.__secs.val,
-            self.__usecs.val,
-            self.__timeContext.val,
+            self.timeBase.val,
+            self._seconds,
+            self._useconds,
+            self._context,
         )
 
     def get_datetime(self, tz=None):
@@ -325,12 +407,12 @@ class TimeType(type_base.BaseType):
         """
         dt = None
 
-        if self.__timeBase.val in ["TB_WORKSTATION_TIME", "TB_SC_TIME"]:
+        if self.timeBase.val in ["TB_WORKSTATION_TIME", "TB_SC_TIME"]:
             # This finds the local time corresponding to the timestamp and
             # timezone object, or local time zone if tz=None
-            dt = datetime.datetime.fromtimestamp(self.__secs.val, tz)
+            dt = datetime.datetime.fromtimestamp(self._seconds, tz)
 
-            dt = dt.replace(microsecond=self.__usecs.val)
+            dt = dt.replace(microsecond=self._useconds)
 
         return dt
 
@@ -357,42 +439,42 @@ class TimeType(type_base.BaseType):
         a helper method that gets the current TimeType as a float where the non-fraction is seconds
         and the fraction is microseconds. This enables comparisons with numbers.
         """
-        return self.seconds + (self.useconds / 1000000)
+        return self._seconds + (self._useconds / 1000000)
 
     def __lt__(self, other):
         """Less than"""
         if isinstance(other, TimeType):
-            return self.compare(self, other) < 0
+            return self._key < other._key
         return self.get_float() < other
 
     def __le__(self, other):
         """Less than or equal"""
         if isinstance(other, TimeType):
-            return self.compare(self, other) <= 0
+            return self._key <= other._key
         return self.get_float() <= other
 
     def __eq__(self, other):
         """Equal"""
         if isinstance(other, TimeType):
-            return self.compare(self, other) == 0
+            return self._key == other._key
         return self.get_float() == other
 
     def __ne__(self, other):
         """Not equal"""
         if isinstance(other, TimeType):
-            return self.compare(self, other) != 0
+            return self._key != other._key
         return self.get_float() != other
 
     def __gt__(self, other):
         """Greater than"""
         if isinstance(other, TimeType):
-            return self.compare(self, other) > 0
+            return self._key > other._key
         return self.get_float() > other
 
     def __ge__(self, other):
         """Greater than or equal"""
         if isinstance(other, TimeType):
-            return self.compare(self, other) >= 0
+            return self._key >= other._key
         return self.get_float() >= other
 
     # The following helper methods enable support for arithmetic operations on TimeTypes.
@@ -414,7 +496,7 @@ class TimeType(type_base.BaseType):
         fields using the given number. The new TimeType's time_base and time_context will be
         preserved from the calling object.
         """
-        tType = TimeType(self.__timeBase, self.__timeContext.val)
+        tType = TimeType.from_fields(self._base, self._context, 0, 0)
         tType.set_float(num)
         return tType
 
@@ -13,8 +13,15 @@ from .type_exceptions import AbstractMethodException
 class BaseType(abc.ABC):
     """
     An abstract base defining the methods supported by all base classes.
+
+    All types in the hierarchy declare __slots__ such that values carry no instance dictionary.
     """
 
+    __slots__ = ()
+
+    # Serialized size shared by every value of the type, None when the size varies by value (or by configuration)
+    FIXED_SIZE = None
+
     @abc.abstractmethod
     def serialize(self):
         """
@@ -60,6 +67,8 @@ class ValueType(BaseType):
     reading from the .val member.
     """
 
+    __slots__ = ("_val",)
+
     def __init__(self, val=None):
         """Defines the single value"""
         self._val = None
@@ -112,6 +121,8 @@ class DictionaryType(ValueType, abc.ABC):
     dynamic subclasses for the given dictionary defined type.
     """
 
+    __slots__ = ()
+
     _CONSTRUCTS = {}
 
     @classmethod
@@ -135,7 +146,11 @@ class DictionaryType(ValueType, abc.ABC):
             parent_class != DictionaryType
         ), "Cannot build dictionary type from dictionary type directly"
         construct, original_properties = cls._CONSTRUCTS.get(
-            name, (type(name, (parent_class,), class_properties), class_properties)
+            name,
+            (
+                type(name, (parent_class,), {"__slots__": (), **class_properties}),
+                class_properties,
+            ),
         )
         # Validate both new properties against original properties and against what is set on original class
         assert (
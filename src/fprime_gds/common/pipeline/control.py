@@ -0,0 +1,265 @@
+"""
+control.py:
+
+Control channel between a standard pipeline running in a process of its own (see executables/pipeline.py) and the web
+workers serving its histories. Components holding state beyond the histories (the file uplinker and downlinker, the
+chart series, and the sequence compilation jobs) run once in the pipeline process, and are reached by the workers through proxies calling them over
+a local authenticated connection.
+
+The pipeline process records the address and key of the channel in the CONTROL_FILE of its storage directory, from
+which workers connect. Calls are pickled, thus arguments and results must be picklable.
+"""
+import json
+import logging
+import os
+import pickle
+import secrets
+import socket
+import threading
+import time
+from multiprocessing.connection import AuthenticationError, Client, Listener
+from pathlib import Path
+
+LOGGER = logging.getLogger("pipeline_control")
+
+# Name of the file recording the address and key of the control channel in the storage directory
+CONTROL_FILE = "pipeline-control.json"
+
+
+class ServiceProxy:
+    """
+    Proxy of a service of the pipeline process. METHODS are called remotely, and ATTRIBUTES are read and written
+    remotely. The server serves only the methods and attributes declared by the proxy of each service.
+    """
+
+    METHODS = ()
+    ATTRIBUTES = ()
+
+    def __init__(self, client, name):
+        """
+        Constructor
+
+        :param client: control client calling the pipeline process
+        :param name: name of the service
+        """
+        object.__setattr__(self, "_client", client)
+        object.__setattr__(self, "_name", name)
+
+    def __getattr__(self, attribute):
+        if attribute in self.METHODS:
+            return lambda *args, **kwargs: self._client.call(self._name, "call", attribute, args, kwargs)
+        if attribute in self.ATTRIBUTES:
+            return self._client.call(self._name, "get", attribute)
+        raise AttributeError(attribute)
+
+    def __setattr__(self, attribute, value):
+        if attribute not in self.ATTRIBUTES:
+            raise AttributeError(attribute)
+        self._client.call(self._name, "set", attribute, (value,))
+
+
+class UplinkerProxy(ServiceProxy):
+    """Proxy of the FileUplinker"""
+
+    METHODS = ("enqueue", "current_files", "is_running", "cancel_remove", "pause", "unpause")
+    ATTRIBUTES = ("destination_dir",)
+
+
+class DownlinkerProxy(ServiceProxy):
+    """Proxy of the FileDownlinker"""
+
+    METHODS = ("current_files",)
+    ATTRIBUTES = ("directory",)
+
+
+class SeriesProxy(ServiceProxy):
+    """Proxy of the SeriesStore"""
+
+    METHODS = ("ids", "decimate")
+
+
+class SequenceJobsProxy(ServiceProxy):
+    """Proxy of the SequenceJobs compiling sequences"""
+
+    METHODS = ("submit", "get", "list", "wait")
+
+
+class ControlServer:
+    """
+    Server of the services of the pipeline process. Each connection is served by a thread of its own, such that a
+    blocking call of one worker does not delay the others.
+    """
+
+    def __init__(self, directory, services):
+        """
+        Constructor
+
+        :param directory: storage directory of the pipeline, where the control file is written
+        :param services: dictionary of service name to tuple of the service and its proxy class
+        """
+        self.path = Path(directory) / CONTROL_FILE
+        self.services = services
+        self.listener = None
+        self.stopping = threading.Event()
+        self.lock = threading.Lock()
+        self.connections = set()
+
+    def start(self):
+        """Listen on a local port and record its address and key in the control file"""
+        authkey = secrets.token_bytes(32)
+        self.listener = Listener(("127.0.0.1", 0), authkey=authkey)
+        host, port = self.listener.address
+        temporary = self.path.with_suffix(".tmp")
+        descriptor = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, "w") as file_handle:
+            json.dump({"host": host, "port": port, "authkey": authkey.hex()}, file_handle)
+        os.replace(temporary, self.path)
+        threading.Thread(target=self.accept, name="PipelineControl", daemon=True).start()
+        LOGGER.info("Serving pipeline control on %s:%d", host, port)
+
+    def stop(self):
+        """Stop serving, removing the control file and closing the connections"""
+        self.stopping.set()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        if self.listener is not None:
+            # Wake the accepting thread, which closes the listener
+            try:
+                socket.create_connection(self.listener.address, timeout=1).close()
+            except OSError:
+                pass
+        with self.lock:
+            for connection in self.connections:
+                connection.close()
+            self.connections.clear()
+
+    def accept(self):
+        """Accept connections until stopped"""
+        try:
+            while not self.stopping.is_set():
+                try:
+                    connection = self.listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    continue
+                with self.lock:
+                    if self.stopping.is_set():
+                        connection.close()
+                        break
+                    self.connections.add(connection)
+                threading.Thread(target=self.serve, args=(connection,), daemon=True).start()
+        finally:
+            self.listener.close()
+
+    def serve(self, connection):
+        """Serve the calls of a connection until closed"""
+        try:
+            while True:
+                try:
+                    request = connection.recv()
+                # Connection closed by the client or by stop, whose close may interrupt the read at any point
+                except Exception:
+                    break
+                try:
+                    response = ("ok", self.handle(*request))
+                except Exception as exc:
+                    response = ("error", exc)
+                try:
+                    connection.send(response)
+                except (pickle.PicklingError, TypeError, AttributeError):
+                    connection.send(("error", RuntimeError(f"{type(response[1]).__name__}: {response[1]}")))
+        # Connection closed while answering, a closed handle failing with TypeError
+        except (OSError, EOFError, TypeError):
+            pass
+        finally:
+            with self.lock:
+                self.connections.discard(connection)
+            connection.close()
+
+    def handle(self, name, operation, attribute, args=(), kwargs=None):
+        """
+        Perform an operation on a service
+
+        :param name: name of the service
+        :param operation: "call" a method, "get" or "set" an attribute
+        :param attribute: name of the method or attribute
+        :param args: arguments of the call, or value set
+        :param kwargs: keyword arguments of the call
+        :return: result of the operation
+        """
+        service, proxy = self.services[name]
+        if operation == "call" and attribute in proxy.METHODS:
+            return getattr(service, attribute)(*args, **(kwargs or {}))
+        if operation == "get" and attribute in proxy.ATTRIBUTES:
+            return getattr(service, attribute)
+        if operation == "set" and attribute in proxy.ATTRIBUTES:
+            return setattr(service, attribute, *args)
+        raise AttributeError(f"{name} does not serve {operation} of {attribute}")
+
+
+class ControlClient:
+    """
+    Client of the services of the pipeline process. Each thread holds a connection of its own, opened on first use
+    from the control file. Connections are reopened after a failure, e.g. when the pipeline process was restarted.
+    """
+
+    def __init__(self, directory, timeout=10.0):
+        """
+        Constructor
+
+        :param directory: storage directory of the pipeline, where the control file is written
+        :param timeout: seconds to wait for the pipeline process to serve its control channel
+        """
+        self.path = Path(directory) / CONTROL_FILE
+        self.timeout = timeout
+        self.local = threading.local()
+
+    def connect(self):
+        """
+        Connect to the pipeline process, waiting for its control file
+
+        :return: connection
+        :raises ConnectionError: when the pipeline process cannot be reached within the timeout
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                with open(self.path) as file_handle:
+                    control = json.load(file_handle)
+                return Client((control["host"], control["port"]), authkey=bytes.fromhex(control["authkey"]))
+            except (OSError, ValueError, KeyError, EOFError, AuthenticationError) as exc:
+                if time.monotonic() >= deadline:
+                    raise ConnectionError(f"Pipeline process not reachable through {self.path}: {exc}")
+            time.sleep(0.1)
+
+    def call(self, name, operation, attribute, args=(), kwargs=None):
+        """
+        Perform an operation on a service of the pipeline process (see ControlServer.handle)
+
+        :return: result of the operation
+        :raises ConnectionError: when the pipeline process cannot be reached
+        """
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = self.local.connection = self.connect()
+        try:
+            connection.send((name, operation, attribute, args, kwargs))
+            status, result = connection.recv()
+        except (OSError, EOFError) as exc:
+            self.local.connection = None
+            connection.close()
+            raise ConnectionError(f"Lost the connection to the pipeline process: {exc}")
+        if status == "error":
+            raise result
+        return result
+
+    def proxy(self, name, proxy_class):
+        """
+        Proxy of a service of the pipeline process
+
+        :param name: name of the service
+        :param proxy_class: ServiceProxy subclass of the service
+        :return: proxy
+        """
+        return proxy_class(self, name)
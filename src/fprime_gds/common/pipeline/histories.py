@@ -30,21 +30,36 @@ class Histories:
         self._channel_hist = None
         self._implementation_type = RamHistory
 
-    def setup_histories(self, coders):
+    def setup_histories(self, coders, dictionaries=None, storage=None):
         """
         Setup a set of history objects in order to store the events of the decoders. This registers itself with the
         supplied coders object.
 
         :param coders: coders object to register histories with
+        :param dictionaries: dictionaries of the pipeline, supplied to implementations constructed for a pipeline
+        :param storage: storage directory of the pipeline, supplied to implementations constructed for a pipeline
         """
         self.coders = coders
         # Allow implementation type to disable histories
         if self._implementation_type is None:
             return
-        # Create histories, RAM histories for now
-        self.commands = self._implementation_type()
-        self.events = self._implementation_type()
-        self.channels = self._implementation_type()
+        self.commands = self._create_history("commands", dictionaries, storage)
+        self.events = self._create_history("events", dictionaries, storage)
+        self.channels = self._create_history("channels", dictionaries, storage)
+
+    def _create_history(self, name, dictionaries, storage):
+        """
+        Create a history of the implementation type. Implementations defining a `for_pipeline` constructor (e.g.
+        persistent histories) are given the name of the history, the dictionaries and the storage directory.
+
+        :param name: name of the history
+        :param dictionaries: dictionaries of the pipeline
+        :param storage: storage directory of the pipeline
+        :return: history
+        """
+        if hasattr(self._implementation_type, "for_pipeline"):
+            return self._implementation_type.for_pipeline(name, dictionaries, storage)
+        return self._implementation_type()
 
     @property
     def implementation(self):
@@ -53,12 +53,12 @@ class IntegrationTestAPI(DataHandler):
         self.fsw_ordered = fsw_order
         if fsw_order:
             self.command_history = ChronologicalHistory()
-            self.telemetry_history = ChronologicalHistory()
-            self.event_history = ChronologicalHistory()
+            self.telemetry_history = ChronologicalHistory(id_index=True)
+            self.event_history = ChronologicalHistory(id_index=True)
         else:
             self.command_history = TestHistory()
-            self.telemetry_history = TestHistory()
-            self.event_history = TestHistory()
+            self.telemetry_history = TestHistory(id_index=True)
+            self.event_history = TestHistory(id_index=True)
         self.pipeline.coders.register_command_consumer(self.command_history)
         self.pipeline.coders.register_event_consumer(self.event_history)
         self.pipeline.coders.register_channel_consumer(self.telemetry_history)
@@ -412,9 +412,9 @@ class IntegrationTestAPI(DataHandler):
             an instance of TestHistory
         """
         if fsw_order:
-            subhist = ChronologicalHistory(telemetry_filter)
+            subhist = ChronologicalHistory(telemetry_filter, id_index=True)
         else:
-            subhist = TestHistory(telemetry_filter)
+            subhist = TestHistory(telemetry_filter, id_index=True)
         self.pipeline.coders.register_channel_consumer(subhist)
         return subhist
 
@@ -444,9 +444,9 @@ class IntegrationTestAPI(DataHandler):
             an instance of TestHistory
         """
         if fsw_order:
-            subhist = ChronologicalHistory(event_filter)
+            subhist = ChronologicalHistory(event_filter, id_index=True)
         else:
-            subhist = TestHistory(event_filter)
+            subhist = TestHistory(event_filter, id_index=True)
         self.pipeline.coders.register_event_consumer(subhist)
         return subhist
 
@@ -1212,7 +1212,9 @@ class IntegrationTestAPI(DataHandler):
     def __timeout_sig_handler(self, signum, frame):
         raise self.TimeoutException()
 
-    def __search_test_history(self, searcher, name, history, start=None, timeout=0):
+    def __search_test_history(
+        self, searcher, name, history, start=None, timeout=0, ids=None
+    ):
         """
         This helper method contains the common logic to all search methods in the test API. This
         means searches on both the event and channel histories rely on this helper. Each history
@@ -1244,16 +1246,21 @@ class IntegrationTestAPI(DataHandler):
             start: an index, a predicate, the NOW variable, or a TimeType timestamp to pick the
                 first item to search
             timeout: the number of seconds to await future items
+            ids: an optional collection of ids outside of which no item can satisfy the search.
+                Histories keeping an id index then only retrieve the items of these ids.
         """
+        by_id = ids is not None and hasattr(history, "retrieve_by_id")
         if start == self.NOW:
             start = history.size()
-        elif isinstance(start, TimeType):
+        elif isinstance(start, TimeType) and not (
+            by_id and isinstance(history, ChronologicalHistory)
+        ):
             time_pred = predicates.greater_than_or_equal_to(start)
             e_pred = self.get_telemetry_pred(time_pred=time_pred)
             t_pred = self.get_event_pred(time_pred=time_pred)
             start = predicates.satisfies_any([e_pred, t_pred])
 
-        current = history.retrieve(start)
+        current = history.retrieve_by_id(ids, start) if by_id else history.retrieve(start)
         if searcher.search_current_history(current):
             return searcher.get_return_value()
 
@@ -1320,7 +1327,12 @@ class IntegrationTestAPI(DataHandler):
 
         searcher = __ItemSearcher(self.__log, search_pred)
         return self.__search_test_history(
-            searcher, "Item search", history, start, timeout
+            searcher,
+            "Item search",
+            history,
+            start,
+            timeout,
+            ids=predicates.constrained_ids(search_pred),
         )
 
     def find_history_sequence(self, seq_preds, history, start=None, timeout=0):
@@ -1442,7 +1454,12 @@ class IntegrationTestAPI(DataHandler):
 
         searcher = __CountSearcher(self.__log, count, search_pred)
         return self.__search_test_history(
-            searcher, "Count search", history, start, timeout
+            searcher,
+            "Count search",
+            history,
+            start,
+            timeout,
+            ids=predicates.constrained_ids(search_pred),
         )
 
     ######################################################################################
@@ -54,6 +54,30 @@ def is_predicate(pred):
     return False
 
 
+def constrained_ids(pred):
+    """
+    a helper function to determine the ids an item must have to satisfy a predicate. This allows searches to be served
+    from the id index of a history.
+
+    :return: a set of ids or None when the predicate does not constrain ids to a known set
+    """
+    if isinstance(pred, (telemetry_predicate, event_predicate)):
+        try:
+            if isinstance(pred.id_pred, equal_to):
+                return {pred.id_pred.expected}
+            if isinstance(pred.id_pred, is_a_member_of):
+                return set(pred.id_pred.set)
+        # Unhashable ids cannot be looked up in an index
+        except TypeError:
+            pass
+        return None
+    if isinstance(pred, satisfies_all):
+        constraints = [constrained_ids(child) for child in pred.p_list]
+        constraints = [constraint for constraint in constraints if constraint is not None]
+        return set.intersection(*constraints) if constraints else None
+    return None
+
+
 def get_descriptive_string(value, pred_function):
     """
     a helper function that formats a predicate and argument in a nice human-readable format
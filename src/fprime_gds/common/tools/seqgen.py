@@ -41,23 +41,16 @@ class SeqGenException(gseExceptions.GseControllerException):
 #  __error("The Gse source code was not found in your $PYTHONPATH variable. Please set PYTHONPATH to something like: $BUILD_ROOT/Gse/src:$BUILD_ROOT/Gse/generated/$DEPLOYMENT_NAME")
 
 
-def generateSequence(inputFile, outputFile, dictionary, timebase, cont=False):
+def loadCommands(dictionary):
     """
-    Write a binary sequence file from a text sequence file
-    @param inputFile: A text input sequence file name (usually a .seq extension)
-    @param outputFile: An output binary sequence file name (usually a .bin extension)
+    Load the commands of a dictionary by name, such that a dictionary may be loaded once for many sequences
+    @param dictionary: path to the JSON dictionary
+    @return: dictionary of command templates by mnemonic
     """
-
-    # Check for files
-    if not os.path.isfile(inputFile):
-        msg = f"Can't open file '{inputFile}'. "
-        raise SeqGenException(msg)
-
     if not os.path.isfile(dictionary):
         msg = f"Can't open file '{dictionary}'. "
         raise SeqGenException(msg)
 
-    # Check the user environment:
     cmd_json_dict = CmdJsonLoader(dictionary)
     try:
         (cmd_id_dict, cmd_name_dict, versions) = cmd_json_dict.construct_dicts(
@@ -66,6 +59,24 @@ def generateSequence(inputFile, outputFile, dictionary, timebase, cont=False):
     except gseExceptions.GseControllerUndefinedFileException:
         msg = f"Can't open file '{dictionary}'. "
         raise SeqGenException(msg)
+    return cmd_name_dict
+
+
+def generateSequence(inputFile, outputFile, dictionary, timebase, cont=False, commands=None):
+    """
+    Write a binary sequence file from a text sequence file
+    @param inputFile: A text input sequence file name (usually a .seq extension)
+    @param outputFile: An output binary sequence file name (usually a .bin extension)
+    @param commands: (optional) commands by mnemonic as loaded by loadCommands, skipping the load of dictionary
+    """
+
+    # Check for files
+    if not os.path.isfile(inputFile):
+        msg = f"Can't open file '{inputFile}'. "
+        raise SeqGenException(msg)
+
+    # Check the user environment:
+    cmd_name_dict = loadCommands(dictionary) if commands is None else commands
 
     # Parse the input file:
     command_list = []
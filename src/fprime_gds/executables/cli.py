@@ -1197,6 +1197,12 @@ class GdsParser(ParserBase):
                 "type": str,
                 "help": "Set the GUI server address [default: %(default)s]",
             },
+            ("--gui-pipeline-process",): {
+                "dest": "gui_pipeline_process",
+                "action": "store_true",
+                "default": False,
+                "help": "Run the standard pipeline of the GUI in a separate process, serving the GUI from its histories",
+            },
         }
 
     def handle_arguments(self, args, **kwargs):
@@ -0,0 +1,85 @@
+"""
+pipeline.py:
+
+Runs the standard pipeline in a process of its own, decoupled from the web server. Decoded items are stored in the
+SQLite histories of the pipeline's storage directory (see common/history/sqlite.py), from which any number of
+stateless web workers serve the GUI. Workers are run with the STANDALONE_PIPELINE flask setting (see
+flask/components.py).
+
+File uplink and downlink, the chart series fed by the decoders, and the sequence compilation jobs run in this process
+only. Workers reach them through the control channel of this process (see common/pipeline/control.py).
+"""
+import logging
+import os
+import signal
+import sys
+import threading
+
+from fprime_gds.common.history.series import SeriesStore
+from fprime_gds.common.history.sqlite import SqliteHistory
+from fprime_gds.common.pipeline import control
+from fprime_gds.common.pipeline.standard import StandardPipeline
+from fprime_gds.executables.cli import ConfigDrivenParser, ParserBase, StandardPipelineParser
+from fprime_gds.flask.sequence import SequenceJobs
+
+LOGGER = logging.getLogger("pipeline")
+
+
+def run(args, shutdown):
+    """
+    Run the pipeline and its control channel until shutdown
+
+    :param args: parsed standard pipeline arguments
+    :param shutdown: event set to stop the pipeline
+    """
+    pipeline = StandardPipeline()
+    pipeline.histories.implementation = SqliteHistory
+    pipeline = StandardPipelineParser.pipeline_factory(args, pipeline)
+    # Channel samples held for the charts, configured as the CHART_MAX_SAMPLES flask setting
+    series = SeriesStore(max_total=int(os.environ.get("CHART_MAX_SAMPLES", SeriesStore.MAX_TOTAL_SAMPLES)))
+    if series.max_total > 0:
+        pipeline.coders.register_channel_consumer(series)
+    uplinker = pipeline.files.uplinker
+    sequence_jobs = SequenceJobs(args.dictionary, pipeline.up_store, uplinker, args.remote_sequence_directory)
+    server = control.ControlServer(
+        args.files_storage_directory,
+        {
+            "uplinker": (uplinker, control.UplinkerProxy),
+            "downlinker": (pipeline.files.downlinker, control.DownlinkerProxy),
+            "series": (series, control.SeriesProxy),
+            "sequences": (sequence_jobs, control.SequenceJobsProxy),
+        },
+    )
+    try:
+        server.start()
+        LOGGER.info("Pipeline storing histories in %s", args.files_storage_directory)
+        while not shutdown.wait(1):
+            pass
+    finally:
+        server.stop()
+        sequence_jobs.shutdown()
+        pipeline.disconnect()
+
+
+def main():
+    """
+    Main program, runs the pipeline until interrupted.
+
+    :return: return code
+    """
+    args, _ = ParserBase.parse_args(
+        [StandardPipelineParser, ConfigDrivenParser],
+        description="F prime standard pipeline serving stateless web workers.",
+        client=True,
+    )
+    shutdown = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: shutdown.set())
+    try:
+        run(args, shutdown)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
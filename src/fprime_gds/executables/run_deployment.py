@@ -104,6 +104,21 @@ def launch_tts(parsed_args):
     return launch_process(tts_cmd, logfile=tts_log, name="TCP Server")
 
 
+def launch_pipeline(parsed_args):
+    """Launch the standard pipeline process serving the GUI
+
+    Args:
+        parsed_args: parsed argument namespace
+    Return:
+        launched process
+    """
+    reproduced_arguments = StandardPipelineParser().reproduce_cli_args(parsed_args)
+    if "--log-directly" not in reproduced_arguments:
+        reproduced_arguments += ["--log-directly"]
+    pipeline_cmd = BASE_MODULE_ARGUMENTS + ["fprime_gds.executables.pipeline"] + reproduced_arguments
+    return launch_process(pipeline_cmd, name="Standard Pipeline", launch_time=2)
+
+
 def launch_html(parsed_args):
     """Launch the Flask application
 
@@ -122,6 +137,7 @@ def launch_html(parsed_args):
             "FLASK_APP": "fprime_gds.flask.app",
             "STANDARD_PIPELINE_ARGUMENTS": "|".join(reproduced_arguments),
             "SERVE_LOGS": "YES",
+            "STANDALONE_PIPELINE": "YES" if parsed_args.gui_pipeline_process else "NO",
         }
     )
     gse_args = BASE_MODULE_ARGUMENTS + [
@@ -234,6 +250,8 @@ def main():
 
     # Launch the desired GUI package
     if parsed_args.gui == "html":
+        if parsed_args.gui_pipeline_process:
+            launchers.append(launch_pipeline)
         launchers.append(launch_html)
 
     # Launch launchers and wait for the last app to finish
@@ -18,7 +18,9 @@ try:
 except ImportError:
     Compress = None
 
+import fprime_gds.flask.binary
 import fprime_gds.flask.channels
+import fprime_gds.flask.chart
 
 # Import the Flask API implementations
 import fprime_gds.flask.commands
@@ -26,8 +28,10 @@ import fprime_gds.flask.errors
 import fprime_gds.flask.events
 import fprime_gds.flask.json
 import fprime_gds.flask.logs
+import fprime_gds.flask.resource
 import fprime_gds.flask.sequence
 import fprime_gds.flask.stats
+import fprime_gds.flask.stream
 import fprime_gds.flask.updown
 from fprime_gds.executables.cli import ParserBase, StandardPipelineParser, ConfigDrivenParser
 
@@ -76,7 +80,13 @@ def construct_app():
     for key, value in args_ns.config_values.get("flask", {}).items():
         app.config[key] = value
 
-    pipeline = components.setup_pipelined_components(app.debug, args_ns)
+    pipeline = components.setup_pipelined_components(app.debug, args_ns, app.config["STANDALONE_PIPELINE"])
+    uplinker, downlinker, series = components.setup_file_and_series_components(
+        pipeline, args_ns, app.config["STANDALONE_PIPELINE"], app.config["CHART_MAX_SAMPLES"]
+    )
+    # Items of the shared histories are loaded anew by each request, thus their fragments would never be reused
+    if app.config["STANDALONE_PIPELINE"]:
+        fprime_gds.flask.json.FRAGMENTS.max_size = fprime_gds.flask.binary.FRAGMENTS.max_size = 0
 
 
     # Restful API registration
@@ -96,7 +106,7 @@ def construct_app():
     api.add_resource(
         fprime_gds.flask.commands.CommandHistory,
         "/commands",
-        resource_class_args=[pipeline.histories.commands],
+        resource_class_args=[pipeline.histories.commands, pipeline.dictionaries.command_id],
     )
     api.add_resource(
         fprime_gds.flask.commands.Command,
@@ -116,7 +126,7 @@ def construct_app():
     api.add_resource(
         fprime_gds.flask.events.EventHistory,
         "/events",
-        resource_class_args=[pipeline.histories.events],
+        resource_class_args=[pipeline.histories.events, pipeline.dictionaries.event_id],
     )
     api.add_resource(
         fprime_gds.flask.channels.ChannelDictionary,
@@ -131,33 +141,55 @@ def construct_app():
     api.add_resource(
         fprime_gds.flask.channels.ChannelHistory,
         "/channels",
-        resource_class_args=[pipeline.histories.channels],
+        resource_class_args=[pipeline.histories.channels, pipeline.dictionaries.channel_id],
+    )
+    # Time-indexed store of the channel samples served decimated to the charts, left empty when disabled
+    api.add_resource(
+        fprime_gds.flask.chart.ChartData,
+        "/chart",
+        resource_class_args=[series],
     )
     api.add_resource(
         fprime_gds.flask.updown.Destination,
         "/upload/destination",
-        resource_class_args=[pipeline.files.uplinker],
+        resource_class_args=[uplinker],
     )
     api.add_resource(
         fprime_gds.flask.updown.FileUploads,
         "/upload/files",
-        resource_class_args=[pipeline.files.uplinker, pipeline.up_store],
+        resource_class_args=[uplinker, pipeline.up_store],
+    )
+    api.add_resource(
+        fprime_gds.flask.updown.ChunkedUploads,
+        "/upload/chunked",
+        resource_class_args=[uplinker, pipeline.up_store],
+    )
+    api.add_resource(
+        fprime_gds.flask.updown.ChunkedUpload,
+        "/upload/chunked/<string:upload_id>",
+        resource_class_args=[uplinker, pipeline.up_store],
     )
     api.add_resource(
         fprime_gds.flask.updown.FileDownload,
         "/download/files",
         "/download/files/<string:source>",
-        resource_class_args=[pipeline.files.downlinker],
+        resource_class_args=[downlinker],
     )
+    sequence_jobs = components.setup_sequence_jobs(pipeline, args_ns, uplinker, app.config["STANDALONE_PIPELINE"])
     api.add_resource(
         fprime_gds.flask.sequence.SequenceCompiler,
         "/sequence",
-        resource_class_args=[
-            args_ns.dictionary,
-            pipeline.up_store,
-            pipeline.files.uplinker,
-            args_ns.remote_sequence_directory,
-        ],
+        resource_class_args=[sequence_jobs],
+    )
+    api.add_resource(
+        fprime_gds.flask.sequence.SequenceJobList,
+        "/sequence/jobs",
+        resource_class_args=[sequence_jobs],
+    )
+    api.add_resource(
+        fprime_gds.flask.sequence.SequenceJob,
+        "/sequence/jobs/<string:job_id>",
+        resource_class_args=[sequence_jobs],
     )
     api.add_resource(
         fprime_gds.flask.stats.StatsBlob,
@@ -171,6 +203,37 @@ def construct_app():
         ],
     )
 
+    api.add_resource(
+        fprime_gds.flask.stream.HistoryStream,
+        "/stream",
+        resource_class_args=[
+            {
+                "events": fprime_gds.flask.events.EventHistory(
+                    pipeline.histories.events, pipeline.dictionaries.event_id
+                ),
+                "channels": fprime_gds.flask.channels.ChannelHistory(
+                    pipeline.histories.channels, pipeline.dictionaries.channel_id
+                ),
+                "command_history": fprime_gds.flask.commands.CommandHistory(
+                    pipeline.histories.commands, pipeline.dictionaries.command_id
+                ),
+            }
+        ],
+    )
+
+    # Encode and compress the dictionaries at startup rather than on the first page load
+    for dictionary in [
+        pipeline.dictionaries.command_name,
+        pipeline.dictionaries.event_id,
+        pipeline.dictionaries.channel_id,
+    ]:
+        fprime_gds.flask.resource.DictionaryResource(
+            dictionary,
+            pipeline.dictionaries.project_version,
+            pipeline.dictionaries.framework_version,
+            pipeline.dictionaries.metadata,
+        ).encode()
+
     # Optionally serve log files
     if app.config["SERVE_LOGS"]:
         api.add_resource(
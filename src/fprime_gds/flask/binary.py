@@ -0,0 +1,195 @@
+####
+# binary.py:
+#
+# Encodes history responses in MessagePack, a compact binary alternative to JSON served to clients accepting the
+# application/msgpack media type. Objects are converted through the JSON encoding functions such that both formats
+# carry the same data.
+#
+# Channel responses are laid out as columns rather than a list of objects:
+#
+#   "history": {
+#       "ids": bin,             # little-endian uint32 id of each sample
+#       "times": bin,           # little-endian uint32 base, context, seconds, microseconds of each sample
+#       "values": [...],        # value of each sample
+#       "display_texts": [...], # display text of each sample, nil when equal to the value
+#   }
+#
+# Channels of ids beyond 32 bits, and items post-processed into other objects, are encoded as a list of objects as in
+# JSON responses. The decoder matching this encoding is found in static/js/msgpack.js.
+####
+import struct
+
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.flask.json import HISTORY_ITEM_TYPES, JSON_ENCODERS, FragmentCache, default
+
+MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+NIL = b"\xc0"
+FALSE = b"\xc2"
+TRUE = b"\xc3"
+FLOAT64 = struct.Struct(">Bd")
+
+# Bound (exclusive) of the ids laid out in the uint32 id column
+MAX_COLUMN_ID = 1 << 32
+
+# (exclusive upper bound, marker, struct format) of unsigned and signed integer encodings past the fixints
+UINT_FORMATS = ((1 << 8, 0xCC, ">BB"), (1 << 16, 0xCD, ">BH"), (1 << 32, 0xCE, ">BI"), (1 << 64, 0xCF, ">BQ"))
+INT_FORMATS = ((1 << 7, 0xD0, ">Bb"), (1 << 15, 0xD1, ">Bh"), (1 << 31, 0xD2, ">Bi"), (1 << 63, 0xD3, ">Bq"))
+
+
+def _header(length, fix_marker, fix_limit, marker8, marker16, marker32):
+    """Header of a sized object (string, binary, array, map) of the given length"""
+    if length < fix_limit:
+        return bytes((fix_marker | length,))
+    if marker8 is not None and length < (1 << 8):
+        return struct.pack(">BB", marker8, length)
+    if length < (1 << 16):
+        return struct.pack(">BH", marker16, length)
+    return struct.pack(">BI", marker32, length)
+
+
+def _pack_int(value):
+    """Pack an integer in its smallest encoding"""
+    if 0 <= value < 0x80:
+        return bytes((value,))
+    if -32 <= value < 0:
+        return bytes((value & 0xFF,))
+    formats = UINT_FORMATS if value >= 0 else INT_FORMATS
+    for bound, marker, fmt in formats:
+        if -bound <= value < bound:
+            return struct.pack(fmt, marker, value)
+    raise TypeError(f"Integer {value} exceeds 64 bits")
+
+
+def array_header(length):
+    """Header of an array of the given length"""
+    return _header(length, 0x90, 16, None, 0xDC, 0xDD)
+
+
+def map_header(length):
+    """Header of a map of the given length"""
+    return _header(length, 0x80, 16, None, 0xDE, 0xDF)
+
+
+def pack_binary(data):
+    """Pack bytes as a MessagePack binary"""
+    return _header(len(data), 0, 0, 0xC4, 0xC5, 0xC6) + data
+
+
+def pack(obj):
+    """Pack an object as MessagePack
+
+    Objects that are not natively encoded are converted through the JSON `default` encoder first.
+
+    Args:
+        obj: object to encode
+
+    Returns:
+        encoded bytes
+    """
+    if obj is None:
+        return NIL
+    if obj is True:
+        return TRUE
+    if obj is False:
+        return FALSE
+    if isinstance(obj, int):
+        return _pack_int(obj)
+    if isinstance(obj, float):
+        return FLOAT64.pack(0xCB, obj)
+    if isinstance(obj, str):
+        data = obj.encode("utf-8")
+        return _header(len(data), 0xA0, 32, 0xD9, 0xDA, 0xDB) + data
+    if isinstance(obj, (bytes, bytearray)):
+        return pack_binary(bytes(obj))
+    if isinstance(obj, (list, tuple)):
+        return array_header(len(obj)) + b"".join([pack(value) for value in obj])
+    if isinstance(obj, dict):
+        return map_header(len(obj)) + b"".join(
+            [pack(key if isinstance(key, str) else str(key)) + pack(value) for key, value in obj.items()]
+        )
+    return pack(default(obj))
+
+
+FRAGMENTS = FragmentCache()
+
+
+def fragment(item):
+    """MessagePack fragment of a history item
+
+    Like their JSON fragments, the fragments of channels, events, and commands are encoded on first use and kept in
+    FRAGMENTS for later responses.
+
+    Args:
+        item: history item to encode
+
+    Returns:
+        encoded bytes
+    """
+    if type(item) in HISTORY_ITEM_TYPES:
+        return FRAGMENTS.get(item, lambda _: pack(JSON_ENCODERS[type(item)](item)))
+    return pack(item)
+
+
+def encode_history(response):
+    """MessagePack encoding of a history response, as a map of the same keys as the JSON response
+
+    Args:
+        response: response dictionary holding the "history" list of items
+
+    Returns:
+        encoded bytes
+    """
+    items = response["history"]
+    others = {key: value for key, value in response.items() if key != "history"}
+    return (
+        map_header(len(others) + 1)
+        + pack("history")
+        + array_header(len(items))
+        + b"".join([fragment(item) for item in items])
+        + b"".join([pack(key) + pack(value) for key, value in others.items()])
+    )
+
+
+def encode_channel_history(response):
+    """MessagePack encoding of a channel history response with the history laid out in columns
+
+    Args:
+        response: response dictionary holding the "history" list of channel items
+
+    Returns:
+        encoded bytes
+    """
+    items = response["history"]
+    # Items post-processed into other objects, and ids beyond the id column, cannot be laid out in columns
+    if any(type(item) is not ChData or not 0 <= item.id < MAX_COLUMN_ID for item in items):
+        return encode_history(response)
+    times = []
+    values = []
+    display_texts = []
+    for item in items:
+        times.extend(item.time.fields)
+        value = item.val_obj.val
+        display_text = item.display_text
+        values.append(pack(value))
+        display_texts.append(NIL if display_text == value else pack(display_text))
+    columns = (
+        pack("history")
+        + map_header(4)
+        + pack("ids")
+        + pack_binary(struct.pack(f"<{len(items)}I", *[item.id for item in items]))
+        + pack("times")
+        + pack_binary(struct.pack(f"<{len(times)}I", *times))
+        + pack("values")
+        + array_header(len(items))
+        + b"".join(values)
+        + pack("display_texts")
+        + array_header(len(items))
+        + b"".join(display_texts)
+    )
+    others = {key: value for key, value in response.items() if key != "history"}
+    return (
+        map_header(len(others) + 1)
+        + columns
+        + b"".join([pack(key) + pack(value) for key, value in others.items()])
+    )
@@ -9,6 +9,8 @@
 #                      "start-time": "YYYY-MM-DDTHH:MM:SS.sss" #Start time for event listing
 #                  }
 ####
+from fprime_gds.flask import binary
+from fprime_gds.flask.errors import build_error_object
 from fprime_gds.flask.resource import DictionaryResource, HistoryResourceBase
 
 
@@ -20,4 +22,38 @@ class ChannelHistory(HistoryResourceBase):
     """
     Resource supplying the history of channels in the system. Includes `get_display_text` postprocessing to add in the
     getter for the display text.
+
+    MessagePack responses lay the channel samples out in columns (see binary.py).
+
+    Supplying the `latest` argument serves the latest value of each channel instead of the new history items. This is
+    read from the latest value table of the history and leaves the session's position untouched.
     """
+
+    def __init__(self, history, templates=None):
+        """Construct the channel history resource adding the latest argument"""
+        super().__init__(history, templates)
+        self.parser.add_argument(
+            "latest", required=False, help="Return the latest value of each channel", location="args"
+        )
+
+    def get(self):
+        """HTTP GET handler returning new history objects, or latest channel values when requested"""
+        args = self.parser.parse_args()
+        if args.get("latest") is None or not hasattr(self.history, "latest_items"):
+            return super().get()
+        history_filter = self.parse_filter(args)
+        errors = []
+        returned_items = []
+        for item in self.history.latest_items():
+            if history_filter is not None and not history_filter.matches(item):
+                continue
+            try:
+                item = self.process(item)
+                returned_items.append(item if history_filter is None else history_filter.project(item))
+            except Exception as exc:
+                errors.append(build_error_object(exc))
+        return self.respond({"history": returned_items, "validation": -1, "dropped": 0, "errors": errors})
+
+    def encode_binary(self, response):
+        """Encode a channel history response in MessagePack with the channel samples laid out in columns"""
+        return binary.encode_channel_history(response)
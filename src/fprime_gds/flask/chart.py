@@ -0,0 +1,58 @@
+####
+# chart.py:
+#
+# This file captures the HTML endpoint serving decimated channel telemetry for plotting. Rather than every sample of a
+# time range, the samples of each channel are decimated server-side into one min/max/avg bucket per pixel of the plot.
+#
+#  GET /chart: decimated channel samples
+#      Input Data: {
+#                      "ids": "17,18",     # Comma separated channel ids
+#                      "start": 1234.5,    # (optional) Start of the time range, in seconds
+#                      "end": 1334.5,      # (optional) End of the time range, in seconds
+#                      "width": 800        # (optional) Width of the plot in pixels (default 1000)
+#                  }
+####
+import flask_restful
+from flask_restful.reqparse import RequestParser
+
+
+class ChartData(flask_restful.Resource):
+    """
+    Resource serving the samples of the requested channels decimated into buckets by the series store (see
+    common/history/series.py). The buckets of each channel are returned in columns keyed by channel id.
+    """
+
+    # Upper bound on the requested width, such that a request cannot ask for every sample of a long range
+    MAX_WIDTH = 10000
+
+    def __init__(self, series):
+        """Construct the chart resource around the series store
+
+        Args:
+            series: SeriesStore holding the channel samples
+        """
+        self.parser = RequestParser()
+        self.parser.add_argument("ids", required=True, help="Comma separated channel ids", location="args")
+        self.parser.add_argument("start", type=float, required=False, help="Start time in seconds", location="args")
+        self.parser.add_argument("end", type=float, required=False, help="End time in seconds", location="args")
+        self.parser.add_argument(
+            "width", type=int, default=1000, help="Width of the plot in pixels (default 1000)", location="args"
+        )
+        self.series = series
+
+    def get(self):
+        """HTTP GET handler returning the decimated samples of each requested channel"""
+        args = self.parser.parse_args()
+        try:
+            ids = [int(item_id, 0) for item_id in args.get("ids").split(",") if item_id.strip()]
+        except ValueError:
+            flask_restful.abort(400, message=f"Invalid ids: {args.get('ids')}")
+        width = args.get("width")
+        if width <= 0 or width > self.MAX_WIDTH:
+            flask_restful.abort(400, message=f"Width must be within 1 and {self.MAX_WIDTH}")
+        return {
+            "channels": {
+                item_id: self.series.decimate(item_id, args.get("start"), args.get("end"), width) for item_id in ids
+            },
+            "errors": [],
+        }
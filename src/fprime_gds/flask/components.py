@@ -3,12 +3,32 @@ flask/components.py:
 
 This sets up the primary data components that allow Flask to connect into the system. This is where the standard
 pipeline and other components are created to interact with Flask.
+
+By default, the standard pipeline runs within the Flask process and stores its items in RAM histories. With the
+STANDALONE_PIPELINE setting, the pipeline runs in a process of its own (see executables/pipeline.py) storing its items
+in the SQLite histories of the storage directory. Flask processes then hold no state of their own: their histories
+and sessions are read from the shared database, such that any number of WSGI workers may serve the GUI, e.g.:
+
+    STANDALONE_PIPELINE=YES gunicorn --workers 4 --worker-class gthread --threads 32 fprime_gds.flask.app:app
+
+Workers must serve concurrent requests (threaded or asynchronous workers, e.g. gthread or gevent): the event stream of
+each browser tab (see flask/stream.py) holds its request open for the whole connection, which would take a sync worker
+out of the pool and stall the REST calls. With sync workers, disable the stream (dataStreaming in static/js/config.js)
+such that the GUI polls the history endpoints instead.
+
+File uplink and downlink, the chart series fed by the decoders, and the sequence compilation jobs run once in the
+pipeline process. Workers reach them through the control channel of the pipeline process (see
+common/pipeline/control.py), such that any worker may answer for a job submitted to another.
 """
 import os
 
 from fprime_gds.common.history.ram import SelfCleaningRamHistory
+from fprime_gds.common.history.series import SeriesStore
+from fprime_gds.common.history.sqlite import SharedSqliteHistory
+from fprime_gds.common.pipeline import control
 from fprime_gds.common.pipeline.standard import StandardPipeline
 from fprime_gds.executables.cli import StandardPipelineParser
+from fprime_gds.flask.sequence import SequenceJobs
 
 # Module variables, should remain hidden. These are singleton top-level objects used by Flask, and its various
 # blueprints needed to run the system.
@@ -25,8 +45,14 @@ class FlaskEndpointRamHistory(SelfCleaningRamHistory):
 
     In addition, this history creates new session tokens and uses them when a session token has not been supplied. In
     this way, HTTP clients are not free to create (potentially colliding) session tokens.
+
+    The history is capped such that a stalled client session (e.g. a forgotten browser tab) cannot pin an ever-growing
+    history. Items evicted before a session retrieved them are reported to that session as dropped.
     """
 
+    # Roughly 100MB of channel telemetry per history
+    MAX_ITEMS = 250000
+
     def __init__(self):
         """Constructor"""
         super().__init__()
@@ -71,15 +97,21 @@ class FlaskEndpointRamHistory(SelfCleaningRamHistory):
             return self.count_values.get(start, self.count)
 
 
-def setup_pipelined_components(debug: bool, pipeline_arguments):
+def setup_pipelined_components(debug: bool, pipeline_arguments, standalone: bool = False):
     """
     Setup the standard pipeline and related components. This is done once, and then the resulting singletons are
     returned so that one object is used throughout the system.
 
+    In standalone mode, the pipeline of this process reads its histories from the database of the standalone pipeline
+    process. Its decoders are detached from the middleware and its data logging is disabled, as the standalone pipeline
+    decodes and logs the data. Commands are still encoded and sent by this process, and stored in the shared command
+    history.
+
     Args:
         debug: used to prevent the construction of the standard pipeline
         logger: logger to log to
         pipeline_arguments: arguments to standard pipeline
+        standalone: attach to the pipeline running in its own process
     :return: F prime pipeline
     """
     global __PIPELINE
@@ -90,12 +122,66 @@ def setup_pipelined_components(debug: bool, pipeline_arguments):
     ):
         pipeline = StandardPipeline()
         pipeline.histories.implementation = FlaskEndpointRamHistory
+        if standalone:
+            pipeline.histories.implementation = SharedSqliteHistory
+            pipeline_arguments.disable_data_logging = True
         pipeline = StandardPipelineParser.pipeline_factory(pipeline_arguments, pipeline)
+        if standalone:
+            pipeline.client_socket.deregister(pipeline.distributor)
         __PIPELINE = pipeline
     assert __PIPELINE is not None, "Main thread did not setup pipeline appropriately"
     return __PIPELINE
 
 
+def setup_file_and_series_components(pipeline, pipeline_arguments, standalone: bool = False, chart_max_samples=None):
+    """
+    Setup the file uplinker and downlinker, and the store of the chart series, served by Flask.
+
+    These components are those of the pipeline of this process, with a series store fed by its decoders. In standalone
+    mode, they are proxies of the components of the standalone pipeline process, as the decoders of this process are
+    detached and several processes may not share the uplink.
+
+    Args:
+        pipeline: pipeline of this process
+        pipeline_arguments: arguments to standard pipeline
+        standalone: attach to the pipeline running in its own process
+        chart_max_samples: channel samples held for the charts, 0 to disable the charts, None for the default
+    :return: tuple of the uplinker, the downlinker, and the series store
+    """
+    if standalone:
+        client = control.ControlClient(pipeline_arguments.files_storage_directory)
+        return (
+            client.proxy("uplinker", control.UplinkerProxy),
+            client.proxy("downlinker", control.DownlinkerProxy),
+            client.proxy("series", control.SeriesProxy),
+        )
+    series = SeriesStore(max_total=chart_max_samples)
+    if series.max_total > 0:
+        pipeline.coders.register_channel_consumer(series)
+    return pipeline.files.uplinker, pipeline.files.downlinker, series
+
+
+def setup_sequence_jobs(pipeline, pipeline_arguments, uplinker, standalone: bool = False):
+    """
+    Setup the sequence compilation jobs served by Flask. In standalone mode, these are a proxy of the jobs of the
+    standalone pipeline process, as jobs are polled from any worker.
+
+    Args:
+        pipeline: pipeline of this process
+        pipeline_arguments: arguments to standard pipeline
+        uplinker: uplinker of the compiled sequences
+        standalone: attach to the pipeline running in its own process
+    :return: sequence jobs
+    """
+    if standalone:
+        return control.ControlClient(pipeline_arguments.files_storage_directory).proxy(
+            "sequences", control.SequenceJobsProxy
+        )
+    return SequenceJobs(
+        pipeline_arguments.dictionary, pipeline.up_store, uplinker, pipeline_arguments.remote_sequence_directory
+    )
+
+
 def get_pipelined_components():
     """
     Returns the setup pipelined components, or raises exception if not setup yet.
@@ -14,6 +14,12 @@ STANDARD_PIPELINE_ARGUMENTS = os.environ.get("STANDARD_PIPELINE_ARGUMENTS").spli
 
 SERVE_LOGS = os.environ.get("SERVE_LOGS", "YES") == "YES"
 
+# Serve the histories of a pipeline running in its own process (see executables/pipeline.py)
+STANDALONE_PIPELINE = os.environ.get("STANDALONE_PIPELINE", "NO") == "YES"
+
+# Channel samples held for the charts across all channels (see common/history/series.py), 0 to disable the charts
+CHART_MAX_SAMPLES = int(os.environ.get("CHART_MAX_SAMPLES", 4194304))
+
 MAX_CONTENT_LENGTH = 32 * 1024 * 1024  # Max length of request is 32MiB
 
 JS_CONFIGURATION_FILE = os.path.join(os.path.dirname(__file__), "static", "js", "config.js")
@@ -0,0 +1,163 @@
+####
+# filters.py:
+#
+# Server-side selection of the items served by the history endpoints, such that clients displaying a part of the data
+# (e.g. a single subsystem) do not download and discard the rest. The history endpoints accept the optional arguments:
+#
+#  ids: comma separated ids of the items to return (e.g. ids=17,18)
+#  names: comma separated globs matched against the full and short names of the items (e.g. names=cmdDisp.*)
+#  severity: minimum event severity, by name or value (e.g. severity=WARNING_HI)
+#  fields: comma separated fields of the items to return (e.g. fields=id,time,val)
+#
+# Items must pass all supplied selections. Selections are resolved to a set of ids against the dictionary of the
+# endpoint, such that histories indexing their items by id serve only the selected items.
+####
+import fnmatch
+import threading
+
+from fprime_gds.common.utils.event_severity import EventSeverity
+from fprime_gds.flask.json import default
+
+
+class HistoryFilter:
+    """
+    Selection of history items by id, name, and severity along with the projection of the fields returned for each.
+    Selections resolved against a dictionary are cached, as dictionaries do not change while the GDS runs.
+    """
+
+    ARGUMENTS = {
+        "ids": "Comma separated ids of the items to return",
+        "names": "Comma separated globs of the names of the items to return",
+        "severity": "Minimum severity of the events to return",
+        "fields": "Comma separated fields of the items to return",
+    }
+
+    # Resolved ids by (dictionary id, selection)
+    _RESOLVED = {}
+    _RESOLVED_LOCK = threading.Lock()
+    # Resolutions cached before the cache is reset
+    MAX_RESOLVED = 256
+
+    def __init__(self, ids=None, names=None, severity=None, fields=None):
+        """Construct the filter from the (optional) arguments of the request
+
+        Args:
+            ids: comma separated ids of the items to return
+            names: comma separated globs of the names of the items to return
+            severity: minimum severity of the events to return, by name or value
+            fields: comma separated fields of the items to return
+        Raises:
+            ValueError: when an argument cannot be parsed
+        """
+        try:
+            self.ids = None if ids is None else frozenset(int(item_id, 0) for item_id in self._split(ids))
+        except ValueError:
+            raise ValueError(f"Invalid ids: {ids}")
+        self.names = None if names is None else tuple(self._split(names))
+        self.severity = None if severity is None else self._parse_severity(severity)
+        self.fields = None if fields is None else tuple(self._split(fields))
+
+    @classmethod
+    def from_args(cls, args):
+        """Build the filter of the parsed request arguments, None when no selection nor projection was requested
+
+        Args:
+            args: parsed arguments holding the keys of ARGUMENTS
+        Returns:
+            filter or None
+        """
+        supplied = {key: args.get(key) for key in cls.ARGUMENTS if args.get(key)}
+        return cls(**supplied) if supplied else None
+
+    @staticmethod
+    def _split(value):
+        """Split a comma separated argument into its non-empty parts"""
+        return [part.strip() for part in value.split(",") if part.strip()]
+
+    @staticmethod
+    def _parse_severity(value):
+        """Parse a severity by (case insensitive) name or by value"""
+        try:
+            return EventSeverity[value.strip().upper()]
+        except KeyError:
+            pass
+        try:
+            return EventSeverity(int(value))
+        except ValueError:
+            raise ValueError(f"Unknown severity: {value}")
+
+    @property
+    def selects(self):
+        """True when this filter selects items, rather than only projecting their fields"""
+        return self.ids is not None or self.names is not None or self.severity is not None
+
+    def matches_template(self, template):
+        """Check if the items of a template pass the selection
+
+        Args:
+            template: template of the items
+        Returns:
+            True when passing, False otherwise
+        """
+        if self.ids is not None and template.get_id() not in self.ids:
+            return False
+        if self.names is not None:
+            names = [template.get_name()]
+            if hasattr(template, "get_full_name"):
+                names.append(template.get_full_name())
+            if not any(fnmatch.fnmatchcase(name, glob) for glob in self.names for name in names):
+                return False
+        if self.severity is not None:
+            # Items without severity (channels, commands) do not pass a severity threshold
+            severity = template.get_severity() if hasattr(template, "get_severity") else None
+            if severity is None or severity.value < self.severity.value:
+                return False
+        return True
+
+    def matches(self, item):
+        """Check if an item passes the selection
+
+        Args:
+            item: history item
+        Returns:
+            True when passing, False otherwise
+        """
+        template = getattr(item, "template", None)
+        if template is None:
+            return self.ids is None or getattr(item, "id", None) in self.ids
+        return self.matches_template(template)
+
+    def resolve(self, templates):
+        """Resolve the selection to the ids of the templates of a dictionary passing it
+
+        Args:
+            templates: dictionary of ids to templates
+        Returns:
+            set of the selected ids
+        """
+        key = (id(templates), len(templates), self.ids, self.names, self.severity)
+        with self._RESOLVED_LOCK:
+            resolved = self._RESOLVED.get(key)
+        if resolved is None:
+            candidates = templates.keys() if self.ids is None else self.ids.intersection(templates.keys())
+            resolved = frozenset(
+                item_id for item_id in candidates if self.matches_template(templates[item_id])
+            )
+            with self._RESOLVED_LOCK:
+                if len(self._RESOLVED) >= self.MAX_RESOLVED:
+                    self._RESOLVED.clear()
+                self._RESOLVED[key] = resolved
+        return resolved
+
+    def project(self, item):
+        """Project an item onto the requested fields. Fields unknown to the item are omitted.
+
+        Args:
+            item: (processed) history item
+        Returns:
+            item, or dictionary of the requested fields of the item
+        """
+        if self.fields is None:
+            return item
+        encoded = item if isinstance(item, dict) else default(item)
+        return {field: encoded[field] for field in self.fields if field in encoded}
@@ -1,15 +1,22 @@
 ####
 # json.py:
 #
-# Encodes GDS objects as JSON.
+# Encodes GDS objects as JSON. History items (channels, events, commands) are encoded into compact JSON fragments that
+# are kept in a bounded cache and reused by every response including them (with the RAM histories, whose items are
+# shared by all requests). orjson is used for these fragments when installed.
 ####
+import json
+import math
+import threading
 from abc import ABCMeta
+from collections import OrderedDict
 from enum import Enum
 from inspect import getmembers, isroutine
 from typing import Type
 from uuid import UUID
 
 import flask.json
+
 from fprime_gds.common.models.serialize.time_type import TimeType
 from fprime_gds.common.models.serialize.type_base import BaseType, ValueType
 
@@ -18,6 +25,16 @@ from fprime_gds.common.data_types.cmd_data import CmdData
 from fprime_gds.common.data_types.event_data import EventData
 from fprime_gds.common.templates.data_template import DataTemplate
 
+# Try to import orjson, but fallback to the standard json encoder if not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Class properties caching codecs of the types, which are not part of the type definitions
+CODEC_PROPERTIES = ("STRUCT", "FIXED_SIZE")
+
 
 def jsonify_base_type(input_type: Type[BaseType]) -> dict:
     """Turn a base type into a JSONable dictionary
@@ -40,7 +57,11 @@ def jsonify_base_type(input_type: Type[BaseType]) -> dict:
         input_type,
         lambda value: not isroutine(value) and not isinstance(value, property),
     )
-    jsonable_dict = {name: value for name, value in members if not name.startswith("_")}
+    jsonable_dict = {
+        name: value
+        for name, value in members
+        if not name.startswith("_") and name not in CODEC_PROPERTIES
+    }
     jsonable_dict.update({"name": input_type.__name__})
     return jsonable_dict
 
@@ -144,11 +165,12 @@ def time_type(obj):
         JSON compatible python anonymous type (dictionary)
     """
     assert isinstance(obj, TimeType), "Incorrect type for serialization method"
+    base, context, seconds, useconds = obj.fields
     return {
-        "base": obj.timeBase.numeric_value,
-        "context": obj.timeContext,
-        "seconds": obj.seconds,
-        "microseconds": obj.useconds,
+        "base": base,
+        "context": context,
+        "seconds": seconds,
+        "microseconds": useconds,
     }
 
 
@@ -188,3 +210,132 @@ def default(obj):
     if isinstance(obj, ValueType):
         return obj.val
     return flask.json.provider.DefaultJSONProvider.default(obj)
+
+
+def dumps(obj) -> str:
+    """Compact JSON text of an object, encoding GDS types through `default`
+
+    Args:
+        obj: object to serialize into JSON
+
+    Returns:
+        JSON text
+    """
+    return json.dumps(obj, default=default, separators=(",", ":"))
+
+
+def _orjson_safe(obj):
+    """Check that an object holds no non-finite floats, which orjson would encode as null"""
+    kind = type(obj)
+    if kind is dict:
+        return all(map(_orjson_safe, obj.values()))
+    if kind is list or kind is tuple:
+        return all(map(_orjson_safe, obj))
+    return not isinstance(obj, float) or math.isfinite(obj)
+
+
+HISTORY_ITEM_TYPES = (ChData, EventData, CmdData)
+
+
+class FragmentCache:
+    """Bounded least-recently-used cache of the encoded fragments of history items
+
+    Fragments are kept outside of the items, such that the memory held by the histories is not multiplied by the
+    encodings. The cache is bounded by the total length of its fragments, and holds the items it caches until they are
+    evicted. Items are keyed by identity, thus the cache only serves histories handing out the same item objects to
+    every request (i.e. the RAM histories). A max_size of 0 disables the cache.
+    """
+
+    # Default bound of the total length of the cached fragments
+    MAX_SIZE = 16 * 1024 * 1024
+
+    def __init__(self, max_size=MAX_SIZE):
+        """
+        Constructor
+
+        :param max_size: bound of the total length (characters or bytes) of the cached fragments
+        """
+        self.max_size = max_size
+        self.size = 0
+        self.lock = threading.Lock()
+        self.fragments = OrderedDict()
+
+    def get(self, item, encode):
+        """
+        Fragment of an item, encoded on a miss
+
+        :param item: history item
+        :param encode: function encoding the item into its fragment
+        :return: fragment of the item
+        """
+        if self.max_size <= 0:
+            return encode(item)
+        with self.lock:
+            fragment = self.fragments.get(item)
+            if fragment is not None:
+                self.fragments.move_to_end(item)
+                return fragment
+        fragment = encode(item)
+        with self.lock:
+            if item not in self.fragments and len(fragment) <= self.max_size:
+                self.fragments[item] = fragment
+                self.size += len(fragment)
+                while self.size > self.max_size:
+                    self.size -= len(self.fragments.popitem(last=False)[1])
+        return fragment
+
+    def clear(self):
+        """Forget every cached fragment"""
+        with self.lock:
+            self.fragments.clear()
+            self.size = 0
+
+
+FRAGMENTS = FragmentCache()
+
+
+def fragment(item) -> str:
+    """JSON fragment of a history item
+
+    Channels, events, and commands are not modified once constructed, so their fragment is encoded on first use and
+    kept in FRAGMENTS for later responses. Other items are encoded each time.
+
+    Args:
+        item: history item to serialize into JSON
+
+    Returns:
+        JSON text
+    """
+    if type(item) in HISTORY_ITEM_TYPES:
+        return FRAGMENTS.get(item, _encode_item)
+    return dumps(item)
+
+
+def _encode_item(item):
+    """Encode a history item through its minimal encoder
+
+    orjson is used when installed unless the item holds non-finite floats, which orjson encodes as null rather than the
+    NaN and Infinity understood by the UI, or integers beyond 64 bits, which orjson rejects. orjson encodes python enums
+    natively rather than through `default`, and is thus not used for arbitrary objects (e.g. templates).
+    """
+    encoded = JSON_ENCODERS[type(item)](item)
+    if orjson is not None and _orjson_safe(encoded):
+        try:
+            return orjson.dumps(encoded, default=default).decode("utf-8")
+        except TypeError:
+            pass
+    return dumps(encoded)
+
+
+def encode_history(response) -> str:
+    """JSON text of a history response, embedding the fragments of the history items
+
+    Args:
+        response: response dictionary holding the "history" list of items
+
+    Returns:
+        JSON text
+    """
+    items = ",".join([fragment(item) for item in response["history"]])
+    others = dumps({key: value for key, value in response.items() if key != "history"})
+    return f'{{"history":[{items}]{"," if len(others) > 2 else ""}{others[1:]}'
@@ -26,9 +26,16 @@ class LogList(flask_restful.Resource):
 
 class LogFile(flask_restful.Resource):
     """
-    Command dictionary endpoint. Will return dictionary when hit with a GET.
+    Log file endpoint. Will return a chunk of the log file when hit with a GET.
+
+    Logs are read incrementally: the response carries the offset of the next unread byte (`next`) that the caller
+    supplies as `offset` of the following request, such that only the bytes appended since are read and sent. Reads are
+    capped to MAX_CHUNK bytes. Without an offset, the tail of the log is returned. The chunk is returned as `text`.
     """
 
+    # Maximum bytes read per request
+    MAX_CHUNK = 1024 * 1024
+
     def __init__(self, logdir):
         """
         Constructor used to setup the log directory.
@@ -36,12 +43,23 @@ class LogFile(flask_restful.Resource):
         :param logdir: log directory to search for logs
         """
         self.logdir = logdir
+        self.parser = flask_restful.reqparse.RequestParser()
+        self.parser.add_argument(
+            "offset",
+            type=int,
+            required=False,
+            help="Byte offset to read from, negative offsets count from the end (default: tail of the log)",
+            location="args",
+        )
+        self.parser.add_argument(
+            "length", type=int, required=False, help="Maximum bytes to read, positive (default: 1MiB)", location="args"
+        )
 
     def get(self, name):
         """
-        Returns the logdir.
+        Returns a chunk of the log along with its offset, the offset of the next chunk, and the size of the log.
         """
-        logs = {}
+        args = self.parser.parse_args()
         # Sanitization of path characters
         name = name.replace(os.path.sep, "_")
         # normpath() + startswith() to ensure the file is strictly within logdir
@@ -50,8 +68,33 @@ class LogFile(flask_restful.Resource):
             return ""
         if not os.path.exists(full_path):
             return ""
-        offset = 0
-        with open(full_path) as file_handle:
+        length = args.get("length")
+        if length is not None and length <= 0:
+            flask_restful.abort(400, message=f"Invalid length {length}, must be positive")
+        length = self.MAX_CHUNK if length is None else min(length, self.MAX_CHUNK)
+        offset = args.get("offset")
+        tail = offset is None or offset < 0
+        size = os.path.getsize(full_path)
+        if offset is None:
+            offset = -length
+        if offset < 0:
+            offset = max(0, size + offset)
+        # Offsets past the end of the log mean the log was truncated or replaced, thus it is read again
+        elif offset > size:
+            offset = 0
+        with open(full_path, "rb") as file_handle:
             file_handle.seek(offset)
-            logs[name] = file_handle.read()
-        return logs
+            data = file_handle.read(length)
+        # Chunks starting mid-log or filling the read are cut on line boundaries, the rest is read by the next request
+        if tail and offset > 0 and b"\n" in data:
+            skipped = data.index(b"\n") + 1
+            data = data[skipped:]
+            offset += skipped
+        if len(data) == length and b"\n" in data:
+            data = data[: data.rindex(b"\n") + 1]
+        return {
+            "text": data.decode("utf-8", errors="replace"),
+            "offset": offset,
+            "next": offset + len(data),
+            "size": max(size, offset + len(data)),
+        }
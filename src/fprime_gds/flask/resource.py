@@ -5,18 +5,40 @@ establish standard patterns, and prevent replicated errors.
 
 @author lestarch
 """
+import gzip
+import hashlib
+import threading
+
+import flask
+import flask_restful
 from flask_restful import Resource
 from flask_restful.reqparse import RequestParser
 
+from fprime_gds.flask import binary
 from fprime_gds.flask.errors import build_error_object
+from fprime_gds.flask.filters import HistoryFilter
+from fprime_gds.flask.json import dumps, encode_history
+
+# Try to import brotli, but only compress with gzip if not installed
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 
 class DictionaryResource(Resource):
     """
     Resource tasked with serving the supplied dictionary through flask. The dictionary will be returned as-is and thus
     should be flask compatible. Errors with the dictionary are a 500 server error and may not be recovered.
+
+    Dictionaries do not change while the GDS runs. The response is thus encoded and compressed once per dictionary (see
+    `encode`) and served with an ETag such that clients revalidating their cached copy are answered with a 304.
     """
 
+    # Encoded responses by dictionary id: (dictionary, digest, {content encoding: body})
+    _ENCODED = {}
+    _ENCODED_LOCK = threading.Lock()
+
     def __init__(self, dictionary, project_version, framework_version, metadata):
         """Constructor used to setup for dictionary
 
@@ -35,14 +57,48 @@ class DictionaryResource(Resource):
         """HTTP GET method handler for dictionary resource
 
         Returns:
-            dictionary ready for conversion into JSON
+            encoded dictionary response in the best encoding accepted by the client, or 304 when not modified
         """
-        return {
-            "dictionary": self.dictionary,
-            "project_version": self.project_version,
-            "framework_version": self.framework_version,
-            "metadata": self.metadata
-        }
+        digest, encodings = self.encode()
+        encoding = flask.request.accept_encodings.best_match(
+            [encoding for encoding in encodings if encoding != "identity"], default="identity"
+        )
+        # Strong ETags must differ between content encodings of a response
+        etag = f"{digest}-{encoding}"
+        if flask.request.if_none_match.contains(etag):
+            response = flask.Response(status=304)
+        else:
+            response = flask.Response(encodings[encoding], mimetype="application/json")
+            if encoding != "identity":
+                response.headers["Content-Encoding"] = encoding
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "no-cache"
+        response.vary.add("Accept-Encoding")
+        return response
+
+    def encode(self):
+        """Encode and compress the dictionary response, once for each dictionary
+
+        Returns:
+            tuple of the response digest and a dictionary of content encodings to the encoded response
+        """
+        with self._ENCODED_LOCK:
+            dictionary, digest, encodings = self._ENCODED.get(id(self.dictionary), (None, None, None))
+            if dictionary is not self.dictionary:
+                body = dumps(
+                    {
+                        "dictionary": self.dictionary,
+                        "project_version": self.project_version,
+                        "framework_version": self.framework_version,
+                        "metadata": self.metadata,
+                    }
+                ).encode("utf-8")
+                digest = hashlib.sha256(body).hexdigest()
+                # Preferred encodings first, as the first of equally accepted encodings is served
+                encodings = {"br": brotli.compress(body)} if brotli is not None else {}
+                encodings.update({"gzip": gzip.compress(body), "identity": body})
+                self._ENCODED[id(self.dictionary)] = (self.dictionary, digest, encodings)
+            return digest, encodings
 
 
 class HistoryResourceBase(Resource):
@@ -50,18 +106,24 @@ class HistoryResourceBase(Resource):
     Base class for resources serving histories. Internalizes a history, serves the latest data from that history, and
     clears the history data such that replicated data is not sent. The GET method will loop through history object
     calling `process` to allow subclasses to post-process the object for sending. Errors in process will be aggregated
-    but will not fail the GET transaction, however; errors outside of process will result in a 500 error.
+    but will not fail the GET transaction, however; errors outside of process will result in a 500 error. Responses are
+    encoded with `encode_history` such that each history item is encoded to JSON once for all sessions. Clients accepting
+    MessagePack (see binary.py) are answered in MessagePack instead.
 
     The history base object also sets up the request parser to handle the session argument needed to track the pointer
     into the history. This session is automatically deleted when the DELETE handler is invoked such that the GDS is
     kept cleaned-up.
+
+    Sessions may select the items they are served and the fields of these items (see filters.py). When the templates of
+    the history are supplied, selections are resolved to ids and retrieved through the history's id index.
     """
 
-    def __init__(self, history):
+    def __init__(self, history, templates=None):
         """Construct this history resource around a supplied history
 
         Args:
             history: history used as a base data store for this resource
+            templates: dictionary of ids to the templates of the history items, used to resolve selections
         """
         self.parser = RequestParser()
         self.parser.add_argument(
@@ -70,8 +132,11 @@ class HistoryResourceBase(Resource):
         self.parser.add_argument(
             "limit", required=False, help="Limit to results returned (default 2000)", location="args"
         )
+        for argument, help_text in HistoryFilter.ARGUMENTS.items():
+            self.parser.add_argument(argument, required=False, help=help_text, location="args")
 
         self.history = history
+        self.templates = templates
 
     def process(self, item):
         """Base history object processing function (does nothing)"""
@@ -79,9 +144,64 @@ class HistoryResourceBase(Resource):
 
     def get(self):
         """HTTP GET handler returning new history objects"""
+        args = self.parser.parse_args()
+        limit = args.get("limit") if args.get("limit") is not None else 2000
+        return self.respond(self.poll(args.get("session"), int(limit), self.parse_filter(args)))
+
+    @staticmethod
+    def parse_filter(args):
+        """Build the filter of the request arguments, aborting with a 400 error on invalid arguments
+
+        Args:
+            args: parsed request arguments
+        Returns:
+            HistoryFilter or None when not filtering
+        """
+        try:
+            return HistoryFilter.from_args(args)
+        except ValueError as exc:
+            flask_restful.abort(400, message=str(exc))
+
+    def respond(self, response):
+        """Build the HTTP response of a history response, encoded in the format accepted by the client
+
+        Args:
+            response: dictionary of the history objects, validation count, dropped count and errors
+        Returns:
+            flask response
+        """
+        media_type = flask.request.accept_mimetypes.best_match(("application/json",) + binary.MEDIA_TYPES)
+        if media_type in binary.MEDIA_TYPES:
+            http_response = flask.Response(self.encode_binary(response), mimetype=media_type)
+        else:
+            http_response = flask.Response(encode_history(response), mimetype="application/json")
+        http_response.vary.add("Accept")
+        return http_response
+
+    def encode_binary(self, response):
+        """Encode a history response in MessagePack
+
+        Args:
+            response: dictionary of the history objects, validation count, dropped count and errors
+        Returns:
+            encoded bytes
+        """
+        return binary.encode_history(response)
+
+    def poll(self, session, limit, history_filter=None):
+        """Retrieve the new history objects of a session, in the form returned by GET
+
+        The validation count is not available (None) for sessions selecting items, as it counts all items.
+
+        Args:
+            session: session key for fetching data
+            limit: limit to results returned
+            history_filter: optional HistoryFilter selecting and projecting the objects
+        Returns:
+            dictionary of the history objects, validation count, dropped count and errors
+        """
         errors = []
         returned_items = []
-        args = self.parser.parse_args()
 
         # Set the clear time if possible
         if hasattr(self.history, "set_clear_time"):
@@ -89,19 +209,54 @@ class HistoryResourceBase(Resource):
 
         # Get the new items from history ensuring it is clear in a fail-safe attempt to repeat recuring errors
         try:
-            session = args.get("session")
-            limit = args.get("limit") if args.get("limit") is not None else 2000
-            new_items = self.history.retrieve(session, int(limit))
+            new_items = self.retrieve(session, limit, history_filter)
             validation = -1
-            if hasattr(self.history, "get_seen_count"):
+            if history_filter is not None and history_filter.selects:
+                validation = None
+            elif hasattr(self.history, "get_seen_count"):
                 validation = self.history.get_seen_count(session)
+            dropped = 0
+            if hasattr(self.history, "pop_dropped_count"):
+                dropped = self.history.pop_dropped_count(session)
         finally:
             self.history.clear()
 
+        # Explicitly mark data evicted from the history before this session could retrieve it
+        if dropped > 0:
+            errors.append(
+                {
+                    "type": "DataDropped",
+                    "message": f"{dropped} items were dropped from the history before being retrieved",
+                    "args": [dropped],
+                }
+            )
+
         # Process each item from history aggregating but not failing on processing errors
         for item in new_items:
             try:
-                returned_items.append(self.process(item))
+                item = self.process(item)
+                returned_items.append(item if history_filter is None else history_filter.project(item))
             except Exception as exc:
                 errors.append(build_error_object(exc))
-        return {"history": returned_items, "validation": validation, "errors": errors}
+        return {
+            "history": returned_items,
+            "validation": validation,
+            "dropped": dropped,
+            "errors": errors,
+        }
+
+    def retrieve(self, session, limit, history_filter=None):
+        """Retrieve the new history objects of a session passing the filter
+
+        Args:
+            session: session key for fetching data
+            limit: limit to results returned
+            history_filter: optional HistoryFilter selecting the objects
+        Returns:
+            list of history objects
+        """
+        if history_filter is None or not history_filter.selects:
+            return self.history.retrieve(session, limit)
+        if self.templates is not None:
+            return self.history.retrieve_by_id(history_filter.resolve(self.templates), session, limit)
+        return [item for item in self.history.retrieve(session, limit) if history_filter.matches(item)]
@@ -1,53 +1,246 @@
 ####
+# sequence.py:
 #
+# This file captures the HTML endpoints compiling (and optionally uplinking) sequences. Compilation runs in a pool of
+# processes holding the command dictionary preloaded, such that compiles neither block the web server nor interfere
+# with each other's output. Each compilation is a job tracked by id. With a standalone pipeline, the jobs run in the
+# pipeline process (see flask/components.py) such that any web worker answers for the jobs of the others.
+#
+#  PUT /sequence: compile a sequence, responding once compiled
+#  POST /sequence/jobs: submit a sequence compilation job, responding with the job (and its id) immediately
+#      Input Data: {
+#                      "key": "0xfeedcafe",     # Protection key
+#                      "name": "my.seq",        # Name of the sequence file
+#                      "text": "...",           # Text of the sequence file
+#                      "uplink": "true"         # Uplink the compiled sequence
+#                  }
+#  GET /sequence/jobs: list the jobs
+#  GET /sequence/jobs/<job_id>: status and captured output of a job
 ####
+import contextlib
+import multiprocessing
+import os
 import re
-import sys
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from io import StringIO
 from pathlib import Path
 
 import flask_restful
 import flask_restful.reqparse
 
-from fprime_gds.common.tools.seqgen import SeqGenException, generateSequence
+from fprime_gds.common.tools.seqgen import SeqGenException, generateSequence, loadCommands
 
+# Commands of the dictionary, preloaded in each process of the pool
+_COMMANDS = None
 
-class StdioTheif(object):
-    """
-    This class consumes all standard out and error production produced with-in a context block (with :) capturing it.
+
+def _preload(dictionary):
+    """Initializer of the processes of the pool loading the commands of the dictionary once"""
+    global _COMMANDS
+    try:
+        _COMMANDS = loadCommands(dictionary)
+    except SeqGenException:
+        # Reported by each compilation, as generateSequence reloads the dictionary when no commands are preloaded
+        _COMMANDS = None
+
+
+def _compile(dictionary, seq_path, bin_path):
     """
+    Compile a sequence in a process of the pool. Standard output and error are captured for the job, which is safe as
+    each process compiles a single sequence at a time.
 
-    def __init__(self):
-        """Setup our capture devices"""
-        self.io = StringIO()
-        self.output = ""
+    :param dictionary: path to the dictionary
+    :param seq_path: path to the sequence file
+    :param bin_path: path to the binary sequence to write
+    :return: tuple of the captured output and the error (dictionary of "error" and "type") or None
+    """
+    output = StringIO()
+    error = None
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            generateSequence(seq_path, bin_path, dictionary, 0xFFFF, cont=True, commands=_COMMANDS)
+        except OSError as ose:
+            error = {"error": str(ose), "type": "error"}
+        except SeqGenException as exc:
+            error = {"error": str(exc), "type": "validation"}
+    return output.getvalue(), error
 
-    def write(self, *args, **kwargs):
-        """Write tee for all possible inputs"""
-        stripped_msg = " ".join(args)
-        self.io.write(stripped_msg, **kwargs)
 
-    def __enter__(self):
-        """Entry overwrite"""
-        sys.stdout = self
-        sys.stderr = self
-        return None
+class SequenceJobs:
+    """
+    Sequence compilation jobs run by a pool of processes. The pool is started with the first job, and spawns (rather
+    than forks) its processes as the web server is threaded. Finished jobs are kept for polling up to MAX_JOBS.
+    """
 
-    def __exit__(self, *_):
-        """No worries here"""
-        sys.stdout = sys.__stdout__
-        sys.stderr = sys.__stderr__
-        self.io.seek(0)
-        self.output = self.io.read()
+    # Jobs kept, beyond which the oldest finished jobs are forgotten
+    MAX_JOBS = 256
 
+    def __init__(self, dictionary, tempdir, uplinker, destination, workers=None):
+        """
+        Constructor
 
-class SequenceCompiler(flask_restful.Resource):
-    def __init__(self, dictionary, tempdir, uplinker, destination):
+        :param dictionary: path to the dictionary
+        :param tempdir: directory holding the compiled sequences
+        :param uplinker: uplinker of compiled sequences
+        :param destination: remote directory of uplinked sequences
+        :param workers: count of processes compiling sequences, None for up to 4 depending on the CPUs
+        """
         self.dictionary = dictionary
         self.tempdir = Path(tempdir)
         self.uplinker = uplinker
         self.destination = destination
+        self.workers = workers if workers is not None else min(4, os.cpu_count() or 1)
+        self.lock = threading.Lock()
+        self.jobs = OrderedDict()
+        self.pool = None
+
+    def _get_pool(self):
+        """Start the pool of processes, or restart it when broken (e.g. a process was killed)"""
+        with self.lock:
+            if self.pool is None:
+                self.pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_preload,
+                    initargs=(self.dictionary,),
+                )
+            return self.pool
+
+    def submit(self, name, text, uplink=False):
+        """
+        Submit a sequence compilation job
+
+        :param name: name of the sequence file
+        :param text: text of the sequence file
+        :param uplink: uplink the compiled sequence
+        :return: job dictionary
+        """
+        job = {
+            "id": uuid.uuid4().hex,
+            "name": name,
+            "uplink": uplink,
+            "status": "queued",
+            "submitted": time.time(),
+            "finished": None,
+            "output": "",
+            "error": None,
+            "_done": threading.Event(),
+        }
+        # Each job compiles in a directory of its own, such that concurrent jobs of the same name do not collide
+        workdir = Path(tempfile.mkdtemp(prefix="sequence-", dir=self.tempdir))
+        seq_path = workdir / name
+        with open(seq_path, "w") as file_handle:
+            file_handle.write(text)
+        with self.lock:
+            self.jobs[job["id"]] = job
+            self._forget()
+        try:
+            future = self._get_pool().submit(_compile, self.dictionary, seq_path, seq_path.with_suffix(".bin"))
+        except BrokenProcessPool:
+            with self.lock:
+                self.pool = None
+            future = self._get_pool().submit(_compile, self.dictionary, seq_path, seq_path.with_suffix(".bin"))
+        job["_future"] = future
+        future.add_done_callback(lambda done: self._finish(job, workdir, done))
+        return self.describe(job)
+
+    def _finish(self, job, workdir, future):
+        """Record the outcome of a job, uplinking the compiled sequence when requested"""
+        try:
+            output, error = future.result()
+        except Exception as exc:
+            output, error = "", {"error": f"Sequence compilation failed: {exc}", "type": "error"}
+        bin_path = (workdir / job["name"]).with_suffix(".bin")
+        try:
+            if error is None and job["uplink"]:
+                compiled = self.tempdir / bin_path.name
+                shutil.move(str(bin_path), str(compiled))
+                destination = Path(self.destination) / compiled.name
+                self.uplinker.enqueue(str(compiled), str(destination))
+                output += f"Uplinking to {destination}. Please confirm uplink EVRs before running.\n"
+        except OSError as ose:
+            error = {"error": str(ose), "type": "error"}
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+        with self.lock:
+            job.update(
+                {
+                    "status": "failed" if error is not None else "succeeded",
+                    "finished": time.time(),
+                    "output": output,
+                    "error": error,
+                }
+            )
+        job["_done"].set()
+
+    def _forget(self):
+        """Forget the oldest finished jobs beyond MAX_JOBS. Lock must be held."""
+        excess = len(self.jobs) - self.MAX_JOBS
+        for job_id in [job_id for job_id, job in self.jobs.items() if job["_done"].is_set()][: max(excess, 0)]:
+            del self.jobs[job_id]
+
+    def get(self, job_id):
+        """
+        Accessor for a job
+
+        :param job_id: id of the job
+        :return: job dictionary, None for unknown jobs
+        """
+        with self.lock:
+            job = self.jobs.get(job_id)
+            return None if job is None else self.describe(job)
+
+    def list(self):
+        """
+        Accessor for all jobs, oldest first
+
+        :return: list of job dictionaries
+        """
+        with self.lock:
+            return [self.describe(job) for job in self.jobs.values()]
+
+    def wait(self, job_id, timeout=None):
+        """
+        Wait for a job to finish
 
+        :param job_id: id of the job
+        :param timeout: seconds to wait, None to wait until finished
+        :return: job dictionary
+        """
+        with self.lock:
+            job = self.jobs[job_id]
+        job["_done"].wait(timeout)
+        return self.get(job_id)
+
+    @staticmethod
+    def describe(job):
+        """Public fields of a job, with the running status of its future"""
+        described = {key: value for key, value in job.items() if not key.startswith("_")}
+        future = job.get("_future")
+        if described["status"] == "queued" and future is not None and future.running():
+            described["status"] = "running"
+        return described
+
+    def shutdown(self):
+        """Stop the pool of processes"""
+        with self.lock:
+            pool, self.pool = self.pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+
+class SequenceParserMixin:
+    """Parsing and validation of the sequence arguments shared by the sequence resources"""
+
+    def setup_parser(self):
+        """Set up the parser of the sequence arguments"""
         self.parser = flask_restful.reqparse.RequestParser()
         self.parser.add_argument(
             "key", required=True, help="Protection key. Must be: 0xfeedcafe."
@@ -62,7 +255,12 @@ class SequenceCompiler(flask_restful.Resource):
             "uplink", required=True, help="Text of sequence file to create"
         )
 
-    def put(self):
+    def parse_sequence(self):
+        """Parse and validate the sequence arguments, aborting on invalid arguments
+
+        Returns:
+            tuple of name, text, and uplink
+        """
         args = self.parser.parse_args()
         key = args.get("key", None)
         name = args.get("name", "")
@@ -78,26 +276,54 @@ class SequenceCompiler(flask_restful.Resource):
                 403,
                 message={"error": "Supply filename with .seq suffix", "type": "error"},
             )
-        temp_seq_path = self.tempdir / Path(name).name
-        temp_bin_path = temp_seq_path.with_suffix(".bin")
-        messages = ""
+        return name, text, uplink
+
+
+class SequenceCompiler(SequenceParserMixin, flask_restful.Resource):
+    """Compiles a sequence, responding with the output of the compiler once compiled"""
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.setup_parser()
+
+    def put(self):
+        name, text, uplink = self.parse_sequence()
         try:
-            with open(temp_seq_path, "w") as file_handle:
-                file_handle.write(text)
-            thief = StdioTheif()
-            with thief:
-                generateSequence(
-                    temp_seq_path, temp_bin_path, self.dictionary, 0xFFFF, cont=True
-                )
-            messages += thief.output
-            if uplink:
-                destination = Path(self.destination) / temp_bin_path.name
-                self.uplinker.enqueue(str(temp_bin_path), str(destination))
-                messages += f"Uplinking to {destination}. Please confirm uplink EVRs before running.\n"
+            job = self.jobs.submit(name, text, uplink)
         except OSError as ose:
             flask_restful.abort(403, message={"error": str(ose), "type": "error"})
-        except SeqGenException as exc:
-            flask_restful.abort(403, message={"error": str(exc), "type": "validation"})
-        if temp_seq_path.exists():
-            temp_seq_path.unlink()
-        return {"message": messages}
+        job = self.jobs.wait(job["id"])
+        if job["error"] is not None:
+            flask_restful.abort(403, message=job["error"])
+        return {"message": job["output"]}
+
+
+class SequenceJobList(SequenceParserMixin, flask_restful.Resource):
+    """Submits sequence compilation jobs and lists the jobs"""
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.setup_parser()
+
+    def get(self):
+        return {"jobs": self.jobs.list()}
+
+    def post(self):
+        name, text, uplink = self.parse_sequence()
+        try:
+            return self.jobs.submit(name, text, uplink)
+        except OSError as ose:
+            flask_restful.abort(403, message={"error": str(ose), "type": "error"})
+
+
+class SequenceJob(flask_restful.Resource):
+    """Status and captured output of a sequence compilation job"""
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+
+    def get(self, job_id):
+        job = self.jobs.get(job_id)
+        if job is None:
+            flask_restful.abort(404, message=f"Unknown sequence job: {job_id}")
+        return job
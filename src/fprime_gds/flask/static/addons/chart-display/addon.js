@@ -14,7 +14,7 @@ import {
 import { _datastore, _dictionaries } from "../../js/datastore.js";
 import { SiblingSet } from "./sibling.js";
 import { timeToDate } from "../../js/vue-support/utils.js";
-import {loadTextFileInputData, saveTextFileViaHref} from "../../js/loader.js";
+import {_loader, loadTextFileInputData, saveTextFileViaHref} from "../../js/loader.js";
 import {_performance} from "../../js/performance.js";
 
 import "./vendor/chart.js";
@@ -155,6 +155,58 @@ Vue.component("chart-display", {
                 // See ChartJs bug report https://github.com/chartjs/Chart.js/issues/9368
             }
             this.siblings.add(this.chart);
+            this.loadDecimated();
+        },
+        /**
+         * Get the channel selected for this chart.
+         * @return {{full_name: string, serial_path: string, id: (number|undefined)}} selected channel
+         */
+        selectedChannel() {
+            // Get channel name assuming the string is in either of these format:
+            // - component.channel format for XML dictionaries
+            // - deployment.component.channel for JSON dictionaries
+            // Can't just slice by last '.' because channel name can include complex types
+            // which are in the form of 'component.channel.fieldName'
+            let SLICE_INDEX = _dictionaries.metadata.dictionary_type == "xml" ? 2 : 3;
+            let full_name = this.selected.split(".").slice(0, SLICE_INDEX).join(".");
+            let serial_path = this.selected.split(".").slice(SLICE_INDEX).join(".");
+            let template = Object.values(_dictionaries.channels).find((channel) => channel.full_name === full_name);
+            return {full_name: full_name, serial_path: serial_path, id: (template || {}).id};
+        },
+        /**
+         * Load the samples received before this chart was registered. The samples of the chart's time span are
+         * decimated by the server into min/max buckets of about a pixel each such that long spans of high-rate
+         * telemetry are not transferred sample by sample. Fields of serializable channels are not decimated.
+         */
+        loadDecimated() {
+            let channel = this.selectedChannel();
+            if (channel.serial_path || typeof(channel.id) === "undefined") {
+                return;
+            }
+            let chart = this.chart;
+            let start = Date.now() / 1000 - this.timespan;
+            let width = Math.round((chart.canvas || {}).clientWidth || 1000);
+            _loader.load("/chart?ids=" + channel.id + "&start=" + start + "&width=" + width).then((data) => {
+                let buckets = data.channels[channel.id];
+                if (this.chart !== chart || !buckets) {
+                    return;
+                }
+                let data_array = chart.data.datasets[0].data;
+                // Samples already received live are kept, only earlier buckets are added
+                let first = (data_array[0] || {x: Infinity}).x;
+                let points = [];
+                buckets.times.forEach((time, i) => {
+                    let x = new Date(time * 1000);
+                    if (x < first) {
+                        points.push({x: x, y: buckets.min[i]});
+                        if (buckets.max[i] !== buckets.min[i]) {
+                            points.push({x: x, y: buckets.max[i]});
+                        }
+                    }
+                });
+                data_array.unshift(...points);
+                chart.update("quiet");
+            }).catch((error) => console.error("[ERROR] Failed to load chart data: " + error));
         },
         /**
          * Reset chart zoom back to default. This should affect all siblings when timescales are locked.
@@ -197,17 +249,9 @@ Vue.component("chart-display", {
             if (this.selected == null || this.chart == null) {
                 return;
             }
-            // Get channel name assuming the string is in either of these format:
-            // - component.channel format for XML dictionaries
-            // - deployment.component.channel for JSON dictionaries
-            // Can't just slice by last '.' because channel name can include complex types
-            // which are in the form of 'component.channel.fieldName'
-            let SLICE_INDEX = _dictionaries.metadata.dictionary_type == "xml" ? 2 : 3;
-            let channel_full_name = this.selected
-                .split(".")
-                .slice(0, SLICE_INDEX)
-                .join(".");
-            let serial_path = this.selected.split(".").slice(SLICE_INDEX).join(".");
+            let selected = this.selectedChannel();
+            let channel_full_name = selected.full_name;
+            let serial_path = selected.serial_path;
 
             // Filter channels down to the graphed channel
             let new_channels = channels.filter((channel) => {
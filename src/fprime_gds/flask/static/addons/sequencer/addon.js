@@ -6,7 +6,7 @@
  * tag pair. It does not require any input bindings to the plugin.
  *
  * The plugin depends on the `_datastore` singleton for command dictionaries and then `_loader` singleton used to
- * uplink sequences via the `/sequence` endpoint.
+ * compile and uplink sequences via the `/sequence/jobs` endpoints.
  */
 import {sequencer_template} from "./addon-templates.js";
 import {_loader} from "../../js/loader.js";
@@ -19,8 +19,26 @@ import {processResponse} from "./lint.js";
 import { SaferParser } from "../../js/json.js";
 SaferParser.register();
 
+// Milliseconds between polls of a submitted sequence job
+const JOB_POLL_INTERVAL = 200;
+
+/**
+ * Poll a sequence compilation job until finished.
+ * @param job: job as returned by the server
+ * @return {Promise<unknown>} resolving to the finished job
+ */
+function poll_job(job) {
+    if (job.status === "succeeded" || job.status === "failed") {
+        return Promise.resolve(job);
+    }
+    return new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL)).then(
+        () => _loader.load("/sequence/jobs/" + job.id).then(poll_job)
+    );
+}
+
 /**
- * Sequence sender function used to uplink the sequence and return a promise of how to handle the server's return.
+ * Sequence sender function used to uplink the sequence and return a promise of how to handle the server's return. The
+ * sequence is compiled as a job on the server, which is polled until finished.
  * @param view: view to mine for sequence content.
  * @param filename: filename of sequence to send
  * @param uplink: uplink true/false
@@ -41,14 +59,14 @@ function sequence_sender(view, filename, uplink, processor) {
             parsed = parsed.message || parsed;
             resolve(func(parsed));
         };
-        _loader.load("/sequence", "PUT",
+        _loader.load("/sequence/jobs", "POST",
             {
                 "key": 0xfeedcafe,
                 "name": filename,
                 "text": code,
                 "uplink": (uplink ? uplink : false).toString()
             }
-        ).then(handler).catch(handler);
+        ).then(poll_job).then((job) => resolve(func(job.error || job.output))).catch(handler);
     });
 }
 
@@ -21,6 +21,10 @@ export let config = {
         channels: 500,
         default: 1000
     },
+    // Stream events, channels, and commands from the server as they arrive rather than polling for them
+    dataStreaming: true,
+    // Poll events, channels, and commands in the compact MessagePack encoding rather than JSON
+    dataBinary: true,
     // Summary counter fields containing object of field: bootstrap class
     summaryFields: {"WARNING_HI": "warning", "FATAL": "danger", "GDS_Errors": "danger"},
 
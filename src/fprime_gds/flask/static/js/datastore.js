@@ -232,6 +232,10 @@ class DataStore {
         ];
         let polling_keys = this.polling_info.map((item) => { return item.endpoint; });
         _settings.setupPollingSettings(polling_keys);
+        // Endpoints pushed through the event stream, rather than polled, when streaming is available
+        this.streamed_endpoints = (config.dataStreaming && typeof(EventSource) !== "undefined") ?
+            ["events", "command_history", "channels"] : [];
+        this.stream = null;
     }
 
     /**
@@ -273,6 +277,41 @@ class DataStore {
         this.polling_info.forEach((item) => {
             this.reregisterPoller(item.endpoint);
         });
+        this.registerStream();
+    }
+
+    /**
+     * Build the function processing the data of an endpoint, as returned by a poll or pushed through the stream.
+     * @param endpoint: name of the endpoint
+     * @return: processing function
+     */
+    getProcessor(endpoint) {
+        let handler = ((this.polling_info.filter((item) => item.endpoint === endpoint)[0]) || {}).handler;
+        let bound = (handler instanceof HistoryHelper) ? handler.update.bind(handler) : handler.bind(this);
+        let processor = _validator.wrapResponseHandler(endpoint, bound);
+        if (endpoint === "events") {
+            let severity_processor = (severity) => {
+                return severity.value.replace("EventSeverity.", "");
+            };
+            processor = _validator.wrapFieldCounter(
+                "severity",
+                processor,
+                severity_processor,
+                Object.fromEntries(Object.keys(config.summaryFields).map((field_key) => [field_key, 0]))
+            );
+        }
+        return processor;
+    }
+
+    /**
+     * Opens the event stream for the streamed endpoints, replacing the polling of these endpoints.
+     */
+    registerStream() {
+        if (this.streamed_endpoints.length === 0 || this.stream !== null) {
+            return;
+        }
+        let callbacks = Object.fromEntries(this.streamed_endpoints.map((endpoint) => [endpoint, this.getProcessor(endpoint)]));
+        this.stream = _loader.registerStream(callbacks, _validator.getErrorHandler());
     }
 
     /**
@@ -329,20 +368,12 @@ class DataStore {
      */
     reregisterPoller(endpoint) {
         let handler = ((this.polling_info.filter((item) => item.endpoint === endpoint)[0]) || {}).handler;
+        // Streamed endpoints are pushed by the server and not polled
+        if (this.streamed_endpoints.indexOf(endpoint) !== -1) {
+            return;
+        }
         if (handler && _settings.polling_intervals[endpoint] > -1) {
-            let bound = (handler instanceof HistoryHelper) ? handler.update.bind(handler) : handler.bind(this);
-            let processor = _validator.wrapResponseHandler(endpoint, bound);
-            if (endpoint === "events") {
-                let severity_processor = (severity) => {
-                    return severity.value.replace("EventSeverity.", "");
-                };
-                processor = _validator.wrapFieldCounter(
-                    "severity",
-                    processor,
-                    severity_processor,
-                    Object.fromEntries(Object.keys(config.summaryFields).map((field_key) => [field_key, 0]))
-                );
-            }
+            let processor = this.getProcessor(endpoint);
             let error_fn = _validator.getErrorHandler();
             _loader.registerPoller(endpoint, processor, error_fn, _settings.polling_intervals[endpoint]);
         }
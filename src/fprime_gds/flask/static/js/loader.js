@@ -14,6 +14,7 @@
 import {config} from "./config.js";
 import {_settings} from "./settings.js";
 import {SaferParser} from "./json.js";
+import {decodeHistory} from "./msgpack.js";
 SaferParser.register();
 
 /**
@@ -94,19 +95,22 @@ class Loader {
                 "url": "/commands",
                 "last": null,
                 "running": false,
-                "queued": false
+                "queued": false,
+                "binary": true
             },
             "events": {
                 "url": "/events",
                 "last": null,
                 "running": false,
-                "queued": false
+                "queued": false,
+                "binary": true
             },
             "channels": {
                 "url": "/channels",
                 "last": null,
                 "running": false,
-                "queued": false
+                "queued": false,
+                "binary": true
             },
             "logdata": {
                 "url": "/logdata",
@@ -178,8 +182,9 @@ class Loader {
      * @param data: data to send.  Only useful if method != "GET". Default: no data
      * @param jsonify: jsonify the data. Default: true.
      * @param raw: return raw response, not a json parsed dataset
+     * @param binary: request a MessagePack encoded history response. Default: false
      */
-    load(endpoint, method, data, jsonify, raw) {
+    load(endpoint, method, data, jsonify, raw, binary) {
         let _self = this;
         // Default method argument to "GET"
         if (typeof(method) === "undefined") {
@@ -194,11 +199,15 @@ class Loader {
             var xhttp = new XMLHttpRequest();
             xhttp.onreadystatechange = function() {
                 // Parse as JSON or send back raw error
-                if (this.readyState === 4 && this.status === 200 && raw) {
+                if (this.readyState === 4 && this.status === 200 && binary) {
+                    resolve(decodeHistory(this.response));
+                } else if (this.readyState === 4 && this.status === 200 && raw) {
                     resolve(this.responseText);
                 } else if (this.readyState === 4 && this.status === 200) {
                     let dataObj = JSON.parse(this.responseText);
                     resolve(dataObj);
+                } else if(this.readyState === 4 && binary) {
+                    reject(this.statusText);
                 } else if(this.readyState === 4) {
                     reject(this.responseText);
                 }
@@ -209,11 +218,15 @@ class Loader {
             let arg_pairs = [["session", session], ["limit", _settings.miscellaneous.response_object_limit]];
             arg_pairs = arg_pairs.filter(pair => pair[1]);
             let arg_string = arg_pairs.map(pair =>  pair[0] + "=" + pair[1]).join("&");
-            url += (arg_string !== "") ? ("?"+ arg_string) : "";
+            url += (arg_string !== "") ? ((url.includes("?") ? "&" : "?") + arg_string) : "";
 
             let is_async = true; // all calls will be async
             xhttp.open(method, url , is_async); 
             xhttp.setRequestHeader("Cache-Control", "no-cache");
+            if (binary) {
+                xhttp.responseType = "arraybuffer";
+                xhttp.setRequestHeader("Accept", "application/msgpack");
+            }
             if (typeof(data) === "undefined") {
                 xhttp.send();
             } else if (typeof(jsonify) === "undefined" || jsonify) {
@@ -247,7 +260,8 @@ class Loader {
         context.queued = false;
         let start_time = new Date();
         // Load the endpoint and respond to the response
-        _self.load(context.url).then((data) => {
+        let binary = config.dataBinary && context.binary;
+        _self.load(context.url, "GET", undefined, undefined, false, binary).then((data) => {
             let data_items = data.history || data.files || data.logs || data;
             let data_errors = data.errors || [];
 
@@ -269,6 +283,40 @@ class Loader {
         });
     }
 
+    /**
+     * Open an event stream receiving the updates of the given endpoints as they arrive on the server. Each update is
+     * posted to the callback of its endpoint as the poller would. The browser reconnects the stream when interrupted,
+     * resuming from the session's position.
+     * @param callbacks: map of endpoint names to the callback receiving its data
+     * @param error_handler: handler to call for each error found in the updates and all communication errors
+     * @return: the event source of the stream
+     */
+    registerStream(callbacks, error_handler) {
+        let _self = this;
+        error_handler = (error_handler instanceof Function) ?  error_handler : this.error_handler;
+        let session = (this.endpoints["session"].data || {}).session || null;
+        let arg_pairs = [
+            ["session", session],
+            ["limit", _settings.miscellaneous.response_object_limit],
+            ["topics", Object.keys(callbacks).join(",")]
+        ].filter(pair => pair[1]);
+        let source = new EventSource("/stream?" + arg_pairs.map(pair => pair[0] + "=" + pair[1]).join("&"));
+        for (let endpoint in callbacks) {
+            source.addEventListener(endpoint, (event) => {
+                let data = JSON.parse(event.data);
+                let data_errors = data.errors || [];
+                // Pushed data has no request latency
+                _self.endpoints[endpoint].last = 0;
+                data_errors.map(error_handler.bind(undefined, endpoint));
+                callbacks[endpoint](data.history || [], data_errors);
+            });
+        }
+        source.onerror = () => {
+            Object.keys(callbacks).forEach((endpoint) => error_handler(endpoint, "event stream interrupted"));
+        };
+        return source;
+    }
+
     /**
      * Register a polling function to receive updates and post updates to the callback function. This takes an endpoint
      * name from the setup list of endpoints known by this Loader, and a callback to return data to on the clock.
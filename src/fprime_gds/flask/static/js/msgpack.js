@@ -0,0 +1,141 @@
+/**
+ * msgpack.js:
+ *
+ * Decoder of the MessagePack responses of the history endpoints. This decodes the subset of MessagePack produced by the
+ * GDS (see binary.py) and expands channel histories, which are laid out in columns, back into the list of channel
+ * objects found in JSON responses.
+ */
+
+let utf8 = new TextDecoder("utf-8");
+
+/**
+ * Decoder of a single MessagePack buffer.
+ */
+class Decoder {
+    /**
+     * Constructor.
+     * @param buffer: ArrayBuffer holding the MessagePack data
+     */
+    constructor(buffer) {
+        this.view = new DataView(buffer);
+        this.bytes = new Uint8Array(buffer);
+        this.offset = 0;
+    }
+
+    /**
+     * Read a sized object of the given kind and length.
+     * @param kind: "str", "bin", "array", or "map"
+     * @param length: length of the object
+     * @return decoded object
+     */
+    sized(kind, length) {
+        if (kind === "array") {
+            let array = new Array(length);
+            for (let i = 0; i < length; i++) {
+                array[i] = this.decode();
+            }
+            return array;
+        } else if (kind === "map") {
+            let map = {};
+            for (let i = 0; i < length; i++) {
+                let key = this.decode();
+                map[key] = this.decode();
+            }
+            return map;
+        }
+        let start = this.offset;
+        this.offset += length;
+        if (kind === "str") {
+            return utf8.decode(this.bytes.subarray(start, this.offset));
+        }
+        return this.bytes.slice(start, this.offset);
+    }
+
+    /**
+     * Decode the next object in the buffer.
+     * @return decoded object
+     */
+    decode() {
+        let view = this.view;
+        let marker = view.getUint8(this.offset++);
+        let value = null;
+        // Fixed size objects: fixints, fixmaps, fixarrays, and fixstrs
+        if (marker < 0x80) { return marker; }
+        if (marker < 0x90) { return this.sized("map", marker & 0x0f); }
+        if (marker < 0xa0) { return this.sized("array", marker & 0x0f); }
+        if (marker < 0xc0) { return this.sized("str", marker & 0x1f); }
+        if (marker >= 0xe0) { return marker - 0x100; }
+        switch (marker) {
+            case 0xc0: return null;
+            case 0xc2: return false;
+            case 0xc3: return true;
+            case 0xc4: return this.sized("bin", view.getUint8(this.offset++));
+            case 0xc5: value = view.getUint16(this.offset); this.offset += 2; return this.sized("bin", value);
+            case 0xc6: value = view.getUint32(this.offset); this.offset += 4; return this.sized("bin", value);
+            case 0xca: value = view.getFloat32(this.offset); this.offset += 4; return value;
+            case 0xcb: value = view.getFloat64(this.offset); this.offset += 8; return value;
+            case 0xcc: return view.getUint8(this.offset++);
+            case 0xcd: value = view.getUint16(this.offset); this.offset += 2; return value;
+            case 0xce: value = view.getUint32(this.offset); this.offset += 4; return value;
+            case 0xcf: value = Number(view.getBigUint64(this.offset)); this.offset += 8; return value;
+            case 0xd0: return view.getInt8(this.offset++);
+            case 0xd1: value = view.getInt16(this.offset); this.offset += 2; return value;
+            case 0xd2: value = view.getInt32(this.offset); this.offset += 4; return value;
+            case 0xd3: value = Number(view.getBigInt64(this.offset)); this.offset += 8; return value;
+            case 0xd9: return this.sized("str", view.getUint8(this.offset++));
+            case 0xda: value = view.getUint16(this.offset); this.offset += 2; return this.sized("str", value);
+            case 0xdb: value = view.getUint32(this.offset); this.offset += 4; return this.sized("str", value);
+            case 0xdc: value = view.getUint16(this.offset); this.offset += 2; return this.sized("array", value);
+            case 0xdd: value = view.getUint32(this.offset); this.offset += 4; return this.sized("array", value);
+            case 0xde: value = view.getUint16(this.offset); this.offset += 2; return this.sized("map", value);
+            case 0xdf: value = view.getUint32(this.offset); this.offset += 4; return this.sized("map", value);
+        }
+        throw new Error("Unsupported MessagePack marker: 0x" + marker.toString(16));
+    }
+}
+
+/**
+ * Read a column of little-endian uint32 values from a MessagePack binary.
+ * @param bytes: Uint8Array of the binary
+ * @return array of numbers
+ */
+function uint32Column(bytes) {
+    let view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+    let column = new Array(bytes.byteLength / 4);
+    for (let i = 0; i < column.length; i++) {
+        column[i] = view.getUint32(i * 4, true);
+    }
+    return column;
+}
+
+/**
+ * Expand a channel history laid out in columns into the list of channel objects found in JSON responses.
+ * @param columns: columnar channel history
+ * @return list of channel objects
+ */
+function expandChannelColumns(columns) {
+    let ids = uint32Column(columns.ids);
+    let times = uint32Column(columns.times);
+    return ids.map((id, i) => {
+        let display_text = columns.display_texts[i];
+        return {
+            time: {base: times[4 * i], context: times[4 * i + 1], seconds: times[4 * i + 2], microseconds: times[4 * i + 3]},
+            id: id,
+            val: columns.values[i],
+            display_text: (display_text === null) ? columns.values[i] : display_text
+        };
+    });
+}
+
+/**
+ * Decode a MessagePack history response into the form of the JSON responses.
+ * @param buffer: ArrayBuffer of the response
+ * @return decoded response
+ */
+export function decodeHistory(buffer) {
+    let data = new Decoder(buffer).decode();
+    if (data.history && !Array.isArray(data.history)) {
+        data.history = expandChannelColumns(data.history);
+    }
+    return data;
+}
@@ -10,12 +10,43 @@
  */
 import {_loader} from "./loader.js";
 
+// Bytes of a chunk uploaded at a time, well under the request size limit of the server
+const CHUNK_SIZE = 4 * 1024 * 1024;
+// Attempts of a chunk before failing the upload, with exponential backoff between attempts
+const MAX_RETRIES = 8;
+const MAX_BACKOFF = 30000;
+
+/**
+ * Compute the CFDP checksum (as used by file uplink) of data found at an offset of a file. This is the sum modulo 2^32
+ * of the big-endian 32-bit words of the file, and is thus the sum of the checksums of the chunks of a file.
+ * @param buffer: ArrayBuffer of the data
+ * @param offset: offset of the data in the file
+ * @return {number} checksum
+ */
+export function cfdpChecksum(buffer, offset) {
+    let bytes = new Uint8Array(buffer);
+    let value = 0;
+    for (let i = 0; i < bytes.length; i++) {
+        value = (value + bytes[i] * 2 ** (24 - 8 * ((offset + i) % 4))) >>> 0;
+    }
+    return value;
+}
+
+/**
+ * Wait for a number of milliseconds.
+ * @param milliseconds: time to wait
+ * @return {Promise<unknown>} resolved after the wait
+ */
+function sleep(milliseconds) {
+    return new Promise((resolve) => setTimeout(resolve, milliseconds));
+}
+
 export class Uploader {
     /**
      * Setup the endpoint, and wrap a supplied Loader object.
      */
     constructor() {
-        this.endpoint = "/upload/files";
+        this.endpoint = "/upload/chunked";
     }
     /**
      * Takes in a list of files that have been selected by the files input type, and a destination (on the embedded
@@ -25,17 +56,45 @@ export class Uploader {
      * @param destination: destination (on embedded system) to uplink to
      * @return {Promise} what to do when the download is done and the uplinking is started
      */
-    upload(files, destination) {
-        return new Promise((success, error) => {
-            _loader.load("/upload/destination", "PUT", {"destination": destination}).then( () => {
-                let data = new FormData();
-                while(0 < files.length) {
-                    let file = files.shift();
-                    data.append(file.file.name, file.file);
+    async upload(files, destination) {
+        await _loader.load("/upload/destination", "PUT", {"destination": destination});
+        while (0 < files.length) {
+            let file = files.shift();
+            await this.uploadFile(file.file);
+        }
+    }
+    /**
+     * Upload a single file in chunks. Each chunk is sent with its offset and checksum. When a chunk fails (e.g. the
+     * connection dropped), the upload resumes from the offset recorded by the server after a backoff.
+     * @param file: File object to upload
+     * @return {Promise<Object>} the finished upload
+     */
+    async uploadFile(file) {
+        let upload = await _loader.load(this.endpoint, "POST", {"name": file.name, "size": file.size});
+        let url = this.endpoint + "/" + upload.id;
+        let retries = 0;
+        // Empty files are finished by a single empty chunk
+        while (!upload.file) {
+            let offset = upload.offset;
+            let buffer = await file.slice(offset, offset + CHUNK_SIZE).arrayBuffer();
+            try {
+                let query = "?offset=" + offset + "&checksum=" + cfdpChecksum(buffer, offset);
+                upload = await _loader.load(url + query, "PUT", buffer, false);
+                retries = 0;
+            } catch (error) {
+                retries += 1;
+                if (retries > MAX_RETRIES) {
+                    throw error;
+                }
+                await sleep(Math.min(500 * 2 ** retries, MAX_BACKOFF));
+                try {
+                    upload = await _loader.load(url);
+                } catch {
+                    // Server unreachable, retry from the same offset
                 }
-                _loader.load(this.endpoint, "POST", data, false).then(success).catch(error);
-            });
-        });
+            }
+        }
+        return upload;
     }
     /**
      * Pause the uplinker. This will send the command to the backend to pause.
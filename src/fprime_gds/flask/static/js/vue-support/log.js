@@ -38,27 +38,55 @@ let template = `
 `;
 
 
+// Maximum count of characters of the log displayed
+const MAX_DISPLAYED = 4 * 1024 * 1024;
+
 // Must provide v-select
 Vue.component('v-select', VueSelect.VueSelect);
 
 Vue.component("logging", {
     template: template,
-    data() {return {"selected": "", "logs": _datastore.logs, text: "", "scroll": true, "error": ""}},
+    data() {return {"selected": "", "logs": _datastore.logs, text: "", "scroll": true, "error": "", "cursor": null}},
     mounted() {
         setInterval(this.update, 1000); // Grab log updates once a second
     },
+    watch: {
+        /**
+         * Restart from the tail of the newly selected log.
+         */
+        selected() {
+            this.text = "";
+            this.cursor = null;
+        }
+    },
     methods: {
         /**
-         * Updates the log data such that new logs can be displayed.
+         * Updates the log data such that new logs can be displayed. Only the content appended to the log since the last
+         * update is loaded, starting with the tail of the log.
          */
         update() {
             let _self = this;
-            if (this.selected === "") {
+            let selected = this.selected;
+            if (selected === "" || this.updating) {
                 return;
             }
-            _loader.load("/logdata/" + this.selected, "GET").then(
+            this.updating = true;
+            let url = "/logdata/" + selected + ((this.cursor === null) ? "" : "?offset=" + this.cursor);
+            _loader.load(url, "GET").then(
                 (result) => {
-                    _self.text = result[_self.selected];
+                    // Selection changed while loading
+                    if (selected !== _self.selected) {
+                        return;
+                    }
+                    // Reading from the start of the log means it was truncated or replaced
+                    let restarted = _self.cursor !== null && result.offset < _self.cursor;
+                    _self.text = (restarted ? "" : _self.text) + result.text;
+                    // Keep the displayed text bounded, dropping the oldest lines
+                    if (_self.text.length > MAX_DISPLAYED) {
+                        let cut = _self.text.indexOf("\n", _self.text.length - MAX_DISPLAYED);
+                        _self.text = _self.text.substring(cut + 1);
+                    }
+                    _self.cursor = result.next;
                     // Update on next-tick so that the updated content has been drawn already
                     _self.$nextTick(() => {
                         let panes = _self.$el.getElementsByClassName("fp-scrollable");
@@ -74,6 +102,8 @@ Vue.component("logging", {
                     } else {
                         _self.error = "[ERROR] " + result + ".";
                     }
+                }).finally(() => {
+                    _self.updating = false;
                 });
         }
     }
@@ -41,7 +41,13 @@ Vue.component("uplink", {
             let _self = this;
             _uploader.upload(this.selected, this.destination).catch(
                 function(error) {
-                    _self.error = (error != "")? error : "Total size limited to 32MB. Please use separate uplinks";
+                    let message = error;
+                    try {
+                        message = JSON.parse(error).message || error;
+                    } catch {
+                        message = error;
+                    }
+                    _self.error = (message != "")? message : "Upload failed. Check the connection to the GDS";
                 });
         },
         /**
@@ -27,7 +27,7 @@ class StatsBlob(flask_restful.Resource):
             }
             sizes = {key: history.size() for key, history in self.histories.items()}
             return {
-                "Active Clients": {"total": max(counts.values()), **counts},
+                "Active Clients": {"total": max(counts.values(), default=0), **counts},
                 "History Sizes": {"total": sum(sizes.values()), **sizes},
             }
         except Exception as exc:
@@ -0,0 +1,108 @@
+"""
+flask/stream.py:
+
+Push-based alternative to polling the history endpoints. A single server-sent event (SSE) stream carries the new items
+of the requested histories as they arrive, with one event per history named after it (e.g. "channels"). Each event
+holds the same data as a GET of the history endpoint.
+
+  GET /stream?session=<session>&topics=channels,events: stream of history updates
+
+Backpressure is applied per session: a batch is only retrieved from the histories once the previous batch is written
+to the client, such that a slow client leaves items in the history (where the history caps may report them as dropped)
+rather than queuing them in the server.
+
+A stream holds its request open for the whole connection, thus WSGI servers must run threaded or asynchronous workers
+(see flask/components.py).
+"""
+import threading
+import time
+
+import flask
+import flask_restful
+from flask_restful.reqparse import RequestParser
+
+from fprime_gds.flask.json import encode_history
+
+
+class HistoryStream(flask_restful.Resource):
+    """
+    Resource streaming new history items as server-sent events. Histories supporting listeners wake the stream as soon
+    as items arrive, others are checked every HEARTBEAT seconds. Items arriving within COALESCE seconds of each other are
+    sent as one batch.
+    """
+
+    # Seconds to gather items arriving in bursts into one event
+    COALESCE = 0.1
+    # Seconds between checks of idle histories. This keeps the sessions of idle histories from expiring.
+    HEARTBEAT = 15
+
+    def __init__(self, resources):
+        """Construct the stream around the history resources of each topic
+
+        Args:
+            resources: dictionary of topic names to HistoryResourceBase instances
+        """
+        self.parser = RequestParser()
+        self.parser.add_argument(
+            "session", required=True, help="Session key for fetching data.", location="args"
+        )
+        self.parser.add_argument(
+            "limit", required=False, help="Limit to results of each event (default 2000)", location="args"
+        )
+        self.parser.add_argument(
+            "topics", required=False, help="Comma separated topics to stream (default all)", location="args"
+        )
+        self.resources = resources
+
+    def get(self):
+        """HTTP GET handler opening the event stream"""
+        args = self.parser.parse_args()
+        session = args.get("session")
+        limit = int(args.get("limit") if args.get("limit") is not None else 2000)
+        topics = list(self.resources.keys())
+        if args.get("topics"):
+            topics = [topic for topic in args.get("topics").split(",") if topic in self.resources]
+        if not topics:
+            flask_restful.abort(400, message="No known topics requested")
+        response = flask.Response(
+            flask.stream_with_context(self.events(session, limit, topics)), mimetype="text/event-stream"
+        )
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["X-Accel-Buffering"] = "no"
+        return response
+
+    def events(self, session, limit, topics):
+        """Generate the server-sent events of the given topics until the client disconnects
+
+        Args:
+            session: session key for fetching data
+            limit: limit to results of each event
+            topics: names of the streamed topics
+        """
+        wake = threading.Event()
+        histories = [self.resources[topic].history for topic in topics]
+        for history in histories:
+            if hasattr(history, "register_listener"):
+                history.register_listener(wake)
+        try:
+            # An initial (possibly empty) event of each topic confirms the session with the client
+            pending = set(topics)
+            while True:
+                for topic in topics:
+                    response = self.resources[topic].poll(session, limit)
+                    if response["history"] or response["errors"] or topic in pending:
+                        yield f"event: {topic}\ndata: {encode_history(response)}\n\n"
+                        # Full batches are followed immediately by the remaining items
+                        if len(response["history"]) >= limit:
+                            wake.set()
+                pending.clear()
+                # Idle topics are sent (empty) every heartbeat to show the stream is alive
+                if not wake.wait(self.HEARTBEAT):
+                    pending.update(topics)
+                    continue
+                time.sleep(self.COALESCE)
+                wake.clear()
+        finally:
+            for history in histories:
+                if hasattr(history, "remove_listener"):
+                    history.remove_listener(wake)
@@ -5,16 +5,34 @@ A simple service that handles file uploads and downloads. This allowed the REST
 and downlinks. In addition, an uplink destination directory is exposed for the UI to set where new uploads should be
 uplinked to.
 
+Large files are uploaded in chunks (see ChunkedUploads), which are written straight into the uplink store at their
+offset. Such uploads resume from the last stored chunk after a dropped connection, and are verified against the CFDP
+checksum used by the file uplink before they are uplinked.
+
 @author mstarch
 """
+import contextlib
+import json
 import os
+import re
+import threading
+import uuid
+
+# File locks serialize the chunks of an upload across web workers where available (POSIX)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 import flask
 import flask_restful
+import flask_restful.reqparse
 from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
 from pathlib import Path
 
+from fprime_gds.common.files.helpers import CFDPChecksum
+
 
 class Destination(flask_restful.Resource):
     """
@@ -141,7 +159,8 @@ class FileUploads(flask_restful.Resource):
 
         return filename
 
-    def resolve_conflict(self, target_folder: Path, filename: str):
+    @staticmethod
+    def resolve_conflict(target_folder: Path, filename: str):
         """
         If a file with the selected name already exists in the target folder,
         this method is called to resolve the conflict. It should return a new
@@ -164,6 +183,363 @@ class FileUploads(flask_restful.Resource):
                 return newname
 
 
+class PartialUpload:
+    """
+    An upload received in chunks into a hidden directory of the uplink store. The state of the upload is recorded
+    alongside its data, such that any web worker may resume it. The recorded offset is authoritative: data past it
+    (e.g. of a chunk interrupted by a dropped connection) is discarded by the next chunk.
+
+    Chunks of an upload are serialized by a file lock of its data, which is shared by all web workers and goes away
+    with the data. Without file locks, chunks are serialized within this process only.
+    """
+
+    DIRECTORY = ".uploads"
+    # Bytes read from the request stream at a time
+    BLOCK_SIZE = 64 * 1024
+    # Locks of the uploads being written by this process, without file locks, and their count of holders
+    _LOCKS = {}
+    _LOCKS_LOCK = threading.Lock()
+
+    def __init__(self, dest_dir, upload_id, name, size, checksum=None, offset=0, running=0):
+        """
+        Constructor
+
+        :param dest_dir: uplink store directory
+        :param upload_id: id of the upload
+        :param name: (secured) file name of the upload
+        :param size: total size of the file in bytes
+        :param checksum: CFDP checksum of the whole file supplied by the client, None when not supplied
+        :param offset: bytes received
+        :param running: CFDP checksum of the bytes received
+        """
+        self.dest_dir = Path(dest_dir)
+        self.id = upload_id
+        self.name = name
+        self.size = size
+        self.checksum = checksum
+        self.offset = offset
+        self.running = running
+
+    @classmethod
+    def directory(cls, dest_dir):
+        """Directory of the partial uploads of the uplink store"""
+        return Path(dest_dir) / cls.DIRECTORY
+
+    @classmethod
+    def create(cls, dest_dir, name, size, checksum=None):
+        """
+        Create a new upload
+
+        :param dest_dir: uplink store directory
+        :param name: file name of the upload
+        :param size: total size of the file in bytes
+        :param checksum: CFDP checksum of the whole file, None to verify the chunks only
+        :return: upload
+        """
+        upload = cls(dest_dir, uuid.uuid4().hex, Path(secure_filename(name)).name, size, checksum)
+        if not upload.name:
+            raise ValueError(f"Invalid file name: {name}")
+        cls.directory(dest_dir).mkdir(parents=True, exist_ok=True)
+        upload.data_path.touch()
+        upload.save()
+        return upload
+
+    @classmethod
+    def load(cls, dest_dir, upload_id):
+        """
+        Load an upload by id
+
+        :param dest_dir: uplink store directory
+        :param upload_id: id of the upload
+        :return: upload
+        :raises KeyError: when no such upload exists
+        """
+        if not re.fullmatch("[0-9a-f]{32}", upload_id):
+            raise KeyError(upload_id)
+        try:
+            with open(cls.directory(dest_dir) / f"{upload_id}.json") as file_handle:
+                state = json.load(file_handle)
+        except (OSError, ValueError):
+            raise KeyError(upload_id)
+        return cls(dest_dir, upload_id, **state)
+
+    @classmethod
+    def all(cls, dest_dir):
+        """List the uploads of the uplink store"""
+        uploads = []
+        for path in sorted(cls.directory(dest_dir).glob("*.json")):
+            try:
+                uploads.append(cls.load(dest_dir, path.stem))
+            except KeyError:
+                continue
+        return uploads
+
+    @classmethod
+    @contextlib.contextmanager
+    def lock(cls, dest_dir, upload_id):
+        """
+        Lock serializing the chunks of an upload, held for the duration of the context. Unknown uploads are not locked,
+        and left to be reported by load.
+
+        :param dest_dir: uplink store directory
+        :param upload_id: id of the upload
+        """
+        if fcntl is None:
+            with cls._process_lock(upload_id):
+                yield
+            return
+        file_handle = None
+        if re.fullmatch("[0-9a-f]{32}", upload_id):
+            try:
+                file_handle = open(cls.directory(dest_dir) / f"{upload_id}.part", "rb")
+            except FileNotFoundError:
+                pass
+        if file_handle is None:
+            yield
+            return
+        # Released once closed. Data removed or finished while waiting leaves the upload unknown to load.
+        with file_handle:
+            fcntl.flock(file_handle.fileno(), fcntl.LOCK_EX)
+            yield
+
+    @classmethod
+    @contextlib.contextmanager
+    def _process_lock(cls, upload_id):
+        """Lock of an upload within this process, forgotten once no request holds or awaits it"""
+        with cls._LOCKS_LOCK:
+            entry = cls._LOCKS.setdefault(upload_id, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with cls._LOCKS_LOCK:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del cls._LOCKS[upload_id]
+
+    @property
+    def data_path(self):
+        return self.directory(self.dest_dir) / f"{self.id}.part"
+
+    @property
+    def state_path(self):
+        return self.directory(self.dest_dir) / f"{self.id}.json"
+
+    def save(self):
+        """Record the state of the upload, atomically replacing the previous state"""
+        state = {
+            "name": self.name,
+            "size": self.size,
+            "checksum": self.checksum,
+            "offset": self.offset,
+            "running": self.running,
+        }
+        temporary = self.state_path.with_suffix(".tmp")
+        with open(temporary, "w") as file_handle:
+            json.dump(state, file_handle)
+        os.replace(temporary, self.state_path)
+
+    def write(self, stream, offset, checksum=None):
+        """
+        Write a chunk read from a stream at the given offset. The chunk is recorded only once entirely received and,
+        when a checksum is supplied, verified.
+
+        :param stream: binary stream of the chunk (e.g. the request stream)
+        :param offset: offset of the chunk, which must be the recorded offset of the upload
+        :param checksum: CFDP checksum of the chunk at its offset, None to skip verification
+        :raises ValueError: when the offset does not match, the chunk exceeds the file size, or the checksum differs
+        """
+        if offset != self.offset:
+            raise ValueError(f"Expected chunk at offset {self.offset}, not {offset}")
+        chunk_checksum = CFDPChecksum()
+        position = offset
+        with open(self.data_path, "r+b") as file_handle:
+            file_handle.truncate(offset)
+            file_handle.seek(offset)
+            while True:
+                block = stream.read(self.BLOCK_SIZE)
+                if not block:
+                    break
+                if position + len(block) > self.size:
+                    raise ValueError(f"Chunk exceeds the file size of {self.size} bytes")
+                file_handle.write(block)
+                chunk_checksum.update(block, position)
+                position += len(block)
+        if checksum is not None and checksum != chunk_checksum.value:
+            raise ValueError(f"Chunk checksum {chunk_checksum.value} does not match {checksum}")
+        self.offset = position
+        self.running = (self.running + chunk_checksum.value) & 0xFFFFFFFF
+        self.save()
+
+    @property
+    def complete(self):
+        return self.offset == self.size
+
+    def verify(self):
+        """
+        Verify the file received by its CFDP checksum, computed from the stored file against the checksum of the chunks
+        and the checksum supplied by the client (if any)
+
+        :raises ValueError: when a checksum differs
+        """
+        stored = CFDPChecksum()
+        position = 0
+        with open(self.data_path, "rb") as file_handle:
+            for block in iter(lambda: file_handle.read(1024 * 1024), b""):
+                stored.update(block, position)
+                position += len(block)
+        if position != self.size or stored.value != self.running:
+            raise ValueError("Stored file does not match the chunks received")
+        if self.checksum is not None and stored.value != self.checksum:
+            raise ValueError(f"File checksum {stored.value} does not match {self.checksum}")
+
+    def finish(self, resolve_conflict):
+        """
+        Move the verified file into the uplink store, removing the state of the upload
+
+        :param resolve_conflict: function of the directory and file name returning a file name free of conflicts
+        :return: file name in the uplink store
+        """
+        filename = self.name
+        if (self.dest_dir / filename).exists():
+            filename = resolve_conflict(self.dest_dir, filename)
+        os.replace(self.data_path, self.dest_dir / filename)
+        self.state_path.unlink()
+        return filename
+
+    def remove(self):
+        """Remove the upload and its data"""
+        for path in (self.data_path, self.state_path):
+            if path.exists():
+                path.unlink()
+
+    def describe(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "size": self.size,
+            "offset": self.offset,
+            "checksum": self.running,
+        }
+
+
+class ChunkedUploads(flask_restful.Resource):
+    """
+    Creates and lists uploads received in chunks. Creating an upload responds with its id, to which chunks are sent
+    (see ChunkedUpload).
+    """
+
+    def __init__(self, uplinker, dest_dir):
+        """
+        Constructor: setup the uplink store and argument parsing
+        """
+        self.uplinker = uplinker
+        self.dest_dir = dest_dir
+        self.parser = flask_restful.reqparse.RequestParser()
+        self.parser.add_argument("name", required=True, help="Name of the file to upload")
+        self.parser.add_argument("size", type=int, required=True, help="Size of the file in bytes")
+        self.parser.add_argument(
+            "checksum", type=int, required=False, default=None, help="CFDP checksum of the file"
+        )
+
+    def get(self):
+        """
+        Gets the uploads in progress
+
+        :return: uploads in progress, with the offset from which each resumes
+        """
+        return {"uploads": [upload.describe() for upload in PartialUpload.all(self.dest_dir)]}
+
+    def post(self):
+        """
+        Creates an upload
+        """
+        args = self.parser.parse_args()
+        if args.size < 0:
+            flask_restful.abort(400, message="Size must not be negative")
+        try:
+            upload = PartialUpload.create(self.dest_dir, args.name, args.size, args.checksum)
+        except ValueError as exc:
+            flask_restful.abort(400, message=str(exc))
+        except PermissionError:
+            flask_restful.abort(
+                403,
+                message=f"{self.dest_dir} is not writable. Fix permissions or change storage directory with "
+                "--file-storage-directory.",
+            )
+        return upload.describe()
+
+
+class ChunkedUpload(flask_restful.Resource):
+    """
+    An upload received in chunks. Chunks are sent in order as the raw body of PUT requests carrying their offset (and
+    optionally their CFDP checksum). A chunk that is not acknowledged is resent after querying the offset of the upload
+    with GET. Once the last chunk is received, the file is verified and enqueued into the uplinker.
+    """
+
+    def __init__(self, uplinker, dest_dir):
+        """
+        Constructor: setup the uplink store and argument parsing
+        """
+        self.uplinker = uplinker
+        self.dest_dir = dest_dir
+        self.parser = flask_restful.reqparse.RequestParser()
+        self.parser.add_argument(
+            "offset", type=int, required=True, help="Offset of the chunk", location="args"
+        )
+        self.parser.add_argument(
+            "checksum", type=int, required=False, default=None, help="CFDP checksum of the chunk", location="args"
+        )
+
+    def load(self, upload_id):
+        """Load an upload, aborting when not found"""
+        try:
+            return PartialUpload.load(self.dest_dir, upload_id)
+        except KeyError:
+            flask_restful.abort(404, message=f"Unknown upload: {upload_id}")
+
+    def get(self, upload_id):
+        """
+        Gets the progress of the upload
+
+        :return: upload, whose offset is the offset of the next chunk to send
+        """
+        return self.load(upload_id).describe()
+
+    def put(self, upload_id):
+        """
+        Receives a chunk of the upload, finishing the upload with its last chunk
+        """
+        args = self.parser.parse_args()
+        with PartialUpload.lock(self.dest_dir, upload_id):
+            upload = self.load(upload_id)
+            try:
+                upload.write(flask.request.stream, args.offset, args.checksum)
+            except ValueError as exc:
+                flask_restful.abort(409, message=str(exc), upload=upload.describe())
+            response = upload.describe()
+            if upload.complete:
+                try:
+                    upload.verify()
+                except ValueError as exc:
+                    upload.remove()
+                    flask_restful.abort(409, message=f"{exc}. Upload discarded.", upload=response)
+                filename = upload.finish(FileUploads.resolve_conflict)
+                flask.current_app.logger.info(f"Received file. Saved to: {filename}")
+                self.uplinker.enqueue(os.path.join(self.dest_dir, filename))
+                response["file"] = filename
+        return response
+
+    def delete(self, upload_id):
+        """
+        Cancels the upload, removing the data received
+        """
+        with PartialUpload.lock(self.dest_dir, upload_id):
+            self.load(upload_id).remove()
+        return {"message": "success"}
+
+
 class FileDownload(flask_restful.Resource):
     """ """
 
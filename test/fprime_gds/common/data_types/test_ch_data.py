@@ -0,0 +1,74 @@
+"""
+Tests Channel Data
+"""
+
+import unittest
+from unittest import mock
+
+from fprime_gds.common.data_types import ch_data
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.models.serialize.numerical_types import U32Type
+from fprime_gds.common.models.serialize.time_type import TimeType
+from fprime_gds.common.templates.ch_template import ChTemplate
+
+
+class ChDataTest(unittest.TestCase):
+    def setUp(self):
+        self.template = ChTemplate(101, "test_ch", "test_comp", U32Type, "0x{:x}")
+        self.time = TimeType(TimeType.TimeBase("TB_WORKSTATION_TIME"), 0, 1533758629, 0)
+
+    def test_display_text_lazy(self):
+        """
+        Tests that display text is only formatted on first access and then memoized
+        """
+        with mock.patch.object(
+            ch_data, "format_string_template", wraps=ch_data.format_string_template
+        ) as formatter:
+            ch_obj = ChData(U32Type(42), self.time, self.template)
+            formatter.assert_not_called()
+            self.assertEqual(ch_obj.get_display_text(), "0x2a")
+            self.assertEqual(ch_obj.display_text, "0x2a")
+            formatter.assert_called_once()
+
+    def test_display_text_computed_once(self):
+        """
+        Tests that the display text is not computed until read, and computed once for all the renderings using it
+        """
+        template = ChTemplate(103, "test_ch3", "test_comp", U32Type)
+        with mock.patch.object(
+            ChData, "_compute_display_text", autospec=True, side_effect=ChData._compute_display_text
+        ) as compute:
+            ch_objs = [ChData(U32Type(42), self.time, self.template), ChData(U32Type(7), self.time, template)]
+            compute.assert_not_called()
+            for ch_obj in ch_objs:
+                ch_obj.get_str()
+                ch_obj.get_str(verbose=True, csv=True)
+                ch_obj.get_dict()
+                str(ch_obj)
+            self.assertEqual([ch_obj.display_text for ch_obj in ch_objs], ["0x2a", 7])
+            self.assertEqual(compute.call_count, 2)
+
+    def test_renderings_on_demand(self):
+        """
+        Tests that get_str and get_dict render on demand, such that no rendering is retained by the channel
+        """
+        ch_obj = ChData(U32Type(42), self.time, self.template)
+        self.assertIn("test_comp.test_ch = 0x2a", ch_obj.get_str())
+        self.assertIn("test_comp.test_ch,0x2a", ch_obj.get_str(csv=True))
+        first = ch_obj.get_dict()
+        first["display_text"] = "modified"
+        self.assertEqual(ch_obj.get_dict()["display_text"], "0x2a")
+        self.assertFalse(hasattr(ch_obj, "_renderings"))
+
+    def test_empty_obj(self):
+        """
+        Tests that empty channels display the channel description and use no instance dictionary
+        """
+        template = ChTemplate(102, "test_ch2", "test_comp", U32Type, ch_desc="A test")
+        ch_obj = ChData.get_empty_obj(template)
+        self.assertEqual(ch_obj.get_display_text(), "A test")
+        self.assertFalse(hasattr(ch_obj, "__dict__"))
+
+
+if __name__ == "__main__":
+    unittest.main()
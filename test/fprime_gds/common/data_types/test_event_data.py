@@ -0,0 +1,75 @@
+"""
+Tests Event Data
+"""
+
+import unittest
+from unittest import mock
+
+from fprime_gds.common.data_types import event_data
+from fprime_gds.common.data_types.event_data import EventData
+from fprime_gds.common.models.serialize.numerical_types import U32Type
+from fprime_gds.common.models.serialize.time_type import TimeType
+from fprime_gds.common.templates.event_template import EventTemplate
+from fprime_gds.common.utils.event_severity import EventSeverity
+
+
+class EventDataTest(unittest.TestCase):
+    def setUp(self):
+        self.template = EventTemplate(
+            7,
+            "TestEvent",
+            "test_comp",
+            [("count", None, U32Type)],
+            EventSeverity.ACTIVITY_HI,
+            "Count is {}",
+        )
+        self.time = TimeType(TimeType.TimeBase("TB_WORKSTATION_TIME"), 0, 1533758629, 0)
+
+    def test_display_text_lazy(self):
+        """
+        Tests that display text is only formatted on first access and then memoized
+        """
+        with mock.patch.object(
+            event_data, "format_string_template", wraps=event_data.format_string_template
+        ) as formatter:
+            event_obj = EventData((U32Type(3),), self.time, self.template)
+            formatter.assert_not_called()
+            self.assertEqual(event_obj.get_display_text(), "Count is 3")
+            self.assertEqual(event_obj.display_text, "Count is 3")
+            formatter.assert_called_once()
+
+    def test_display_text_computed_once(self):
+        """
+        Tests that the display text is not computed until read, and computed once for all the renderings using it
+        """
+        with mock.patch.object(
+            EventData, "_compute_display_text", autospec=True, side_effect=EventData._compute_display_text
+        ) as compute:
+            event_obj = EventData((U32Type(3),), self.time, self.template)
+            compute.assert_not_called()
+            event_obj.get_str()
+            event_obj.get_str(verbose=True, csv=True)
+            event_obj.get_dict()
+            str(event_obj)
+            self.assertEqual(event_obj.display_text, "Count is 3")
+            compute.assert_called_once_with(event_obj)
+
+    def test_renderings_on_demand(self):
+        """
+        Tests that get_str and get_dict render on demand from the memoized display text without retaining renderings
+        """
+        with mock.patch.object(
+            event_data, "format_string_template", wraps=event_data.format_string_template
+        ) as formatter:
+            event_obj = EventData((U32Type(3),), self.time, self.template)
+            self.assertIn("test_comp.TestEvent EventSeverity.ACTIVITY_HI : Count is 3", event_obj.get_str())
+            self.assertNotEqual(event_obj.get_str(), event_obj.get_str(verbose=True))
+            first = event_obj.get_dict()
+            first["display_text"] = "modified"
+            self.assertEqual(event_obj.get_dict()["display_text"], "Count is 3")
+            formatter.assert_called_once()
+        self.assertFalse(hasattr(event_obj, "__dict__"))
+        self.assertFalse(hasattr(event_obj, "_renderings"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Tests the memory retained by decoded data items
+
+Histories hold millions of channel and event readings, so the per-object footprint of ChData, EventData and the
+serializable types they contain directly limits how much history can be retained.
+"""
+
+import tracemalloc
+
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.data_types.event_data import EventData
+from fprime_gds.common.models.serialize.enum_type import EnumType
+from fprime_gds.common.models.serialize.numerical_types import F64Type, U32Type
+from fprime_gds.common.models.serialize.time_type import TimeType
+from fprime_gds.common.templates.ch_template import ChTemplate
+from fprime_gds.common.templates.event_template import EventTemplate
+from fprime_gds.common.utils.event_severity import EventSeverity
+
+ITEM_COUNT = 10000
+
+STATE_TYPE = EnumType.construct_type("TestMemoryState", {"IDLE": 0, "BUSY": 1})
+
+
+def bytes_per_item(factory):
+    """Measure the memory retained per item built by the given factory"""
+    tracemalloc.start()
+    try:
+        items = [factory(index) for index in range(ITEM_COUNT)]
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(items) == ITEM_COUNT
+    return retained / ITEM_COUNT
+
+
+def assert_slotted(item):
+    """Assert that every class in the hierarchy of an item declares __slots__, such that it has no dictionary"""
+    for cls in type(item).__mro__[:-1]:
+        assert "__slots__" in vars(cls), f"{cls.__name__} does not declare __slots__"
+    assert not hasattr(item, "__dict__"), f"{type(item).__name__} has an instance dictionary"
+
+
+class UnslottedChData(ChData):
+    """ChData carrying an instance dictionary, as before the hierarchy declared __slots__"""
+
+
+class UnslottedEventData(EventData):
+    """EventData carrying an instance dictionary, as before the hierarchy declared __slots__"""
+
+
+def test_ch_data_memory():
+    """Checks that retained ChData holding a numeric value carry no instance dictionaries"""
+    template = ChTemplate(101, "test_ch", "test_comp", U32Type)
+    sample = ChData(U32Type(1), TimeType.from_fields(2, 0, 1, 0), template)
+    for item in (sample, sample.get_val_obj(), sample.get_time()):
+        assert_slotted(item)
+
+    def factory(cls):
+        return lambda index: cls(U32Type(index), TimeType.from_fields(2, 0, index, 0), template)
+
+    assert bytes_per_item(factory(ChData)) < bytes_per_item(factory(UnslottedChData))
+
+
+def test_event_data_memory():
+    """Checks that retained EventData holding numeric and enumeration arguments carry no instance dictionaries"""
+    template = EventTemplate(
+        7,
+        "TestEvent",
+        "test_comp",
+        [("count", None, U32Type), ("value", None, F64Type), ("state", None, STATE_TYPE)],
+        EventSeverity.ACTIVITY_HI,
+        "{} {} {}",
+    )
+    sample = EventData(
+        (U32Type(1), F64Type(0.5), STATE_TYPE("IDLE")), TimeType.from_fields(2, 0, 1, 0), template
+    )
+    for item in (sample, sample.get_time(), *sample.get_args()):
+        assert_slotted(item)
+
+    def factory(cls):
+        return lambda index: cls(
+            (U32Type(index), F64Type(index / 2), STATE_TYPE("BUSY")),
+            TimeType.from_fields(2, 0, index, 0),
+            template,
+        )
+
+    assert bytes_per_item(factory(EventData)) < bytes_per_item(factory(UnslottedEventData))
@@ -0,0 +1,71 @@
+"""
+Tests the channel decoder
+"""
+
+import pytest
+
+from fprime_gds.common.decoders.ch_decoder import ChDecoder
+from fprime_gds.common.decoders.decoder import DecodingException
+from fprime_gds.common.encoders.ch_encoder import ChEncoder
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.models.serialize.numerical_types import (
+    F64Type,
+    I16Type,
+    U32Type,
+)
+from fprime_gds.common.models.serialize.string_type import StringType
+from fprime_gds.common.models.serialize.time_type import TimeType
+from fprime_gds.common.templates.ch_template import ChTemplate
+
+
+STRING_TYPE = StringType.construct_type("TestChDecoderString", 40)
+
+
+def encode_channels(ch_objs):
+    """Encode the given channel objects stripping the length and descriptor headers"""
+    encoder = ChEncoder()
+    header_size = encoder.len_obj.getSize() + encoder.desc_obj.getSize()
+    return b"".join(encoder.encode_api(ch_obj)[header_size:] for ch_obj in ch_objs)
+
+
+def test_ch_decoder_compiled_and_generic():
+    """
+    Tests that compiled (numeric) and generic (string) channels decode identically in one buffer
+    """
+    templates = {
+        101: ChTemplate(101, "test_u32", "test_comp", U32Type),
+        102: ChTemplate(102, "test_i16", "test_comp", I16Type),
+        103: ChTemplate(103, "test_f64", "test_comp", F64Type),
+        104: ChTemplate(104, "test_str", "test_comp", STRING_TYPE),
+    }
+    time_obj = TimeType(TimeType.TimeBase("TB_WORKSTATION_TIME"), 3, 1533758629, 123456)
+    ch_objs = [
+        ChData(U32Type(42), time_obj, templates[101]),
+        ChData(STRING_TYPE("hello"), time_obj, templates[104]),
+        ChData(I16Type(-7), time_obj, templates[102]),
+        ChData(F64Type(2.5), time_obj, templates[103]),
+    ]
+    decoder = ChDecoder(templates)
+    assert decoder.compile_ch_decoder(templates[101]) is not None
+    assert decoder.compile_ch_decoder(templates[104]) is None
+
+    decoded = decoder.decode_api(encode_channels(ch_objs))
+    assert len(decoded) == len(ch_objs)
+    for expected, actual in zip(ch_objs, decoded):
+        assert actual.template is expected.template
+        assert type(actual.get_val_obj()) is type(expected.get_val_obj())
+        assert actual.get_val() == expected.get_val()
+        assert actual.get_time() == time_obj
+        assert actual.get_time().timeContext == 3
+        assert actual.get_time().timeBase.val == "TB_WORKSTATION_TIME"
+
+
+def test_ch_decoder_compiled_truncated():
+    """
+    Tests that a truncated compiled channel raises a decoding error
+    """
+    templates = {101: ChTemplate(101, "test_u32", "test_comp", U32Type)}
+    time_obj = TimeType(TimeType.TimeBase("TB_WORKSTATION_TIME"), 0, 1533758629, 123456)
+    data = encode_channels([ChData(U32Type(42), time_obj, templates[101])])
+    with pytest.raises(DecodingException):
+        ChDecoder(templates).decode_api(data[:-1])
@@ -0,0 +1,26 @@
+"""
+Tests the file decoder
+"""
+
+import struct
+
+from fprime_gds.common.data_types.file_data import FilePacketType
+from fprime_gds.common.decoders.file_decoder import FileDecoder
+
+
+def test_data_packet_copied():
+    """
+    Tests that file data decoded from a view of a receive buffer is a copy independent of that buffer
+    """
+    payload = b"\x01\x02\x03\x04\x05"
+    buffer = bytearray(
+        struct.pack(">BIIH", FilePacketType.DATA.value, 7, 512, len(payload)) + payload + b"\xff\xff"
+    )
+    (packet,) = FileDecoder().decode_api(memoryview(buffer))
+    assert packet.seqID == 7
+    assert packet.offset == 512
+    assert type(packet.dataVar) is bytes
+    assert packet.dataVar == payload
+    # Reusing the receive buffer does not alter the decoded data
+    buffer[11:16] = b"\x00" * 5
+    assert packet.dataVar == payload
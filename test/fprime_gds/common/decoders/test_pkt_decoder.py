@@ -0,0 +1,67 @@
+"""
+Tests the packet decoder
+"""
+
+import pytest
+
+from fprime_gds.common.decoders.decoder import DecodingException
+from fprime_gds.common.decoders.pkt_decoder import PktDecoder
+from fprime_gds.common.encoders.pkt_encoder import PktEncoder
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.data_types.pkt_data import PktData
+from fprime_gds.common.models.serialize.numerical_types import U8Type, U16Type, U32Type
+from fprime_gds.common.models.serialize.string_type import StringType
+from fprime_gds.common.models.serialize.time_type import TimeType
+from fprime_gds.common.templates.ch_template import ChTemplate
+from fprime_gds.common.templates.pkt_template import PktTemplate
+from fprime_gds.common.utils.config_manager import ConfigManager
+
+
+STRING_TYPE = StringType.construct_type("TestPktDecoderString", 10)
+
+
+def encode_packet(pkt_obj):
+    """Encode the given packet object stripping the length and descriptor headers"""
+    encoder = PktEncoder()
+    header_size = encoder.len_obj.getSize() + ConfigManager().get_type("ComCfg.Apid").getMaxSize()
+    return encoder.encode_api(pkt_obj)[header_size:]
+
+
+def test_pkt_decoder():
+    """
+    Tests decoding a packet mixing numeric and string channels through the compiled layout
+    """
+    ch_temps = [
+        ChTemplate(101, "test_ch", "test_comp", U32Type),
+        ChTemplate(102, "test_ch2", "test_comp2", STRING_TYPE),
+        ChTemplate(103, "test_ch3", "test_comp3", U8Type),
+        ChTemplate(104, "test_ch4", "test_comp4", U16Type),
+    ]
+    pkt_temp = PktTemplate(64, "test_pkt", ch_temps)
+    time_obj = TimeType(TimeType.TimeBase("TB_WORKSTATION_TIME"), 0, 1533758629, 123456)
+    ch_objs = [
+        ChData(U32Type(1356), time_obj, ch_temps[0]),
+        ChData(STRING_TYPE("abc"), time_obj, ch_temps[1]),
+        ChData(U8Type(143), time_obj, ch_temps[2]),
+        ChData(U16Type(1509), time_obj, ch_temps[3]),
+    ]
+    data = encode_packet(PktData(ch_objs, time_obj, pkt_temp))
+    # Strings are packed at their maximum size within packets
+    data = data[:22] + b"\x00" * (STRING_TYPE.getMaxSize() - 5) + data[22:]
+
+    decoder = PktDecoder({64: pkt_temp}, {ch_temp.get_id(): ch_temp for ch_temp in ch_temps})
+    decoded = decoder.decode_api(data)
+    # Channel objects are built on access, once
+    assert len(decoded) == 4
+    assert decoded[-1] is decoded[3]
+    assert decoded[1:3] == [decoded[1], decoded[2]]
+    assert [ch.template for ch in decoded] == ch_temps
+    assert [ch.get_val() for ch in decoded] == [1356, "abc", 143, 1509]
+    assert all(ch.get_time() == time_obj for ch in decoded)
+
+    with pytest.raises(DecodingException):
+        decoder.decode_api(data[:-1])
+    # Errors of channels decoded outside the layout fail the packet on decode
+    with pytest.raises(DecodingException):
+        decoder.decode_api(data[:17] + b"\x00\x0b" + data[19:])
+    assert decoder.decode_api(b"\x00\x41" + data[2:]) is None
@@ -5,6 +5,7 @@ Created on Jul 10, 2020
 @author: Josef Biberstein, Joseph Paetz, hpaulson
 """
 
+import time
 
 from fprime_gds.common.distributor.distributor import Distributor
 from fprime_gds.common.utils.config_manager import ConfigManager
@@ -34,6 +35,8 @@ def test_distributor():
     data = header_1 + data_1 + header_2 + data_2 + leftover_data
 
     (test_leftover, raw_msgs) = dist.parse_into_raw_msgs_api(bytearray(data))
+    assert isinstance(test_leftover, bytearray)
+    assert all(isinstance(raw_msg, bytearray) for raw_msg in raw_msgs)
 
     assert (
         test_leftover == leftover_data
@@ -56,3 +59,97 @@ def test_distributor():
     assert (test_msg_2 == data_2), f"expected 2nd msg to be {list(data_2)} but found {list(test_msg_2)}"
 
     ConfigManager()._set_defaults()  # reset defaults not to interfere with other tests
+
+
+class CollectingDecoder:
+    """Stand-in decoder collecting the messages distributed to it"""
+
+    def __init__(self):
+        self.msgs = []
+
+    def data_callback(self, data, sender=None):
+        self.msgs.append(data)
+
+
+def test_distributor_large_buffer():
+    """
+    Tests parsing a single large receive of 10k messages, as delivered after a loss-of-signal recovery
+    """
+    ConfigManager().set_config("msg_len", U16Type)
+    ConfigManager().set_type("FwPacketDescriptorType", U32Type)
+
+    message_count = 10000
+    header = b"\x00\x10\x00\x00\x00\x01"
+    messages = [header + i.to_bytes(4, "big") * 3 for i in range(message_count)]
+    leftover_data = b"\x00\x10\x00\x00"
+    data = b"".join(messages) + leftover_data
+
+    dist = Distributor()
+    _, raw_msgs = dist.parse_into_raw_msgs_api(bytearray(data))
+    assert len(raw_msgs) == message_count
+    assert all(raw == expected for raw, expected in zip(raw_msgs, messages))
+
+    decoder = CollectingDecoder()
+    dist.register("FW_PACKET_TELEM", decoder)
+    dist.on_recv(data)
+    assert len(decoder.msgs) == message_count
+    assert decoder.msgs[-1] == messages[-1][len(header):]
+
+    # Completing the leftover message must distribute it from the compacted buffer
+    dist.on_recv(b"\x00\x01" + message_count.to_bytes(4, "big") * 3)
+    assert len(decoder.msgs) == message_count + 1
+
+    ConfigManager()._set_defaults()  # reset defaults not to interfere with other tests
+
+
+def test_distributor_passes_views():
+    """
+    Tests that decoders receive views of the receive buffer that stay valid as more data arrives
+    """
+    ConfigManager().set_config("msg_len", U16Type)
+    ConfigManager().set_type("FwPacketDescriptorType", U32Type)
+
+    header = b"\x00\x08\x00\x00\x00\x01"
+    decoder = CollectingDecoder()
+    dist = Distributor()
+    dist.register("FW_PACKET_TELEM", decoder)
+    dist.on_recv(header + b"\x01\x02\x03\x04" + header[:3])
+    dist.on_recv(header[3:] + b"\x05\x06\x07\x08")
+
+    assert all(isinstance(msg, memoryview) for msg in decoder.msgs)
+    assert [bytes(msg) for msg in decoder.msgs] == [
+        b"\x01\x02\x03\x04",
+        b"\x05\x06\x07\x08",
+    ]
+
+    ConfigManager()._set_defaults()  # reset defaults not to interfere with other tests
+
+
+def test_distributor_throughput():
+    """
+    Tests that distributing a single large receive is linear in its message count, as a quadratic parse (e.g. slicing
+    the buffer per message) would stall the GDS after a loss-of-signal recovery
+    """
+    ConfigManager().set_config("msg_len", U16Type)
+    ConfigManager().set_type("FwPacketDescriptorType", U32Type)
+
+    header = b"\x00\x10\x00\x00\x00\x01"
+
+    def distribute(message_count):
+        """Best time of distributing one receive of message_count messages"""
+        data = b"".join(header + i.to_bytes(4, "big") * 3 for i in range(message_count))
+        times = []
+        for _ in range(3):
+            decoder = CollectingDecoder()
+            dist = Distributor()
+            dist.register("FW_PACKET_TELEM", decoder)
+            start = time.perf_counter()
+            dist.on_recv(data)
+            times.append(time.perf_counter() - start)
+            assert len(decoder.msgs) == message_count
+        return min(times)
+
+    # Ten times the messages is about ten times slower, where a quadratic parse would be about a hundred times slower
+    assert distribute(40000) < 30 * distribute(4000)
+
+    ConfigManager()._set_defaults()  # reset defaults not to interfere with other tests
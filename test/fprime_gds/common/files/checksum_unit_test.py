@@ -0,0 +1,37 @@
+"""
+Tests the CFDP checksum of file transfers
+"""
+import random
+import struct
+import unittest
+
+from fprime_gds.common.files.helpers import CFDPChecksum
+
+
+class CFDPChecksumTestCases(unittest.TestCase):
+    @staticmethod
+    def reference(data):
+        """Sum of the big-endian words of the data, padded with zeros to a word boundary"""
+        padded = data + bytes(-len(data) % 4)
+        return sum(struct.unpack_from(">I", padded, index)[0] for index in range(0, len(padded), 4)) & 0xFFFFFFFF
+
+    def test_whole(self):
+        checksum = CFDPChecksum()
+        checksum.update(b"\x01\x02\x03\x04\xff\xff\xff\xff\x05", 0)
+        assert checksum.value == (0x01020304 + 0xFFFFFFFF + 0x05000000) & 0xFFFFFFFF
+
+    def test_chunks(self):
+        generator = random.Random(0)
+        data = bytes(generator.getrandbits(8) for _ in range(1001))
+        for _ in range(50):
+            checksum = CFDPChecksum()
+            offset = 0
+            while offset < len(data):
+                length = generator.randint(0, 37)
+                checksum.update(data[offset : offset + length], offset)
+                offset += length
+            assert checksum.value == self.reference(data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -23,6 +23,16 @@ They all run, but may not be written in an optimized way.
 """
 
 
+class CountingChData(ChData):
+    """Channel counting the reads of its time, which the history reads to order items"""
+
+    time_reads = 0
+
+    def get_time(self):
+        CountingChData.time_reads += 1
+        return super().get_time()
+
+
 class HistoryTestCases(unittest.TestCase):
     def setUp(self):
         self.cHistory = ChronologicalHistory()
@@ -201,6 +211,58 @@ class HistoryTestCases(unittest.TestCase):
         self.cHistory.clear(25)
         assert len(self.cHistory) == 25, "starting history is empty"
 
+    def test_out_of_order_insert(self):
+        temp1 = ChTemplate(1, "Test Channel 1", "Chrono_Hist_Tester", I32Type)
+        ts0 = TimeType()
+        chList = [ChData(I32Type(item), ts0 + (item // 2), temp1) for item in range(40)]
+        # Insert evens ascending then odds descending, items of equal time keep their arrival order
+        for item in chList[::2] + chList[::-2]:
+            self.cHistory.data_callback(item)
+        expected = []
+        for item in range(0, 40, 2):
+            expected += [chList[item], chList[item + 1]]
+        self.assert_lists_equal(expected, self.cHistory.retrieve())
+        self.assert_lists_equal(expected[10:], self.cHistory.retrieve(ts0 + 5))
+        self.cHistory.clear(ts0 + 15)
+        self.assert_lists_equal(expected[30:], self.cHistory.retrieve())
+
+    def test_insert_scaling(self):
+        temp1 = ChTemplate(1, "Test Channel 1", "Chrono_Hist_Tester", I32Type)
+        ts0 = TimeType()
+        chList = [CountingChData(I32Type(item), ts0 + item, temp1) for item in range(20000)]
+        for item in chList:
+            self.cHistory.data_callback(item)
+        # Late arrivals bisect into the middle of the history, reading the times of a logarithmic count of items
+        CountingChData.time_reads = 0
+        for item in chList[::1000]:
+            self.cHistory.data_callback(item)
+        # A linear search would read about half of the history per insert
+        assert CountingChData.time_reads <= 20 * 3 * (20000).bit_length()
+        assert self.cHistory.size() == 20020
+        assert self.cHistory.retrieve(ts0 + 19999)[0] is chList[-1]
+
+    def test_id_index(self):
+        templates = [ChTemplate(index, f"Test Channel {index}", "Chrono_Hist_Tester", I32Type) for index in range(3)]
+        ts0 = TimeType()
+        chList = [ChData(I32Type(item), ts0 + (item // 3), templates[item % 3]) for item in range(60)]
+        self.cHistory = ChronologicalHistory(id_index=True)
+        for item in chList[30:] + chList[:30]:
+            self.cHistory.data_callback(item)
+        for ids in [{0}, {2}, {0, 1}, {5}]:
+            expected = [item for item in self.cHistory.retrieve() if item.id in ids]
+            self.assert_lists_equal(expected, self.cHistory.retrieve_by_id(ids))
+            expected = [item for item in self.cHistory.retrieve(ts0 + 7) if item.id in ids]
+            self.assert_lists_equal(expected, self.cHistory.retrieve_by_id(ids, ts0 + 7))
+            self.assert_lists_equal(expected[:2], self.cHistory.retrieve_by_id(ids, ts0 + 7, 2))
+        assert self.cHistory.latest(1) is chList[-2]
+        assert self.cHistory.latest(5) is None
+        self.cHistory.clear(ts0 + 15)
+        self.assert_lists_equal(chList[47::3], self.cHistory.retrieve_by_id({2}))
+        assert self.cHistory.latest(2) is chList[-1]
+        self.cHistory.clear()
+        assert self.cHistory.id_index == {}
+        assert self.cHistory.latest(2) is None
+
     def test_history_filter(self):
         class is_even(predicates.predicate):
             def __call__(self, item):
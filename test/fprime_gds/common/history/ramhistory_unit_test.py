@@ -0,0 +1,129 @@
+import threading
+import unittest
+
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.history.ram import RamHistory, estimate_size
+from fprime_gds.common.models.serialize.numerical_types import I32Type
+from fprime_gds.common.models.serialize.time_type import TimeType
+from fprime_gds.common.templates.ch_template import ChTemplate
+
+
+class RamHistoryTestCases(unittest.TestCase):
+    @staticmethod
+    def get_range(length, channels=1):
+        templates = [
+            ChTemplate(index, f"Test Channel {index}", "Ram_Hist_Tester", I32Type)
+            for index in range(channels)
+        ]
+        ts0 = TimeType()
+        return [
+            ChData(I32Type(item), ts0 + item, templates[item % channels])
+            for item in range(length)
+        ]
+
+    def test_unbounded(self):
+        history = RamHistory()
+        items = self.get_range(100)
+        for item in items:
+            history.data_callback(item)
+        assert history.retrieve() == items
+        assert history.retrieve("session") == []
+        for item in items[:10]:
+            history.data_callback(item)
+        assert history.retrieve("session", 5) == items[:5]
+        assert history.retrieve_new() == items[5:10]
+        # Clearing stops at the earliest session, the unnamed session has not seen the last 10 items
+        history.clear()
+        assert history.size() == 10
+        assert history.retrieve("session") == items[5:10]
+        history.clear("session")
+        assert history.retrieve() == items[:10]
+        history.clear()
+        assert history.size() == 0
+        assert history.pop_dropped_count("session") == 0
+
+    def test_item_cap(self):
+        history = RamHistory(max_items=10)
+        items = self.get_range(100)
+        assert history.retrieve("stale") == []
+        for item in items[:50]:
+            history.data_callback(item)
+        assert history.retrieve("active") == []
+        for item in items[50:]:
+            history.data_callback(item)
+        assert history.size() == 10
+        assert len(history.objects) < 30, "Evicted slots should be reclaimed"
+        assert history.retrieve() == items[-10:]
+        # The stale session is marked with everything it missed
+        assert history.retrieve("stale") == items[-10:]
+        assert history.pop_dropped_count("stale") == 90
+        assert history.pop_dropped_count("stale") == 0
+        assert history.pop_dropped_count("active") == 40
+
+    def test_byte_cap(self):
+        items = self.get_range(100)
+        item_size = estimate_size(items[0])
+        assert item_size > 0
+        history = RamHistory(max_bytes=item_size * 20, sizer=lambda _: item_size)
+        for item in items:
+            history.data_callback(item)
+        assert history.size() == 20
+        assert history.retrieve() == items[-20:]
+
+    def test_id_quota(self):
+        history = RamHistory(id_quota=3)
+        items = self.get_range(30, channels=3)
+        fast = self.get_range(60, channels=1)
+        for item in items:
+            history.data_callback(item)
+        assert history.retrieve("session") == []
+        assert history.retrieve("session") == []
+        for item in fast:
+            history.data_callback(item)
+        # Channel 0 floods the history, but channels 1 and 2 keep their latest values
+        retrieved = history.retrieve()
+        assert [item.id for item in retrieved].count(0) == 3
+        assert [item.id for item in retrieved].count(1) == 3
+        assert [item.id for item in retrieved].count(2) == 3
+        assert history.size() == 9
+        assert retrieved[-3:] == fast[-3:]
+        assert history.pop_dropped_count("session") == 57
+        # Latest values outlive eviction
+        assert history.latest(1) is items[-2]
+        assert history.latest(0) is fast[-1]
+        assert set(history.latest_items()) == {items[-2], items[-1], fast[-1]}
+
+    def test_retrieve_by_id(self):
+        history = RamHistory(max_items=20)
+        items = self.get_range(30, channels=3)
+        assert history.retrieve_by_id([0, 2], "session") == []
+        for item in items[:15]:
+            history.data_callback(item)
+        assert history.retrieve_by_id([0, 2], "session", 4) == [items[0], items[2], items[3], items[5]]
+        assert history.retrieve_by_id([0, 2], "session") == [
+            item for item in items[6:15] if item.id in (0, 2)
+        ]
+        for item in items[15:]:
+            history.data_callback(item)
+        # Evicted items are removed from the index
+        assert history.retrieve_by_id([1]) == [item for item in items[10:] if item.id == 1]
+        assert history.retrieve_by_id([0, 2], "session") == [item for item in items[15:] if item.id in (0, 2)]
+        assert history.retrieve_by_id([5], "session") == []
+        history.clear()
+        assert history.retrieve_by_id([0, 1, 2]) == []
+
+    def test_listeners(self):
+        history = RamHistory()
+        listener = threading.Event()
+        history.register_listener(listener)
+        assert not listener.is_set()
+        history.data_callback(self.get_range(1)[0])
+        assert listener.is_set()
+        listener.clear()
+        history.remove_listener(listener)
+        history.data_callback(self.get_range(1)[0])
+        assert not listener.is_set()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.history.series import SeriesStore
+from fprime_gds.common.models.serialize.numerical_types import F64Type, I32Type
+from fprime_gds.common.models.serialize.string_type import StringType
+from fprime_gds.common.models.serialize.time_type import TimeType
+from fprime_gds.common.templates.ch_template import ChTemplate
+
+
+class SeriesStoreTestCases(unittest.TestCase):
+    def setUp(self):
+        self.template = ChTemplate(0, "Test Channel 0", "Series_Tester", I32Type)
+
+    def get_range(self, length, rate=10):
+        return [
+            ChData(I32Type(item % 7), TimeType(2, 0, item // rate, (item % rate) * (1000000 // rate)), self.template)
+            for item in range(length)
+        ]
+
+    def test_decimate(self):
+        store = SeriesStore()
+        for item in self.get_range(1000):
+            store.data_callback(item)
+        assert store.ids() == [0]
+        buckets = store.decimate(0, width=10)
+        assert buckets["count"] == [100] * 10
+        assert buckets["min"] == [0] * 10
+        assert buckets["max"] == [6] * 10
+        assert buckets["times"][0] == 0
+        assert abs(buckets["times"][1] - 9.99) < 1e-9
+        # Buckets of a range, empty buckets omitted
+        buckets = store.decimate(0, 50, 150, 20)
+        assert buckets["times"] == [50 + 5 * index for index in range(10)]
+        assert sum(buckets["count"]) == 500
+        # Small ranges are returned sample by sample
+        buckets = store.decimate(0, 10, 10.5, 10)
+        assert buckets["count"] == [1] * 5
+        assert buckets["min"] == buckets["max"] == buckets["avg"] == [item % 7 for item in range(100, 105)]
+        assert store.decimate(1) == {"times": [], "min": [], "max": [], "avg": [], "count": []}
+
+    def test_storage(self):
+        store = SeriesStore(max_samples=80)
+        items = self.get_range(100)
+        for item in items[50:] + items[:50]:
+            store.data_callback(item)
+        string_type = StringType.construct_type("SeriesString", 10)
+        text = ChTemplate(1, "Text", "Series_Tester", string_type)
+        store.data_callback(ChData(string_type("text"), TimeType(), text))
+        store.data_callback(ChData(F64Type(0.5), TimeType(), ChTemplate(2, "Float", "Series_Tester", F64Type)))
+        assert sorted(store.ids()) == [0, 2]
+        # Out of order samples are stored in order, the oldest trimmed once exceeding the cap
+        times = store.decimate(0, width=100)["times"]
+        assert times == sorted(times)
+        assert len(times) <= 80
+        assert times[-1] == 9.9
+
+    def test_reorder_window(self):
+        store = SeriesStore()
+        items = self.get_range(3000)
+        for item in items[:2000]:
+            store.data_callback(item)
+        # Late samples within the window are inserted, older ones dropped
+        store.data_callback(items[2500])
+        store.data_callback(items[1500])
+        store.data_callback(items[500])
+        series = store.series[0]
+        assert len(series.times) == 2002 == store.total
+        assert series.times.tolist() == sorted(series.times)
+
+    def test_total_cap(self):
+        store = SeriesStore(max_samples=1000, max_total=1500)
+        templates = [ChTemplate(item_id, f"Channel {item_id}", "Series_Tester", I32Type) for item_id in range(3)]
+        for index, item in enumerate(self.get_range(900)):
+            for template in templates[: 1 + index // 300]:
+                store.data_callback(ChData(item.val_obj, item.time, template))
+            lengths = [len(series.times) for series in store.series.values()]
+            assert sum(lengths) == store.total <= 1500
+        # The longest series was trimmed, keeping its latest samples, while the shorter series were kept whole
+        assert sorted(store.ids()) == [0, 1, 2]
+        assert [len(store.series[item_id].times) for item_id in range(3)] == [548, 600, 300]
+        assert all(series.times[-1] == 89.9 for series in store.series.values())
+
+
+if __name__ == "__main__":
+    unittest.main()
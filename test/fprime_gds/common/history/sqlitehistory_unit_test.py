@@ -0,0 +1,190 @@
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.data_types.cmd_data import CmdData
+from fprime_gds.common.data_types.event_data import EventData
+from fprime_gds.common.history.sqlite import ItemRecord, SharedSqliteHistory, SqliteHistory
+from fprime_gds.common.models.serialize.numerical_types import I32Type, U8Type
+from fprime_gds.common.models.serialize.string_type import StringType
+from fprime_gds.common.models.serialize.time_type import TimeType
+from fprime_gds.common.templates.ch_template import ChTemplate
+from fprime_gds.common.templates.cmd_template import CmdTemplate
+from fprime_gds.common.templates.event_template import EventTemplate
+from fprime_gds.common.utils.event_severity import EventSeverity
+
+
+class FakeDictionaries:
+    def __init__(self, templates, events=(), commands=()):
+        self.channel_id = {template.get_id(): template for template in templates}
+        self.event_id = {template.get_id(): template for template in events}
+        self.command_id = {template.get_id(): template for template in commands}
+
+
+class SqliteHistoryTestCases(unittest.TestCase):
+    def setUp(self):
+        self.string_type = StringType.construct_type("SqliteHistoryString", 40)
+        self.templates = [
+            ChTemplate(0, "Test Channel 0", "Sqlite_Hist_Tester", I32Type),
+            ChTemplate(1, "Test Channel 1", "Sqlite_Hist_Tester", self.string_type),
+        ]
+        self.event_template = EventTemplate(
+            5, "TestEvent", "Sqlite_Hist_Tester", [("count", None, U8Type), ("text", None, self.string_type)],
+            EventSeverity.ACTIVITY_HI, "{} {}",
+        )
+        self.command_template = CmdTemplate(
+            6, "TEST_CMD", "Sqlite_Hist_Tester", [("count", None, I32Type), ("text", None, self.string_type)]
+        )
+        self.dictionaries = FakeDictionaries(self.templates, [self.event_template], [self.command_template])
+
+    def get_range(self, length):
+        ts0 = TimeType()
+        return [
+            ChData(I32Type(item), ts0 + item, self.templates[0])
+            if item % 2 == 0
+            else ChData(self.string_type(str(item)), ts0 + item, self.templates[1])
+            for item in range(length)
+        ]
+
+    @staticmethod
+    def assert_items_equal(expected, actual):
+        assert [(item.id, item.time, item.val_obj.val) for item in expected] == [
+            (item.id, item.time, item.val_obj.val) for item in actual
+        ]
+
+    def test_sessions(self):
+        history = SqliteHistory(dictionaries=self.dictionaries)
+        items = self.get_range(20)
+        for item in items[:10]:
+            history.data_callback(item)
+        assert history.retrieve("session") == []
+        for item in items[10:]:
+            history.data_callback(item)
+        self.assert_items_equal(items[10:15], history.retrieve("session", 5))
+        self.assert_items_equal(items[15:], history.retrieve("session"))
+        assert history.retrieve("session") == []
+        self.assert_items_equal(items, history.retrieve())
+        assert history.retrieve_new() == []
+        history.clear()
+        assert history.size() == 20
+        loaded = history.retrieve()[1]
+        assert loaded.template is self.templates[1]
+        assert type(loaded.val_obj) is self.string_type
+        history.data_callback(items[0])
+        history.data_callback(items[1])
+        history.data_callback(items[2])
+        self.assert_items_equal([items[0]], history.retrieve_by_id([0], "session", 1))
+        self.assert_items_equal([items[2]], history.retrieve_by_id([0], "session"))
+
+    def test_queries(self):
+        history = SqliteHistory(dictionaries=self.dictionaries)
+        items = self.get_range(20)
+        for item in items[10:] + items[:10]:
+            history.data_callback(item)
+        self.assert_items_equal(items, history.range())
+        self.assert_items_equal(items[5:15], history.range(items[5].time, items[15].time))
+        self.assert_items_equal(items[1:9:2], history.range(end_time=items[9].time, ids=[1]))
+        self.assert_items_equal(items[10::2] + items[:10:2], history.retrieve_by_id([0]))
+        self.assert_items_equal([items[8]], [history.latest(0)])
+        self.assert_items_equal([items[8], items[9]], history.latest_items())
+        assert history.latest(5) is None
+        history.purge(items[10].time)
+        self.assert_items_equal(items[10:], history.retrieve())
+        assert history.size() == 10
+
+    def test_records(self):
+        time = TimeType(TimeType.TimeBase("TB_WORKSTATION_TIME"), 3, 1533758629, 123)
+        event = EventData((U8Type(7), self.string_type("seven")), time, self.event_template)
+        command = CmdData((-3, "three"), self.command_template)
+        history = SqliteHistory(dictionaries=self.dictionaries)
+        for item in [event, command]:
+            history.data_callback(item)
+        loaded_event, loaded_command = history.retrieve()
+        assert loaded_event.template is self.event_template
+        assert loaded_event.time == time and loaded_event.time.timeContext == 3
+        assert [arg.val for arg in loaded_event.args] == [7, "seven"]
+        assert loaded_command.template is self.command_template
+        assert loaded_command.time == command.time
+        assert loaded_command.get_arg_vals() == [-3, "three"]
+        # Records are the serialized values behind a version, not pickles
+        record = history.connection.execute("SELECT item FROM history ORDER BY position").fetchone()[0]
+        assert record == bytes([ItemRecord.VERSION, 2]) + b"\x07" + self.string_type("seven").serialize()
+
+    def test_undecodable_records(self):
+        history = SqliteHistory(dictionaries=self.dictionaries)
+        items = self.get_range(3)
+        history.data_callback(items[0])
+        # Records of other versions (e.g. pickles) and of ids no longer in the dictionaries are skipped
+        key = items[1].time.sort_key.to_bytes(24, "big")
+        with history.connection:
+            history.connection.executemany(
+                "INSERT INTO history (id, time, item) VALUES (?, ?, ?)",
+                [(0, key, pickle.dumps(items[1].val_obj.val)), (9, key, bytes([ItemRecord.VERSION, 1, 0, 0, 0, 0]))],
+            )
+        history.data_callback(items[2])
+        self.assert_items_equal([items[0], items[2]], history.retrieve())
+        assert history.latest(9) is None
+        assert history.connection.execute("SELECT size FROM history_count").fetchone()[0] == 4
+        with self.assertRaises(ValueError):
+            SqliteHistory()
+
+    def test_persistence(self):
+        items = self.get_range(10)
+        with tempfile.TemporaryDirectory() as storage:
+            history = SqliteHistory.for_pipeline("channels", self.dictionaries, storage)
+            for item in items:
+                history.data_callback(item)
+            history.close()
+            assert os.path.exists(os.path.join(storage, SqliteHistory.DATABASE))
+
+            history = SqliteHistory.for_pipeline("channels", self.dictionaries, storage)
+            assert history.size() == 10
+            self.assert_items_equal(items, history.retrieve())
+            assert history.retrieve("session") == []
+            history.data_callback(items[0])
+            self.assert_items_equal(items[:1], history.retrieve("session"))
+            assert SqliteHistory.for_pipeline("events", self.dictionaries, storage).size() == 0
+            history.close()
+
+    def test_shared(self):
+        items = self.get_range(20)
+        with tempfile.TemporaryDirectory() as storage:
+            writer = SqliteHistory.for_pipeline("channels", self.dictionaries, storage)
+            workers = [SharedSqliteHistory.for_pipeline("channels", self.dictionaries, storage) for _ in range(2)]
+            listener = threading.Event()
+            workers[1].register_listener(listener)
+            # Sessions opened by one worker are served by any worker
+            assert workers[0].retrieve("session") == []
+            for item in items[:10]:
+                writer.data_callback(item)
+            assert listener.wait(5)
+            self.assert_items_equal(items[:4], workers[1].retrieve("session", 4))
+            self.assert_items_equal(items[4:10], workers[0].retrieve("session"))
+            for item in items[10:]:
+                writer.data_callback(item)
+            self.assert_items_equal(items[11::2], workers[1].retrieve_by_id([1], "session"))
+            assert workers[0].retrieve("session") == []
+            assert workers[0].size() == 20
+            writer.purge(items[5].time)
+            assert [worker.size() for worker in workers] == [15, 15]
+            # Sizes are kept by the database rather than counted
+            with sqlite3.connect(os.path.join(storage, SqliteHistory.DATABASE)) as connection:
+                assert connection.execute("SELECT size FROM channels_count").fetchone()[0] == 15
+            workers[1].remove_listener(listener)
+            # Idle sessions are removed by clear
+            workers[0].set_clear_time(0.01)
+            workers[0].retrieve("idle")
+            threading.Event().wait(0.05)
+            workers[0].clear()
+            writer.data_callback(items[0])
+            assert workers[1].retrieve("idle") == []
+            for history in [writer] + workers:
+                history.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
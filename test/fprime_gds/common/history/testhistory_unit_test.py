@@ -152,6 +152,28 @@ class HistoryTestCases(unittest.TestCase):
         self.tHistory.clear(25)
         assert len(self.tHistory) == 25, "starting history is empty"
 
+    def test_id_index(self):
+        class Item:
+            def __init__(self, id):
+                self.id = id
+
+        items = [Item(index % 4) for index in range(100)]
+        self.tHistory = TestHistory(id_index=True)
+        for item in items:
+            self.tHistory.data_callback(item)
+        self.tHistory.clear(10)
+        for ids in [{0}, {1, 3}, {7}]:
+            for start in [None, 0, 25, 200]:
+                expected = [item for item in self.tHistory.retrieve(start) if item.id in ids]
+                self.assert_lists_equal(expected, self.tHistory.retrieve_by_id(ids, start))
+                self.assert_lists_equal(expected[:3], self.tHistory.retrieve_by_id(ids, start, 3))
+        assert self.tHistory.latest(3) is items[-1]
+        assert self.tHistory.latest(7) is None
+        self.tHistory.clear()
+        assert self.tHistory.id_index == {}
+        self.tHistory.data_callback(items[0])
+        self.assert_lists_equal([items[0]], self.tHistory.retrieve_by_id({0}))
+
     def test_history_filter(self):
         class is_even(predicates.predicate):
             def __call__(self, item):
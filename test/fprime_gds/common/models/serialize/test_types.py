@@ -222,6 +222,31 @@ def test_uint_types_off_nominal():
         )
 
 
+def test_numerical_types_deserialize_from():
+    """Tests the struct codecs and the deserialize_from fast path of numerical types"""
+    for type_input, value in [
+        (I8Type, -3),
+        (I16Type, -300),
+        (I32Type, -70000),
+        (I64Type, -(2**40)),
+        (U8Type, 200),
+        (U16Type, 60000),
+        (U32Type, 2**31),
+        (U64Type, 2**63),
+        (F32Type, 0.5),
+        (F64Type, -3.25),
+    ]:
+        assert type_input.STRUCT.size == type_input.getSize()
+        serialized = type_input(value).serialize()
+        for offset in [0, 10]:
+            data = (b" " * offset) + serialized + b" "
+            assert type_input.deserialize_from(data, offset) == (
+                value,
+                offset + type_input.getSize(),
+            )
+    assert I32Type.STRUCT is not U32Type.STRUCT
+
+
 def test_float_types_nominal():
     """Tests the integer types"""
     instance = valid_values_test(
@@ -404,6 +429,130 @@ def test_serializable_advanced():
     )  # Sum of sizes of member list
 
 
+def test_serializable_generated_codec(monkeypatch):
+    """Generated serializable codecs match the generic implementation and are shared per member layout"""
+    enum_member_class = EnumType.construct_type(
+        "CodecEnumMember", {"Option1": 0, "Option2": 6}, "U8"
+    )
+    string_member_class = StringType.construct_type("CodecStringMember", max_length=8)
+    field_data = [
+        ("field1", U32Type),
+        ("field2", F32Type),
+        ("field3", enum_member_class),
+        ("field4", string_member_class),
+        ("field5", I16Type),
+        ("field6", BoolType),
+    ]
+    serializable_class = SerializableType.construct_type("CodecSerializable", field_data)
+    value = {
+        "field1": 123,
+        "field2": 2.5,
+        "field3": "Option2",
+        "field4": "abc",
+        "field5": -3,
+        "field6": True,
+    }
+    instance = serializable_class(value)
+    serialized = instance.serialize()
+    assert serialized == SerializableType.serialize(instance)
+    assert instance.getSize() == SerializableType.getSize(instance) == 4 + 4 + 1 + 5 + 2 + 1
+
+    # Decode without the generic fallback to ensure the generated code handles the layout itself
+    def no_fallback(*_):
+        raise AssertionError("Generated codec fell back to the generic implementation")
+
+    monkeypatch.setitem(
+        serializable_class.deserialize.__globals__, "_generic_deserialize", no_fallback
+    )
+    deserialized = serializable_class()
+    deserialized.deserialize(b"  " + serialized, 2)
+    assert deserialized.val == value
+    monkeypatch.undo()
+
+    # Redefinitions and other types sharing the layout reuse the generated code
+    assert (
+        SerializableType.construct_type("CodecSerializable", field_data).deserialize
+        is serializable_class.deserialize
+    )
+    assert (
+        SerializableType.construct_type("CodecSerializableTwin", field_data).deserialize
+        is serializable_class.deserialize
+    )
+
+    # Failures are reported as by the generic implementation
+    with pytest.raises(DeserializeException, match="field2"):
+        serializable_class().deserialize(serialized[:6], 0)
+    with pytest.raises(DeserializeException, match="field3"):
+        serializable_class().deserialize(serialized[:8] + b"\x01" + serialized[9:], 0)
+    # Members failing after a fixed-size run are reported from the offset the call started at
+    for truncated, failed in [(serialized[:11], "field4"), (serialized[:-2], "field5")]:
+        with pytest.raises(DeserializeException, match=failed) as failure:
+            serializable_class().deserialize(b"  " + truncated, 2)
+        assert "field1" not in str(failure.value)
+    with pytest.raises(NotInitializedException):
+        serializable_class().serialize()
+
+
+def test_deserialize_memoryview():
+    """Types deserialize from memoryview slices without requiring bytes"""
+    string_class = StringType.construct_type("ViewString", max_length=8)
+    array_class = ArrayType.construct_type("ViewArray", U16Type, 3, "%d")
+    serializable_class = SerializableType.construct_type(
+        "ViewSerializable",
+        [("name", string_class), ("values", array_class), ("count", U32Type)],
+    )
+    value = {"name": "abc", "values": [1, 2, 3], "count": 7}
+    serialized = serializable_class(value).serialize()
+    view = memoryview(b"  " + serialized + b"  ")[1:]
+
+    deserialized = serializable_class()
+    deserialized.deserialize(view, 1)
+    assert deserialized.val == value
+    assert isinstance(deserialized.val["name"], str)
+
+    with pytest.raises(DeserializeException):
+        string_class().deserialize(memoryview(b"\x00\x05ab"), 0)
+
+
+def test_fixed_size():
+    """Types carry a class-level fixed size, None where the serialized size depends on the value"""
+    enum_class = EnumType.construct_type("FixedEnum", {"A": 0, "B": 1}, "U16")
+    string_class = StringType.construct_type("FixedString", max_length=4)
+    fixed_array = ArrayType.construct_type("FixedArray", enum_class, 3, "%s")
+    variable_array = ArrayType.construct_type("VariableArray", string_class, 3, "%s")
+    fixed_serializable = SerializableType.construct_type(
+        "FixedSerializable",
+        [("a", U32Type), ("b", BoolType), ("c", fixed_array), ("d", I8Type)],
+    )
+    variable_serializable = SerializableType.construct_type(
+        "VariableSerializable", [("a", U32Type), ("b", variable_array)]
+    )
+    expected = [
+        (U8Type, 1),
+        (I64Type, 8),
+        (F32Type, 4),
+        (BoolType, 1),
+        (enum_class, 2),
+        (fixed_array, 6),
+        (fixed_serializable, 4 + 1 + 6 + 1),
+        (string_class, None),
+        (variable_array, None),
+        (variable_serializable, None),
+        (TimeType, None),
+    ]
+    for type_class, size in expected:
+        assert type_class.FIXED_SIZE == size, type_class.__name__
+        if size is not None:
+            assert type_class.getMaxSize() == size
+
+    instance = fixed_serializable({"a": 1, "b": True, "c": ["A", "B", "A"], "d": -1})
+    serialized = instance.serialize()
+    assert len(serialized) == instance.getSize() == fixed_serializable.FIXED_SIZE
+    deserialized = fixed_serializable()
+    deserialized.deserialize(serialized + b"extra", 0)
+    assert deserialized.val == instance.val
+
+
 def test_array_type():
     """
     Tests the ArrayType serialization and deserialization
@@ -429,6 +578,42 @@ def test_array_type():
         assert instance.__class__.getMaxSize() == max_size
 
 
+def test_array_type_bulk():
+    """
+    Tests bulk deserialization of arrays with numerical members
+    """
+    for member_type, values in [
+        (U16Type, list(range(0, 256 * 200, 200))),
+        (I8Type, [-128, 0, 127, -1]),
+        (F64Type, [0.5, -1.25, 1e300]),
+    ]:
+        type_input = ArrayType.construct_type(
+            f"TestBulkArray{member_type.__name__}", member_type, len(values), "{}"
+        )
+        assert type_input._BULK_TYPECODE is not None
+        expected = type_input(values)
+        serialized = expected.serialize()
+        instance = type_input()
+        instance.deserialize(b" " + serialized, 1)
+        # Values are available without wrapping the members
+        assert instance.val == values
+        assert instance.formatted_val == [str(value) for value in values]
+        assert instance.getSize() == len(serialized)
+        assert instance.serialize() == serialized
+        assert instance == expected
+        assert [member["value"] for member in instance.to_jsonable()["values"]] == values
+        assert instance._values is not None, "to_jsonable expanded the compact storage"
+        # Members are wrapped on access, including through _val, and reflect modifications
+        assert [member.val for member in instance._val] == values
+        members = list(instance)
+        assert [member.val for member in members] == values
+        assert all(type(member) == member_type for member in members)
+        members[0].val = values[1]
+        assert instance.val[0] == values[1]
+        with pytest.raises(DeserializeException):
+            type_input().deserialize(serialized[:-1], 0)
+
+
 def test_array_type_off_nominal():
     """
     Test the array type for invalid values etc
@@ -474,6 +659,9 @@ def test_time_type():
 
     for t_base, t_context, secs, usecs in in_no_err_list:
         ser_deser_time_test(t_base, t_context, secs, usecs)
+        fields = (t_base.numeric_value, t_context, secs, usecs)
+        assert TimeType(*fields).fields == fields
+        assert TimeType.from_fields(*fields).fields == fields
 
     for t_base, t_context, secs, usecs in in_err_list:
         with pytest.raises(TypeRangeException):
@@ -1,6 +1,7 @@
 import unittest
 
 from fprime_gds.common.models.serialize.time_type import TimeType
+from fprime_gds.common.models.serialize.type_exceptions import TypeRangeException
 
 
 class TimeTypeTestCases(unittest.TestCase):
@@ -122,6 +123,27 @@ class TimeTypeTestCases(unittest.TestCase):
         t3 = 5.5 // self.t15
         assert t3 == 3, "dividing 5.5 by 1.5 with floor division is 3"
 
+    def test_SortKey(self):
+        # ordering is by time base, seconds, useconds and then context
+        t_context = TimeType(TimeType.TimeBase("TB_NONE"), 1, 1, 0)
+        t_base = TimeType(TimeType.TimeBase("TB_PROC_TIME"), 0, 0, 0)
+        t_max = TimeType(TimeType.TimeBase("TB_NONE"), 0, 0xFFFFFFFF, 999999)
+        ordered = [self.t0, self.t1, t_context, self.t15, t_max, t_base]
+        assert sorted(reversed(ordered)) == ordered, "times sort by base, seconds, useconds, context"
+        assert [item.sort_key for item in ordered] == sorted(item.sort_key for item in ordered)
+        assert TimeType.compare(self.t1, t_context) < 0, "context breaks ties"
+        t_context.timeContext = 0
+        assert TimeType.compare(self.t1, t_context) == 0, "setters update the sort key"
+
+    def test_FromFields(self):
+        time = TimeType.from_fields(2, 3, 1533758629, 123456)
+        assert time.timeBase == TimeType.TimeBase("TB_WORKSTATION_TIME")
+        assert time.timeContext == 3
+        assert time == TimeType(TimeType.TimeBase("TB_WORKSTATION_TIME"), 3, 1533758629, 123456)
+        assert TimeType.from_buffer(time.serialize(), 0) == time
+        with self.assertRaises(TypeRangeException):
+            TimeType.from_fields(0x1234, 0, 0, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -287,6 +287,16 @@ class PredicateTestCases(unittest.TestCase):
         ), "Specifying all fields should return False for update 2"
         self.check_str(pred)
 
+    def test_constrained_ids(self):
+        single = predicates.telemetry_predicate(id_pred=predicates.equal_to(1))
+        members = predicates.event_predicate(id_pred=predicates.is_a_member_of([1, 2]))
+        assert predicates.constrained_ids(single) == {1}
+        assert predicates.constrained_ids(members) == {1, 2}
+        assert predicates.constrained_ids(predicates.satisfies_all([single, members])) == {1}
+        assert predicates.constrained_ids(predicates.telemetry_predicate()) is None
+        assert predicates.constrained_ids(predicates.satisfies_any([single, members])) is None
+        assert predicates.constrained_ids(None) is None
+
     def test_event_predicates(self):
         test_string_type = StringType.construct_type("TestEventString")
         args1_def = [("name", "string", test_string_type), ("age", "int", I32Type)]
@@ -21,6 +21,22 @@ class APITestCases(unittest.TestCase):
                 Path(__file__).parent / "resources" / "simple_dictionary.json"
             )
         
+    def test_preloaded_commands(self):
+        dictionary = Path(__file__).parent / "resources" / "simple_dictionary.json"
+        commands = seqgen.loadCommands(dictionary)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_bin = Path(temp_dir) / "out_binary"
+            seqgen.generateSequence(
+                Path(__file__).parent / "input" / "simple_sequence.seq",
+                output_bin,
+                None,
+                0xffff,
+                commands=commands
+            )
+            self.assertTrue(filecmp.cmp(output_bin, Path(__file__).parent / "expected" / "simple_expected.bin"))
+        with self.assertRaisesRegex(seqgen.SeqGenException, "Can't open file"):
+            seqgen.loadCommands(Path(__file__).parent / "resources" / "missing.json")
+
     def check_sequence_generates_expected_binary(self, 
                                                  input_sequence, 
                                                  expected_binary, 
@@ -0,0 +1,110 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from fprime_gds.common.pipeline import control
+from fprime_gds.common.utils.config_manager import ConfigManager
+from fprime_gds.executables import pipeline
+from fprime_gds.executables.cli import ConfigDrivenParser, ParserBase, StandardPipelineParser
+from fprime_gds.flask import components
+
+DICTIONARY = Path(__file__).resolve().parent.parent / "common" / "fpy" / "RefTopologyDictionary.json"
+
+
+class TestStandalonePipeline(unittest.TestCase):
+    def setUp(self):
+        self.storage = tempfile.TemporaryDirectory()
+        self.shutdown = threading.Event()
+        self.thread = threading.Thread(target=pipeline.run, args=(self.parse_args(), self.shutdown))
+        self.thread.start()
+        setattr(components, "__PIPELINE", None)
+
+    def tearDown(self):
+        worker = getattr(components, "__PIPELINE")
+        if worker is not None:
+            worker.disconnect()
+        setattr(components, "__PIPELINE", None)
+        self.shutdown.set()
+        self.thread.join(10)
+        self.storage.cleanup()
+        # Loading dictionaries configures the types of the deployment
+        ConfigManager()._set_defaults()
+
+    def parse_args(self):
+        storage = Path(self.storage.name)
+        args, _ = ParserBase.parse_args(
+            [StandardPipelineParser, ConfigDrivenParser],
+            "Standalone pipeline test",
+            [
+                "--dictionary",
+                str(DICTIONARY),
+                "--file-storage-directory",
+                str(storage),
+                "--logs",
+                str(storage / "logs"),
+                "--zmq-transport",
+                f"ipc://{storage / 'server-in'}",
+                f"ipc://{storage / 'server-out'}",
+            ],
+            client=True,
+        )
+        return args
+
+    def test_control(self):
+        client = control.ControlClient(self.storage.name)
+        uplinker = client.proxy("uplinker", control.UplinkerProxy)
+        uplinker.destination_dir = "/remote"
+        assert uplinker.destination_dir == "/remote"
+        assert uplinker.current_files() == []
+        downlinker = client.proxy("downlinker", control.DownlinkerProxy)
+        assert Path(downlinker.directory) == Path(self.storage.name) / "fprime-downlink"
+        series = client.proxy("series", control.SeriesProxy)
+        assert series.ids() == []
+        assert series.decimate(1, width=10)["count"] == []
+        # Only the methods and attributes declared by the proxies are served
+        with self.assertRaises(AttributeError):
+            uplinker.exit()
+        with self.assertRaises(AttributeError):
+            client.call("uplinker", "call", "exit")
+        # Calls from other threads are served on connections of their own
+        results = []
+        thread = threading.Thread(target=lambda: results.append(uplinker.is_running()))
+        thread.start()
+        thread.join(10)
+        assert results == [uplinker.is_running()]
+
+    def test_shutdown(self):
+        client = control.ControlClient(self.storage.name, timeout=0.5)
+        assert client.proxy("series", control.SeriesProxy).ids() == []
+        self.shutdown.set()
+        self.thread.join(10)
+        assert not self.thread.is_alive()
+        assert not (Path(self.storage.name) / control.CONTROL_FILE).exists()
+        with self.assertRaises(ConnectionError):
+            client.proxy("series", control.SeriesProxy).ids()
+        with self.assertRaises(ConnectionError):
+            client.proxy("series", control.SeriesProxy).ids()
+
+    def test_standalone_components(self):
+        args = self.parse_args()
+        worker = components.setup_pipelined_components(False, args, standalone=True)
+        assert components.get_pipelined_components() is worker
+        # Workers neither decode nor log data, which the pipeline process does
+        assert args.disable_data_logging
+        assert worker.distributor not in worker.client_socket._registrants
+        uplinker, downlinker, series = components.setup_file_and_series_components(worker, args, standalone=True)
+        assert isinstance(uplinker, control.UplinkerProxy)
+        assert isinstance(downlinker, control.DownlinkerProxy)
+        assert isinstance(series, control.SeriesProxy)
+        # The uplinker and downlinker of the pipeline process are shared by all workers
+        uplinker.destination_dir = "/shared"
+        other_uplinker, other_downlinker, _ = components.setup_file_and_series_components(worker, args, True)
+        assert other_uplinker.destination_dir == "/shared"
+        assert Path(other_downlinker.directory) == Path(worker.down_store)
+        # Histories are read from the database of the pipeline process
+        assert type(worker.histories.channels).__name__ == "SharedSqliteHistory"
+
+
+if __name__ == "__main__":
+    unittest.main()
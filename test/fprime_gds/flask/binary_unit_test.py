@@ -0,0 +1,262 @@
+"""
+Tests the MessagePack encoding of the history responses served by the flask layer
+"""
+import json
+import shutil
+import struct
+import subprocess
+import unittest
+from pathlib import Path
+
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.models.serialize.numerical_types import F64Type, U32Type
+from fprime_gds.common.models.serialize.string_type import StringType
+from fprime_gds.common.models.serialize.time_type import TimeType
+from fprime_gds.common.templates.ch_template import ChTemplate
+from fprime_gds.flask import binary
+from fprime_gds.flask import json as gds_json
+
+MSGPACK_JS = Path(binary.__file__).resolve().parent / "static" / "js" / "msgpack.js"
+
+# Decodes MessagePack from standard input through msgpack.js, printing the decoded response as JSON
+NODE_DECODER = """
+import { readFileSync } from "fs";
+const source = readFileSync(process.argv[1], "utf8");
+const { decodeHistory } = await import("data:text/javascript;base64," + Buffer.from(source).toString("base64"));
+const input = readFileSync(0);
+const decoded = decodeHistory(input.buffer.slice(input.byteOffset, input.byteOffset + input.length));
+process.stdout.write(JSON.stringify(decoded, (key, value) => value instanceof Uint8Array ? Array.from(value) : value));
+"""
+
+# (fixed marker, mask) and sized markers (marker: (kind, length format)) of the reference decoder
+FIXED = ((0x80, 0x0F, "map"), (0x90, 0x0F, "array"), (0xA0, 0x1F, "str"))
+SIZED = {
+    0xC4: ("bin", ">B"),
+    0xC5: ("bin", ">H"),
+    0xC6: ("bin", ">I"),
+    0xD9: ("str", ">B"),
+    0xDA: ("str", ">H"),
+    0xDB: ("str", ">I"),
+    0xDC: ("array", ">H"),
+    0xDD: ("array", ">I"),
+    0xDE: ("map", ">H"),
+    0xDF: ("map", ">I"),
+}
+SCALARS = {
+    0xCB: ">d",
+    0xCC: ">B",
+    0xCD: ">H",
+    0xCE: ">I",
+    0xCF: ">Q",
+    0xD0: ">b",
+    0xD1: ">h",
+    0xD2: ">i",
+    0xD3: ">q",
+}
+CONSTANTS = {0xC0: None, 0xC2: False, 0xC3: True}
+
+
+def unpack(data, offset=0):
+    """Reference decoder of the MessagePack subset produced by binary.py, returning the object and the next offset"""
+    marker = data[offset]
+    offset += 1
+    if marker < 0x80:
+        return marker, offset
+    if marker >= 0xE0:
+        return marker - 0x100, offset
+    if marker in CONSTANTS:
+        return CONSTANTS[marker], offset
+    if marker in SCALARS:
+        fmt = struct.Struct(SCALARS[marker])
+        return fmt.unpack_from(data, offset)[0], offset + fmt.size
+    for fixed, mask, kind in FIXED:
+        if marker & ~mask == fixed:
+            return unpack_sized(data, offset, kind, marker & mask)
+    kind, length_format = SIZED[marker]
+    fmt = struct.Struct(length_format)
+    return unpack_sized(data, offset + fmt.size, kind, fmt.unpack_from(data, offset)[0])
+
+
+def unpack_sized(data, offset, kind, length):
+    """Decode a sized object of the reference decoder"""
+    if kind == "array":
+        array = []
+        for _ in range(length):
+            value, offset = unpack(data, offset)
+            array.append(value)
+        return array, offset
+    if kind == "map":
+        mapping = {}
+        for _ in range(length):
+            key, offset = unpack(data, offset)
+            mapping[key], offset = unpack(data, offset)
+        return mapping, offset
+    raw = bytes(data[offset : offset + length])
+    return raw.decode("utf-8") if kind == "str" else raw, offset + length
+
+
+def round_trip(obj):
+    """Pack and decode an object, checking the whole encoding is consumed"""
+    data = binary.pack(obj)
+    decoded, offset = unpack(data)
+    assert offset == len(data)
+    return decoded
+
+
+def round_trip_bytes(data):
+    """Decode a whole encoded response with the reference decoder"""
+    decoded, offset = unpack(data)
+    assert offset == len(data)
+    return decoded
+
+
+def expand_columns(columns):
+    """Expand a columnar channel history into channel objects, as msgpack.js does"""
+    ids = struct.unpack(f"<{len(columns['ids']) // 4}I", columns["ids"])
+    times = struct.unpack(f"<{len(columns['times']) // 4}I", columns["times"])
+    return [
+        {
+            "time": dict(zip(("base", "context", "seconds", "microseconds"), times[4 * index : 4 * index + 4])),
+            "id": item_id,
+            "val": columns["values"][index],
+            "display_text": columns["values"][index]
+            if columns["display_texts"][index] is None
+            else columns["display_texts"][index],
+        }
+        for index, item_id in enumerate(ids)
+    ]
+
+
+def channel(item_id, value, ch_type=U32Type, fmt=None, seconds=0):
+    """Channel reading of the given id and value"""
+    template = ChTemplate(item_id, f"Channel{item_id}", "Binary_Tester", ch_type, fmt)
+    return ChData(ch_type(value), TimeType(seconds=seconds, useconds=seconds * 7), template)
+
+
+class BinaryTestCases(unittest.TestCase):
+    def test_int_boundaries(self):
+        expected_markers = {
+            0: 0x00,
+            0x7F: 0x7F,
+            0x80: 0xCC,
+            0xFF: 0xCC,
+            0x100: 0xCD,
+            0xFFFF: 0xCD,
+            0x10000: 0xCE,
+            0xFFFFFFFF: 0xCE,
+            0x100000000: 0xCF,
+            (1 << 64) - 1: 0xCF,
+            -1: 0xFF,
+            -32: 0xE0,
+            -33: 0xD0,
+            -128: 0xD0,
+            -129: 0xD1,
+            -(1 << 15): 0xD1,
+            -(1 << 15) - 1: 0xD2,
+            -(1 << 31): 0xD2,
+            -(1 << 31) - 1: 0xD3,
+            -(1 << 63): 0xD3,
+        }
+        for value, marker in expected_markers.items():
+            assert binary.pack(value)[0] == marker, value
+            assert round_trip(value) == value
+        for value in [1 << 64, -(1 << 63) - 1]:
+            with self.assertRaises(TypeError):
+                binary.pack(value)
+
+    def test_sized_boundaries(self):
+        cases = {
+            "str": (
+                lambda length: "x" * length,
+                {0: 0xA0, 31: 0xBF, 32: 0xD9, 0xFF: 0xD9, 0x100: 0xDA, 0xFFFF: 0xDA, 0x10000: 0xDB},
+            ),
+            "bin": (
+                lambda length: b"\x01" * length,
+                {0: 0xC4, 0xFF: 0xC4, 0x100: 0xC5, 0xFFFF: 0xC5, 0x10000: 0xC6},
+            ),
+            "array": (
+                lambda length: [1] * length,
+                {0: 0x90, 15: 0x9F, 16: 0xDC, 0xFFFF: 0xDC, 0x10000: 0xDD},
+            ),
+            "map": (
+                lambda length: {str(index): index for index in range(length)},
+                {0: 0x80, 15: 0x8F, 16: 0xDE, 0xFFFF: 0xDE, 0x10000: 0xDF},
+            ),
+        }
+        for kind, (make, markers) in cases.items():
+            for length, marker in markers.items():
+                obj = make(length)
+                assert binary.pack(obj)[0] == marker, (kind, length)
+                assert round_trip(obj) == obj, (kind, length)
+        assert round_trip("été") == "été"
+
+    def test_scalars(self):
+        for value in [None, True, False, 1.5, -0.0, float("inf")]:
+            assert round_trip(value) == value
+        assert round_trip((1, "a")) == [1, "a"]
+        assert round_trip({1: "a"}) == {"1": "a"}
+        assert round_trip(TimeType(seconds=3)) == gds_json.time_type(TimeType(seconds=3))
+
+    def test_channel_columns(self):
+        items = [
+            channel(1, 7, seconds=1),
+            channel(0xFFFFFFFF, 255, fmt="{:x}", seconds=2),
+            channel(3, "text", StringType.construct_type("BinaryTestString", 10), seconds=3),
+            channel(4, 2.5, F64Type, fmt="{:.3f}", seconds=4),
+        ]
+        response = {"history": items, "error": None}
+        decoded = round_trip_bytes(binary.encode_channel_history(response))
+        assert isinstance(decoded["history"], dict)
+        assert decoded["error"] is None
+        expected = json.loads(gds_json.encode_history(response))
+        assert expand_columns(decoded["history"]) == expected["history"]
+        assert decoded["history"]["display_texts"][0] is None
+        assert decoded["history"]["display_texts"][1] == "ff"
+
+    def test_channel_row_fallback(self):
+        # Post-processed items and ids beyond the uint32 id column are encoded as rows
+        for items in [[channel(1, 7), {"id": 2, "val": 3}], [channel(1, 7), channel(1 << 32, 8)]]:
+            response = {"history": items}
+            decoded = round_trip_bytes(binary.encode_channel_history(response))
+            assert decoded == json.loads(gds_json.encode_history(response))
+
+    def test_history_fragments(self):
+        item = channel(5, 9)
+        response = {"history": [item, item], "count": 2}
+        encoded = binary.encode_history(response)
+        assert round_trip_bytes(encoded) == json.loads(gds_json.encode_history(response))
+        assert binary.FRAGMENTS.fragments.get(item) is binary.fragment(item)
+        assert not hasattr(item, "_renderings")
+
+    @unittest.skipUnless(shutil.which("node"), "node is required to run msgpack.js")
+    def test_msgpack_js(self):
+        channels = [channel(1, 7, seconds=1), channel(0xFFFFFFFF, 255, fmt="{:x}", seconds=2)]
+        responses = [
+            {"history": channels, "error": None},
+            {"history": [channel(1 << 32, 7)]},
+            {
+                "history": [],
+                "values": [0, 0x7F, 0xFF, 0xFFFF, 0xFFFFFFFF, 1 << 40, -1, -32, -33, -(1 << 15) - 1, -(1 << 40)],
+                "strings": ["x" * length for length in [0, 31, 32, 0x100, 0x10000]],
+                "arrays": [[1] * length for length in [0, 15, 16, 0x10000]],
+                "maps": [{str(index): index for index in range(length)} for length in [0, 15, 16, 0x10000]],
+                "bins": [b"\x02" * length for length in [0, 0x100, 0x10000]],
+                "scalars": [None, True, False, 1.5],
+            },
+        ]
+        for response in responses:
+            encode = binary.encode_channel_history if response["history"] else binary.encode_history
+            decoded = subprocess.run(
+                ["node", "--input-type=module", "-e", NODE_DECODER, str(MSGPACK_JS)],
+                input=encode(response),
+                capture_output=True,
+                check=True,
+            )
+            expected = json.loads(gds_json.encode_history(response)) if response["history"] else dict(response)
+            if "bins" in expected:
+                expected["bins"] = [list(value) for value in expected["bins"]]
+            assert json.loads(decoded.stdout) == expected
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests the JSON encoding of the GDS objects served by the flask layer
+"""
+import json
+import unittest
+from pathlib import Path
+
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.loaders.ch_json_loader import ChJsonLoader
+from fprime_gds.common.loaders.cmd_json_loader import CmdJsonLoader
+from fprime_gds.common.loaders.event_json_loader import EventJsonLoader
+from fprime_gds.common.models.serialize.array_type import ArrayType
+from fprime_gds.common.models.serialize.numerical_types import U16Type, U32Type
+from fprime_gds.common.models.serialize.time_type import TimeType
+from fprime_gds.common.templates.ch_template import ChTemplate
+from fprime_gds.common.utils.config_manager import ConfigManager
+from fprime_gds.flask.json import FRAGMENTS, FragmentCache, default, fragment, jsonify_base_type
+
+DICTIONARY = (
+    Path(__file__).resolve().parent.parent / "common" / "fpy" / "RefTopologyDictionary.json"
+)
+
+
+class JsonTestCases(unittest.TestCase):
+    def tearDown(self):
+        # Loading dictionaries configures the types of the deployment
+        ConfigManager()._set_defaults()
+
+    def test_base_type(self):
+        jsonable = jsonify_base_type(U32Type)
+        assert jsonable["name"] == "U32Type"
+        assert "STRUCT" not in jsonable
+        json.dumps(jsonable)
+
+    def test_array_type(self):
+        array_type = ArrayType.construct_type("JsonTestArray", U16Type, 4, "{}")
+        jsonable = jsonify_base_type(array_type)
+        assert jsonable["LENGTH"] == 4
+        assert not any("TYPECODE" in name for name in jsonable)
+        json.dumps(jsonable, default=default)
+
+    def test_dictionaries(self):
+        for loader_class in [CmdJsonLoader, ChJsonLoader, EventJsonLoader]:
+            loader = loader_class(str(DICTIONARY))
+            id_dict, _, _ = loader.construct_dicts(str(DICTIONARY))
+            encoded = json.loads(json.dumps(id_dict, default=default))
+            assert len(encoded) == len(id_dict)
+            assert "STRUCT" not in json.dumps(encoded)
+
+    def test_fragment(self):
+        template = ChTemplate(1, "Test Channel", "Json_Tester", U32Type)
+        item = ChData(U32Type(7), TimeType(), template)
+        encoded = fragment(item)
+        assert json.loads(encoded)["val"] == 7
+        assert fragment(item) is encoded
+        assert FRAGMENTS.fragments.get(item) is encoded
+        assert not hasattr(item, "_renderings")
+
+    def test_fragment_cache_bound(self):
+        cache = FragmentCache(max_size=10)
+        items = [object() for _ in range(4)]
+        for item in items[:3]:
+            cache.get(item, lambda _: "abcd")
+        assert list(cache.fragments) == items[1:3]
+        assert cache.size == 8
+        cache.get(items[1], lambda _: "wxyz")
+        cache.get(items[3], lambda _: "abcd")
+        assert list(cache.fragments) == [items[1], items[3]]
+        assert cache.get(items[1], lambda _: "wxyz") == "abcd"
+        cache.get(object(), lambda _: "a" * 11)
+        assert cache.size == 8
+        cache.clear()
+        assert cache.size == 0 and not cache.fragments
+        # Disabled caches encode every time
+        cache.max_size = 0
+        assert cache.get(items[0], lambda _: "abcd") == "abcd"
+        assert cache.size == 0 and not cache.fragments
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Tests the incremental reads of the log file endpoint
+"""
+import tempfile
+import unittest
+from pathlib import Path
+
+import flask
+import flask_restful
+
+from fprime_gds.flask.logs import LogFile, LogList
+
+
+class LogsTestCases(unittest.TestCase):
+    def setUp(self):
+        self.logdir = tempfile.TemporaryDirectory()
+        self.log = Path(self.logdir.name) / "test.log"
+        self.lines = [f"line {index:04d}\n" for index in range(100)]
+        self.log.write_text("".join(self.lines))
+        app = flask.Flask(__name__)
+        api = flask_restful.Api(app)
+        api.add_resource(LogList, "/logdata", resource_class_args=[self.logdir.name])
+        api.add_resource(LogFile, "/logdata/<name>", resource_class_args=[self.logdir.name])
+        self.client = app.test_client()
+
+    def tearDown(self):
+        self.logdir.cleanup()
+
+    def read(self, **args):
+        response = self.client.get("/logdata/test.log", query_string=args)
+        assert response.status_code == 200
+        return response.get_json()
+
+    def test_list(self):
+        assert self.client.get("/logdata").get_json() == {"logs": ["test.log"]}
+
+    def test_incremental(self):
+        size = len("".join(self.lines))
+        chunk = self.read(offset=0)
+        assert chunk == {"text": "".join(self.lines), "offset": 0, "next": size, "size": size}
+        assert self.read(offset=size)["text"] == ""
+        with open(self.log, "a") as file_handle:
+            file_handle.write("appended\n")
+        chunk = self.read(offset=size)
+        assert chunk["text"] == "appended\n"
+        assert chunk["next"] == chunk["size"] == size + 9
+
+    def test_offset_past_end(self):
+        # The log was truncated or replaced, thus it is read again from the start
+        chunk = self.read(offset=10000)
+        assert chunk["offset"] == 0
+        assert chunk["text"] == "".join(self.lines)
+
+    def test_tail_alignment(self):
+        # Tails start on a line boundary, the partial first line being skipped
+        chunk = self.read(length=25)
+        assert chunk["text"] == "".join(self.lines[-2:])
+        assert chunk["offset"] == chunk["size"] - 20
+        assert chunk["next"] == chunk["size"]
+        chunk = self.read(offset=-35)
+        assert chunk["text"] == "".join(self.lines[-3:])
+        assert chunk["offset"] == chunk["size"] - 30
+
+    def test_line_cutting(self):
+        # Full reads end on a line boundary, the partial last line being read by the next request
+        chunk = self.read(offset=0, length=25)
+        assert chunk["text"] == "".join(self.lines[:2])
+        chunk = self.read(offset=chunk["next"], length=25)
+        assert chunk["offset"] == 20
+        assert chunk["text"] == "".join(self.lines[2:4])
+        # Lines longer than the read are returned in pieces
+        assert self.read(offset=0, length=4)["text"] == "line"
+
+    def test_invalid_length(self):
+        for length in [0, -1]:
+            response = self.client.get("/logdata/test.log", query_string={"length": length})
+            assert response.status_code == 400
+
+    def test_name_collision(self):
+        # Log names are not response keys, such that a log cannot shadow the offsets
+        (Path(self.logdir.name) / "offset").write_text("text\n")
+        chunk = self.client.get("/logdata/offset", query_string={"offset": 0}).get_json()
+        assert chunk["text"] == "text\n"
+        assert chunk["offset"] == 0
+
+
+if __name__ == "__main__":
+    unittest.main()
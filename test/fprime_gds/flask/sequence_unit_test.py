@@ -0,0 +1,126 @@
+"""
+Tests the sequence compilation endpoints, served in process and through the control channel of a standalone pipeline
+"""
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import flask
+import flask_restful
+
+from fprime_gds.common.pipeline import control
+from fprime_gds.flask.sequence import SequenceCompiler, SequenceJob, SequenceJobList, SequenceJobs
+
+TOOLS = Path(__file__).resolve().parent.parent / "common" / "tools"
+DICTIONARY = TOOLS / "resources" / "simple_dictionary.json"
+SEQUENCE = (TOOLS / "input" / "simple_sequence.seq").read_text()
+BAD_SEQUENCE = (TOOLS / "input" / "simple_bad_sequence.seq").read_text()
+
+
+class RecordingUplinker:
+    """Uplinker recording the files enqueued"""
+
+    def __init__(self):
+        self.enqueued = []
+
+    def enqueue(self, filepath, destination=None):
+        self.enqueued.append((filepath, destination))
+
+
+def worker(jobs):
+    """Test client of a web worker serving the sequence endpoints from the given jobs"""
+    app = flask.Flask(__name__)
+    api = flask_restful.Api(app)
+    api.add_resource(SequenceCompiler, "/sequence", resource_class_args=[jobs])
+    api.add_resource(SequenceJobList, "/sequence/jobs", resource_class_args=[jobs])
+    api.add_resource(SequenceJob, "/sequence/jobs/<string:job_id>", resource_class_args=[jobs])
+    return app.test_client()
+
+
+def arguments(name="test.seq", text=SEQUENCE, uplink="false", key="0xfeedcafe"):
+    return {"key": key, "name": name, "text": text, "uplink": uplink}
+
+
+class SequenceTestCases(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tempdir = tempfile.TemporaryDirectory()
+        cls.uplinker = RecordingUplinker()
+        cls.jobs = SequenceJobs(str(DICTIONARY), cls.tempdir.name, cls.uplinker, "/seq", workers=1)
+        cls.server = control.ControlServer(cls.tempdir.name, {"sequences": (cls.jobs, control.SequenceJobsProxy)})
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        cls.jobs.shutdown()
+        cls.tempdir.cleanup()
+
+    def setUp(self):
+        self.client = worker(self.jobs)
+
+    def poll(self, client, job_id):
+        """Poll a job until finished"""
+        for _ in range(600):
+            response = client.get(f"/sequence/jobs/{job_id}")
+            assert response.status_code == 200
+            job = response.get_json()
+            if job["finished"] is not None:
+                return job
+            time.sleep(0.1)
+        raise AssertionError(f"Job {job_id} did not finish")
+
+    def test_compile(self):
+        response = self.client.put("/sequence", json=arguments())
+        assert response.status_code == 200, response.get_json()
+        assert "message" in response.get_json()
+
+    def test_compile_uplink(self):
+        response = self.client.put("/sequence", json=arguments(name="uplinked.seq", uplink="true"))
+        assert response.status_code == 200, response.get_json()
+        assert "Uplinking to /seq/uplinked.bin" in response.get_json()["message"]
+        filepath, destination = self.uplinker.enqueued[-1]
+        assert destination == "/seq/uplinked.bin"
+        assert Path(filepath).read_bytes()
+
+    def test_invalid(self):
+        response = self.client.put("/sequence", json=arguments(text=BAD_SEQUENCE))
+        assert response.status_code == 403
+        assert response.get_json()["message"]["type"] == "validation"
+        assert self.client.put("/sequence", json=arguments(key="0x1")).status_code == 403
+        for name in ["test.txt", "../test.seq"]:
+            assert self.client.put("/sequence", json=arguments(name=name)).status_code == 403
+
+    def test_jobs(self):
+        response = self.client.post("/sequence/jobs", json=arguments(name="job.seq"))
+        assert response.status_code == 200
+        submitted = response.get_json()
+        assert submitted["name"] == "job.seq"
+        job = self.poll(self.client, submitted["id"])
+        assert job["status"] == "succeeded"
+        listed = self.client.get("/sequence/jobs").get_json()["jobs"]
+        assert submitted["id"] in [listed_job["id"] for listed_job in listed]
+        response = self.client.post("/sequence/jobs", json=arguments(name="bad.seq", text=BAD_SEQUENCE))
+        job = self.poll(self.client, response.get_json()["id"])
+        assert job["status"] == "failed"
+        assert job["error"]["type"] == "validation"
+        assert self.client.get("/sequence/jobs/unknown").status_code == 404
+
+    def test_jobs_across_workers(self):
+        # Workers of a standalone pipeline share the jobs of the pipeline process
+        first, second = [
+            worker(control.ControlClient(self.tempdir.name).proxy("sequences", control.SequenceJobsProxy))
+            for _ in range(2)
+        ]
+        response = first.post("/sequence/jobs", json=arguments(name="shared.seq"))
+        assert response.status_code == 200
+        job = self.poll(second, response.get_json()["id"])
+        assert job["status"] == "succeeded"
+        response = second.put("/sequence", json=arguments(text=BAD_SEQUENCE))
+        assert response.status_code == 403
+        assert second.get("/sequence/jobs/unknown").status_code == 404
+
+
+if __name__ == "__main__":
+    unittest.main()
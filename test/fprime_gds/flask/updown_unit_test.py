@@ -0,0 +1,175 @@
+"""
+Tests the uploads received in chunks, resumed and verified before being enqueued into the uplinker
+"""
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import flask
+import flask_restful
+
+from fprime_gds.common.files.helpers import CFDPChecksum
+from fprime_gds.flask.updown import ChunkedUpload, ChunkedUploads, PartialUpload
+
+
+class RecordingUplinker:
+    """Uplinker recording the files enqueued"""
+
+    def __init__(self):
+        self.enqueued = []
+
+    def enqueue(self, filepath, destination=None):
+        self.enqueued.append(filepath)
+
+
+def checksum(data, offset=0):
+    """CFDP checksum of data at the given offset"""
+    value = CFDPChecksum()
+    value.update(data, offset)
+    return value.value
+
+
+class UploadTestCases(unittest.TestCase):
+    DATA = bytes(range(256)) * 40 + b"tail"
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.dest_dir = Path(self.tempdir.name)
+        self.uplinker = RecordingUplinker()
+        app = flask.Flask(__name__)
+        api = flask_restful.Api(app)
+        arguments = [self.uplinker, self.tempdir.name]
+        api.add_resource(ChunkedUploads, "/upload/chunked", resource_class_args=arguments)
+        api.add_resource(ChunkedUpload, "/upload/chunked/<string:upload_id>", resource_class_args=arguments)
+        self.client = app.test_client()
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def create(self, name="test.bin", data=DATA, with_checksum=True):
+        body = {"name": name, "size": len(data)}
+        if with_checksum:
+            body["checksum"] = checksum(data)
+        response = self.client.post("/upload/chunked", json=body)
+        assert response.status_code == 200, response.get_json()
+        upload = response.get_json()
+        assert upload["offset"] == 0
+        return upload["id"]
+
+    def put(self, upload_id, data, offset, chunk_checksum=None):
+        query = {"offset": offset}
+        if chunk_checksum is not None:
+            query["checksum"] = chunk_checksum
+        return self.client.put(f"/upload/chunked/{upload_id}", data=data, query_string=query)
+
+    def offset(self, upload_id):
+        response = self.client.get(f"/upload/chunked/{upload_id}")
+        assert response.status_code == 200
+        return response.get_json()["offset"]
+
+    def test_upload(self):
+        upload_id = self.create()
+        for offset in range(0, len(self.DATA), 4096):
+            chunk = self.DATA[offset : offset + 4096]
+            response = self.put(upload_id, chunk, offset, checksum(chunk, offset))
+            assert response.status_code == 200, response.get_json()
+        result = response.get_json()
+        assert result["file"] == "test.bin"
+        assert result["offset"] == len(self.DATA)
+        assert (self.dest_dir / "test.bin").read_bytes() == self.DATA
+        assert self.uplinker.enqueued == [str(self.dest_dir / "test.bin")]
+        # Finished uploads are forgotten
+        assert self.client.get(f"/upload/chunked/{upload_id}").status_code == 404
+        assert self.client.get("/upload/chunked").get_json() == {"uploads": []}
+        # A second upload of the same name does not replace the first
+        upload_id = self.create()
+        assert self.put(upload_id, self.DATA, 0).get_json()["file"] == "test_1.bin"
+
+    def test_offset_mismatch(self):
+        upload_id = self.create()
+        assert self.put(upload_id, self.DATA[:100], 0).status_code == 200
+        for offset in [0, 50, 200]:
+            response = self.put(upload_id, self.DATA[offset : offset + 100], offset)
+            assert response.status_code == 409
+            assert response.get_json()["upload"]["offset"] == 100
+        assert self.offset(upload_id) == 100
+
+    def test_resume_after_partial_chunk(self):
+        upload_id = self.create()
+        assert self.put(upload_id, self.DATA[:1000], 0).status_code == 200
+        # A chunk interrupted by a dropped connection leaves data past the recorded offset
+        with open(PartialUpload.directory(self.dest_dir) / f"{upload_id}.part", "ab") as file_handle:
+            file_handle.write(b"garbage")
+        offset = self.offset(upload_id)
+        assert offset == 1000
+        response = self.put(upload_id, self.DATA[offset:], offset, checksum(self.DATA[offset:], offset))
+        assert response.status_code == 200, response.get_json()
+        assert (self.dest_dir / "test.bin").read_bytes() == self.DATA
+
+    def test_chunk_checksum_mismatch(self):
+        upload_id = self.create()
+        chunk = self.DATA[:1000]
+        response = self.put(upload_id, chunk, 0, checksum(chunk) ^ 1)
+        assert response.status_code == 409
+        assert self.offset(upload_id) == 0
+        assert self.put(upload_id, chunk, 0, checksum(chunk)).status_code == 200
+        assert self.offset(upload_id) == 1000
+
+    def test_oversize_chunk(self):
+        upload_id = self.create()
+        response = self.put(upload_id, self.DATA + b"extra", 0)
+        assert response.status_code == 409
+        assert self.offset(upload_id) == 0
+        assert self.uplinker.enqueued == []
+
+    def test_file_checksum_mismatch(self):
+        upload_id = self.create(data=self.DATA[:-1] + b"x")
+        response = self.put(upload_id, self.DATA, 0)
+        assert response.status_code == 409
+        # Uploads failing verification are discarded
+        assert self.client.get(f"/upload/chunked/{upload_id}").status_code == 404
+        assert list(PartialUpload.directory(self.dest_dir).iterdir()) == []
+        assert not (self.dest_dir / "test.bin").exists()
+        assert self.uplinker.enqueued == []
+
+    def test_zero_byte_file(self):
+        upload_id = self.create(name="empty.bin", data=b"")
+        response = self.put(upload_id, b"", 0)
+        assert response.status_code == 200, response.get_json()
+        assert response.get_json()["file"] == "empty.bin"
+        assert (self.dest_dir / "empty.bin").read_bytes() == b""
+        assert self.uplinker.enqueued == [str(self.dest_dir / "empty.bin")]
+
+    def test_invalid(self):
+        response = self.client.post("/upload/chunked", json={"name": "test.bin", "size": -1})
+        assert response.status_code == 400
+        response = self.client.post("/upload/chunked", json={"name": "..", "size": 1})
+        assert response.status_code == 400
+        for upload_id in ["unknown", "0" * 32]:
+            assert self.client.get(f"/upload/chunked/{upload_id}").status_code == 404
+            assert self.put(upload_id, b"data", 0).status_code == 404
+            assert self.client.delete(f"/upload/chunked/{upload_id}").status_code == 404
+
+    def test_delete(self):
+        upload_id = self.create()
+        assert self.put(upload_id, self.DATA[:100], 0).status_code == 200
+        assert self.client.get("/upload/chunked").get_json()["uploads"][0]["id"] == upload_id
+        assert self.client.delete(f"/upload/chunked/{upload_id}").status_code == 200
+        assert self.client.get(f"/upload/chunked/{upload_id}").status_code == 404
+        assert self.put(upload_id, self.DATA[100:], 100).status_code == 404
+        assert list(PartialUpload.directory(self.dest_dir).iterdir()) == []
+
+    def test_process_locks(self):
+        # Without file locks, chunks are serialized by locks of this process, forgotten after each request
+        with mock.patch("fprime_gds.flask.updown.fcntl", None):
+            upload_id = self.create()
+            assert self.put(upload_id, self.DATA[:100], 0).status_code == 200
+            assert self.put(upload_id, self.DATA[:100], 0).status_code == 409
+            assert self.put("0" * 32, b"data", 0).status_code == 404
+            assert self.client.delete(f"/upload/chunked/{upload_id}").status_code == 200
+            assert PartialUpload._LOCKS == {}
+
+
+if __name__ == "__main__":
+    unittest.main()